@@ -3,98 +3,556 @@ from __future__ import annotations
 from pathlib import Path
 import os
 import json
-from typing import Optional
+import time
+import zlib
+import hashlib
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
+import numpy as np
 from paddleocr import PaddleOCR
 
+from disk_cache import LRUDiskCache
+from image_buffer import DecodedImage, load_image
+from ocr_items import det_scale_for
+from ocr_tiling import merge_duplicate_lines, offset_polys, tile_grid
+from process_pool import bounded_imap, worker_config
 
-def latest_file(dir_path: Path, pattern: str) -> Optional[Path]:
-    files = list(dir_path.glob(pattern))
-    if not files:
-        return None
-    return max(files, key=lambda p: p.stat().st_mtime)
 
+# -------------------------
+# OCR 엔진 풀 (모델은 프로세스당 한 번만 로드)
+# -------------------------
+# (det_limit_type, det_limit_side_len, use_textline_orientation)
+EngineKey = Tuple[str, int, bool]
 
-def run_ocr_and_save_json(
-    image_path: Path,
-    out_dir: Path,
-    det_limit_side_len: int = 4000,
-    det_limit_type: str = "max",
-) -> dict:
-    """
-    - use_doc_unwarping=False 고정
-    - det_limit_*로 검출 리사이즈를 가능한 억제(원본 큰 변보다 크게 설정 추천)
-    - 결과 JSON과 메타 저장
-    """
-    out_dir.mkdir(exist_ok=True)
+# 키별로 유지할 유휴 엔진 최대 개수(스레드 동시 사용 시 초과분은 반납 시 버림)
+OCR_POOL_SIZE = int(os.getenv("OCR_POOL_SIZE", "2"))
+
+_pool_lock = threading.Lock()
+_idle_engines: Dict[EngineKey, List[PaddleOCR]] = {}
 
-    print("CWD:", os.getcwd())
-    print("IMAGE:", image_path)
-    print("EXISTS:", image_path.exists())
 
+def engine_key(det_limit_type: str, det_limit_side_len: int, use_textline_orientation: bool) -> EngineKey:
+    return (str(det_limit_type), int(det_limit_side_len), bool(use_textline_orientation))
+
+
+def _warmup_engine(ocr: PaddleOCR) -> None:
+    """빈 흰색 이미지로 한 번 추론해 첫 요청의 초기화 비용을 미리 치름"""
+    dummy = np.full((64, 64, 3), 255, dtype=np.uint8)
+    for _ in ocr.predict(dummy):
+        pass
+
+
+def _build_engine(key: EngineKey) -> PaddleOCR:
+    det_limit_type, det_limit_side_len, use_textline_orientation = key
     ocr = PaddleOCR(
         lang="korean",
-        use_textline_orientation=True,
+        use_textline_orientation=use_textline_orientation,
         use_doc_unwarping=False,      # ✅ 요청사항: 문서 펴기(off)
         det_limit_type=det_limit_type,
         det_limit_side_len=det_limit_side_len,
     )
+    _warmup_engine(ocr)
+    return ocr
+
+
+@contextmanager
+def ocr_engine(
+    det_limit_type: str = "max",
+    det_limit_side_len: int = 4000,
+    use_textline_orientation: bool = True,
+) -> Iterator[PaddleOCR]:
+    """
+    - 같은 설정의 유휴 엔진이 있으면 재사용, 없으면 새로 로드 + 워밍업
+    - with 블록 동안은 호출자가 엔진을 독점(동시 predict 방지)
+    """
+    key = engine_key(det_limit_type, det_limit_side_len, use_textline_orientation)
+    with _pool_lock:
+        idle = _idle_engines.get(key)
+        engine = idle.pop() if idle else None
+
+    if engine is None:
+        engine = _build_engine(key)
+
+    try:
+        yield engine
+    finally:
+        with _pool_lock:
+            idle = _idle_engines.setdefault(key, [])
+            if len(idle) < OCR_POOL_SIZE:
+                idle.append(engine)
+
+
+def preload_engine(
+    det_limit_type: str = "max",
+    det_limit_side_len: int = 4000,
+    use_textline_orientation: bool = True,
+) -> None:
+    """서버/워커 시작 시 미리 로드해 두는 용도"""
+    with ocr_engine(det_limit_type, det_limit_side_len, use_textline_orientation):
+        pass
+
+
+def clear_engine_pool() -> None:
+    with _pool_lock:
+        _idle_engines.clear()
+
+
+# -------------------------
+# OCR 결과 (메모리 객체 + 선택적 JSON 저장)
+# -------------------------
+@dataclass
+class OcrResult:
+    input_image: str
+    texts: List[str]
+    scores: List[float]
+    polys: List[List[List[int]]]
+    boxes: List[List[int]]
+    det_params: Dict[str, Any] = field(default_factory=dict)
+    config: Dict[str, Any] = field(default_factory=dict)
+    # 검출 단계에서 실제로 쓴 축소 비율(검출 입력 / 원본). 좌표(polys/boxes)는 항상 원본 기준
+    det_scale: float = 1.0
+
+    def to_json(self) -> dict:
+        """PaddleOCR save_to_json()과 같은 키 → ocr_items.OcrItems.from_json()에 그대로 넣을 수 있음"""
+        return {
+            "input_path": self.input_image,
+            "coord_space": "orig",
+            "det_scale": self.det_scale,
+            "text_det_params": self.det_params,
+            "rec_texts": self.texts,
+            "rec_scores": self.scores,
+            "rec_polys": self.polys,
+            "rec_boxes": self.boxes,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict, config: Optional[dict] = None) -> "OcrResult":
+        return cls(
+            input_image=str(data.get("input_path") or ""),
+            texts=list(data.get("rec_texts") or []),
+            scores=[float(x) for x in (data.get("rec_scores") or [])],
+            polys=[[[int(v) for v in pt] for pt in poly] for poly in (data.get("rec_polys") or [])],
+            boxes=[[int(v) for v in box] for box in (data.get("rec_boxes") or [])],
+            det_params=dict(data.get("text_det_params") or {}),
+            config=dict(config or {}),
+            det_scale=float(data.get("det_scale", 1.0)),
+        )
+
 
-    results = ocr.predict(str(image_path))
+def _to_plain(v: Any) -> Any:
+    if isinstance(v, np.ndarray):
+        return v.tolist()
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, (list, tuple)):
+        return [_to_plain(x) for x in v]
+    if isinstance(v, dict):
+        return {k: _to_plain(x) for k, x in v.items()}
+    return v
 
-    got_any = False
-    json_path: Optional[Path] = None
 
-    for i, res in enumerate(results, start=1):
-        got_any = True
-        print(f"\n--- RESULT #{i} ---")
+def _paddle_res_to_dict(res: Any) -> dict:
+    # PaddleOCR 3.x: res.json == {"res": {...}} (numpy → list 변환 완료본)
+    data = getattr(res, "json", None)
+    if isinstance(data, dict):
+        return data.get("res", data)
+    return _to_plain(dict(res))
 
-        if hasattr(res, "print"):
-            res.print()
 
-        if hasattr(res, "save_to_json"):
-            res.save_to_json(str(out_dir))
-            json_path = latest_file(out_dir, "*.json")
-            break
+def ocr_config(det_limit_type: str, det_limit_side_len: int, use_textline_orientation: bool) -> dict:
+    return {
+        "use_doc_unwarping": False,
+        "use_textline_orientation": use_textline_orientation,
+        "det_limit_type": det_limit_type,
+        "det_limit_side_len": det_limit_side_len,
+    }
+
+
+# -------------------------
+# OCR 결과 캐시 (이미지 바이트 해시 + OCR 설정 → 결과)
+# -------------------------
+def ocr_cache_key(image_bytes: bytes, config: dict) -> str:
+    h = hashlib.sha256(image_bytes)
+    h.update(json.dumps(config, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()
+
+
+def open_ocr_cache(cache_dir: Path, max_mb: int = 1024) -> LRUDiskCache:
+    return LRUDiskCache(Path(cache_dir) / "ocr_cache.sqlite3", max_bytes=max_mb * 1024 * 1024)
+
+
+def _cache_get(cache: LRUDiskCache, key: str, config: dict) -> Optional[OcrResult]:
+    blob = cache.get(key)
+    if blob is None:
+        return None
+    return OcrResult.from_json(json.loads(zlib.decompress(blob)), config=config)
 
-        break
 
-    if not got_any:
+def _cache_put(cache: LRUDiskCache, key: str, result: OcrResult) -> None:
+    blob = zlib.compress(json.dumps(result.to_json(), ensure_ascii=False).encode("utf-8"))
+    cache.set(key, blob)
+
+
+def _predict_one(ocr: PaddleOCR, image: Any, **predict_kwargs: Any) -> dict:
+    # 이미지 1장 입력 → 결과도 1개
+    res = next(iter(ocr.predict(image, **predict_kwargs)), None)
+    if res is None:
         raise RuntimeError("OCR 결과 객체가 생성되지 않았습니다.")
-    if json_path is None:
-        raise RuntimeError("JSON 저장 실패: save_to_json() 지원/권한/경로를 확인하세요.")
+    return _paddle_res_to_dict(res)
+
+
+# -------------------------
+# 타일 OCR (큰 사진을 겹치는 타일로 나눠 검출/인식 후 병합)
+# -------------------------
+def _run_ocr_tiled(
+    img: np.ndarray,
+    tile_size: int,
+    tile_overlap: int,
+    tile_workers: int,
+    use_textline_orientation: bool,
+) -> OcrResult:
+    h, w = img.shape[:2]
+    tiles = tile_grid(w, h, tile_size, tile_overlap)
+
+    def ocr_tile(tile):
+        x0, y0, x1, y1 = tile
+        crop = np.ascontiguousarray(img[y0:y1, x0:x1])
+        # 타일 크기 이하로만 넣으므로 검출 리사이즈 없음, 스레드마다 풀에서 엔진을 따로 빌림
+        with ocr_engine("max", tile_size, use_textline_orientation) as ocr:
+            return tile, _predict_one(ocr, crop)
+
+    with ThreadPoolExecutor(max_workers=max(1, tile_workers)) as ex:
+        parts = list(ex.map(ocr_tile, tiles))
+
+    texts: List[str] = []
+    scores: List[float] = []
+    polys: List[np.ndarray] = []
+    boxes: List[np.ndarray] = []
+    for (x0, y0, _, _), data in parts:
+        t_texts = data.get("rec_texts") or []
+        if not t_texts:
+            continue
+        texts.extend(t_texts)
+        scores.extend(float(x) for x in (data.get("rec_scores") or []))
+        polys.extend(offset_polys(np.asarray(data.get("rec_polys"), dtype=np.int64), x0, y0))
+        boxes.extend(np.asarray(data.get("rec_boxes"), dtype=np.int64).reshape(-1, 4) + [x0, y0, x0, y0])
+
+    keep = merge_duplicate_lines(np.asarray(boxes).reshape(-1, 4), np.asarray(scores))
+
+    det_params = dict(parts[0][1].get("text_det_params") or {}) if parts else {}
+    det_params.update(tile_size=tile_size, tile_overlap=tile_overlap, tiles=len(tiles))
+    return OcrResult(
+        input_image="",
+        texts=[texts[i] for i in keep],
+        scores=[scores[i] for i in keep],
+        polys=[polys[i].tolist() for i in keep],
+        boxes=[boxes[i].tolist() for i in keep],
+        det_params=det_params,
+    )
+
+
+# -------------------------
+# 적응형 검출 해상도 (저해상도 예비 검출 → 글자 높이 추정 → 필요한 최소 해상도)
+# -------------------------
+ADAPTIVE_PREPASS_SIDE = 960   # 예비 검출 긴 변
+ADAPTIVE_MIN_TEXT_PX = 16     # 검출 입력에서 글자 줄 높이가 이 정도는 돼야 작은 글씨도 안 놓침
+ADAPTIVE_TEXT_PERCENTILE = 10 # 작은 글씨 기준(하위 10% 줄 높이)
+
+
+def choose_det_side(line_heights: np.ndarray, long_side: int, min_side: int, max_side: int) -> int:
+    """
+    - line_heights: 예비 검출로 얻은 줄 높이(원본 px)
+    - 작은 글씨 줄이 ADAPTIVE_MIN_TEXT_PX 이상이 되는 가장 작은 긴 변(32 배수)을 고름
+    - 예비 검출에서 글자를 못 찾으면 작은 글씨일 수 있으므로 max_side
+    """
+    if line_heights.size == 0:
+        return max_side
+    small_h = float(np.percentile(line_heights, ADAPTIVE_TEXT_PERCENTILE))
+    scale = min(1.0, ADAPTIVE_MIN_TEXT_PX / max(small_h, 1.0))
+    side = int(np.ceil(long_side * scale / 32.0) * 32)
+    return int(min(max(side, min_side), max_side, max(long_side, min_side)))
+
+
+def _run_ocr_adaptive(
+    image: DecodedImage,
+    max_side: int,
+    use_textline_orientation: bool,
+) -> OcrResult:
+    w, h = image.size
+    long_side = max(w, h)
+    prepass_side = min(ADAPTIVE_PREPASS_SIDE, max_side)
+
+    # 예비 검출은 축소 디코딩(JPEG draft) 이미지로: 원본 전체 디코딩 없이 글자 크기만 추정
+    small, r = image.draft_bgr(prepass_side)
+
+    # 해상도별로 엔진을 따로 만들지 않고, 같은 엔진에 predict() 인자로 검출 해상도만 바꿔 넣음
+    with ocr_engine("max", max_side, use_textline_orientation) as ocr:
+        pre = OcrResult.from_json(_predict_one(
+            ocr, small, text_det_limit_type="max", text_det_limit_side_len=prepass_side,
+        ))
+
+        boxes = np.asarray(pre.boxes, dtype=np.float64).reshape(-1, 4) / r  # 축소 좌표 → 원본
+        side = choose_det_side(boxes[:, 3] - boxes[:, 1], long_side, prepass_side, max_side)
+        if side <= prepass_side:
+            # 예비 검출 해상도로 충분 → 두 번 돌리지 않고 좌표만 원본 기준으로 되돌려 사용
+            result = pre
+            if r != 1.0:
+                result.polys = np.rint(np.asarray(pre.polys, dtype=np.float64) / r).astype(int).tolist()
+                result.boxes = np.rint(boxes).astype(int).tolist()
+            side = prepass_side
+        else:
+            result = OcrResult.from_json(_predict_one(
+                ocr, image.bgr, text_det_limit_type="max", text_det_limit_side_len=side,
+            ))
+        result.det_scale = det_scale_for(w, h, "max", side)
+
+    result.det_params["adaptive_side_len"] = side
+    return result
+
+
+def run_ocr(
+    image: Union[Path, str, DecodedImage],
+    det_limit_side_len: int = 4000,
+    det_limit_type: str = "max",
+    use_textline_orientation: bool = True,
+    cache: Optional[LRUDiskCache] = None,
+    tile_size: Optional[int] = None,
+    tile_overlap: int = 256,
+    tile_workers: int = 2,
+    adaptive: bool = False,
+) -> OcrResult:
+    """
+    - use_doc_unwarping=False 고정
+    - det_limit_*로 검출 리사이즈를 가능한 억제(원본 큰 변보다 크게 설정 추천)
+    - adaptive=True면 det_limit_side_len은 상한으로만 쓰고 해상도는 글자 크기에 맞춰 자동 선택
+    - 엔진은 ocr_engine() 풀에서 빌려 씀(호출마다 모델 재로드 X)
+    - cache가 있으면 같은 이미지+설정은 모델 없이 저장된 결과 반환
+    - tile_size를 주면 긴 변이 그보다 큰 이미지는 겹치는 타일로 나눠 처리(좌표는 원본 기준)
+    - 디스크를 거치지 않고 OcrResult로 바로 반환(실제 검출 비율은 result.det_scale)
+    - image는 경로 또는 load_image()로 만든 DecodedImage: 파일은 한 번만 읽고 디코딩도 한 번,
+      같은 DecodedImage를 렌더링(replace_english)에 넘기면 다시 디코딩하지 않음
+    """
+    image = load_image(image)
+    config = ocr_config(det_limit_type, det_limit_side_len, use_textline_orientation)
+    if tile_size:
+        config.update(tile_size=tile_size, tile_overlap=tile_overlap)
+    if adaptive:
+        config.update(adaptive=True)
+
+    key = None
+    if cache is not None:
+        key = ocr_cache_key(image.data, config)
+        cached = _cache_get(cache, key, config)
+        if cached is not None:
+            cached.input_image = image.path
+            return cached
+
+    # 경로 대신 디코딩된 배열을 넘김(PaddleOCR 내부에서 파일을 다시 읽고 디코딩하지 않도록)
+    w, h = image.size
+    if tile_size and max(w, h) > tile_size:
+        result = _run_ocr_tiled(image.bgr, tile_size, tile_overlap, tile_workers, use_textline_orientation)
+    elif adaptive:
+        result = _run_ocr_adaptive(image, det_limit_side_len, use_textline_orientation)
+    else:
+        with ocr_engine(det_limit_type, det_limit_side_len, use_textline_orientation) as ocr:
+            result = OcrResult.from_json(_predict_one(ocr, image.bgr))
+        result.det_scale = det_scale_for(w, h, det_limit_type, det_limit_side_len)
+
+    result.config = config
+    result.input_image = image.path
+
+    if cache is not None:
+        _cache_put(cache, key, result)
+    return result
+
+
+def save_ocr_result(result: OcrResult, out_dir: Path) -> dict:
+    """
+    - 결과 JSON: {stem}_res.json, 메타: {stem}_run_meta.json (경로가 입력 이름으로 결정됨)
+    - 디렉터리 스캔 없이 저장 경로를 바로 메타에 기록
+    """
+    out_dir.mkdir(exist_ok=True)
+    stem = Path(result.input_image).stem
+
+    json_path = out_dir / f"{stem}_res.json"
+    json_path.write_text(json.dumps(result.to_json(), ensure_ascii=False, indent=2), encoding="utf-8")
 
     meta = {
-        "input_image": str(image_path),
+        "input_image": result.input_image,
         "json_path": str(json_path),
         "out_dir": str(out_dir),
-        "paddleocr_config": {
-            "use_doc_unwarping": False,
-            "use_textline_orientation": True,
-            "det_limit_type": det_limit_type,
-            "det_limit_side_len": det_limit_side_len,
-        },
+        "paddleocr_config": result.config,
     }
 
-    meta_path = out_dir / f"{image_path.stem}_run_meta.json"
+    meta_path = out_dir / f"{stem}_run_meta.json"
     meta_path.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
     meta["meta_path"] = str(meta_path)
+    return meta
+
+
+def run_ocr_and_save_json(
+    image_path: Path,
+    out_dir: Path,
+    det_limit_side_len: int = 4000,
+    det_limit_type: str = "max",
+    use_textline_orientation: bool = True,
+    cache: Optional[LRUDiskCache] = None,
+) -> dict:
+    """run_ocr() + save_ocr_result() (기존 스크립트 호환용)"""
+    print("CWD:", os.getcwd())
+    print("IMAGE:", image_path)
+    print("EXISTS:", image_path.exists())
+
+    result = run_ocr(
+        image_path,
+        det_limit_side_len=det_limit_side_len,
+        det_limit_type=det_limit_type,
+        use_textline_orientation=use_textline_orientation,
+        cache=cache,
+    )
+    meta = save_ocr_result(result, out_dir)
 
     print("\n=== SAVED ===")
-    print("JSON :", json_path.name)
-    print("META :", meta_path.name)
+    print("LINES:", len(result.texts))
+    print("JSON :", Path(meta["json_path"]).name)
+    print("META :", Path(meta["meta_path"]).name)
 
     return meta
 
 
+# -------------------------
+# 배치 모드 (디렉터리/파일 목록 → 프로세스 풀)
+# -------------------------
+IMAGE_EXTS = {".jpg", ".jpeg", ".png", ".bmp", ".webp"}
+
+
+def collect_images(inputs: Iterable[Path]) -> List[Path]:
+    """파일은 그대로, 디렉터리는 하위 이미지 파일을 이름순으로 펼침"""
+    paths: List[Path] = []
+    for p in inputs:
+        p = Path(p)
+        if p.is_dir():
+            paths.extend(sorted(f for f in p.iterdir() if f.is_file() and f.suffix.lower() in IMAGE_EXTS))
+        else:
+            paths.append(p)
+    return paths
+
+
+def _init_ocr_worker(out_dir: Optional[str], cache_dir: Optional[str], ocr_kwargs: dict) -> None:
+    worker_config("ocr").update(
+        out_dir=Path(out_dir) if out_dir else None,
+        # 캐시 파일은 워커끼리 공유(SQLite WAL), 연결은 워커마다 따로
+        cache=open_ocr_cache(Path(cache_dir)) if cache_dir else None,
+        ocr_kwargs=ocr_kwargs,
+    )
+    # 워커마다 자기 모델을 한 번 로드 + 워밍업해 두고 이후 이미지를 계속 처리
+    # - run_ocr()가 실제로 빌리는 엔진 키로: 적응형은 항상 "max" + det_limit_side_len(상한)
+    use_textline_orientation = ocr_kwargs.get("use_textline_orientation", True)
+    if ocr_kwargs.get("tile_size"):
+        preload_engine("max", ocr_kwargs["tile_size"], use_textline_orientation)
+    else:
+        preload_engine(
+            "max" if ocr_kwargs.get("adaptive") else ocr_kwargs.get("det_limit_type", "max"),
+            ocr_kwargs.get("det_limit_side_len", 4000),
+            use_textline_orientation,
+        )
+
+
+def _ocr_worker_task(image_path: str) -> dict:
+    cfg = worker_config("ocr")
+    out_dir = cfg["out_dir"]
+    t0 = time.perf_counter()
+    try:
+        result = run_ocr(Path(image_path), cache=cfg["cache"], **cfg["ocr_kwargs"])
+        meta = save_ocr_result(result, out_dir) if out_dir else {"input_image": image_path}
+        meta["result"] = result
+    except Exception as e:  # 한 장 실패가 배치 전체를 멈추지 않도록 메타로 돌려줌
+        meta = {"input_image": image_path, "error": f"{type(e).__name__}: {e}"}
+    meta["elapsed_sec"] = round(time.perf_counter() - t0, 3)
+    meta["worker_pid"] = os.getpid()
+    return meta
+
+
+def run_ocr_batch(
+    image_paths: Iterable[Path],
+    out_dir: Optional[Path] = None,
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    cache_dir: Optional[Path] = None,
+    **ocr_kwargs: Any,
+) -> Iterator[dict]:
+    """
+    - workers개의 프로세스에 이미지를 나눠 OCR (프로세스마다 워밍업된 엔진 1개)
+    - 끝나는 순서대로 이미지별 메타를 yield (meta["result"]: OcrResult, 실패 시 meta["error"])
+    - out_dir를 주면 이미지별 JSON/메타도 저장
+    - cache_dir를 주면 모든 워커가 같은 OCR 결과 캐시를 공유
+    - 동시에 제출하는 작업 수를 max_in_flight로 제한해 수천 장도 메모리 일정
+    - ocr_kwargs는 run_ocr()에 그대로 전달(det_limit_*, tile_* 등)
+    """
+    paths = [str(p) for p in image_paths]
+    initargs = (
+        str(out_dir) if out_dir else None,
+        str(cache_dir) if cache_dir else None,
+        ocr_kwargs,
+    )
+
+    if max_in_flight is None:
+        max_in_flight = workers * 4
+    yield from bounded_imap(
+        _ocr_worker_task,
+        paths,
+        workers=workers,
+        max_in_flight=max_in_flight,
+        initializer=_init_ocr_worker,
+        initargs=initargs,
+    )
+
+
 if __name__ == "__main__":
     BASE_DIR = Path(__file__).resolve().parent
-    image_path = (BASE_DIR / "Upload_Images" / "image_1.jpg").resolve()
-    out_dir = (BASE_DIR / "ocr_output").resolve()
 
-    run_ocr_and_save_json(
-        image_path=image_path,
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="*", help="이미지 파일 또는 디렉터리(여러 개 가능). 생략 시 Upload_Images/image_1.jpg")
+    parser.add_argument("--out", type=str, default=str(BASE_DIR / "ocr_output"), help="결과 저장 디렉터리")
+    parser.add_argument("--workers", type=int, default=1, help="OCR 워커 프로세스 수")
+    parser.add_argument("--det-side", type=int, default=4000, help="det_limit_side_len (원본 긴 변보다 크게 잡으면 리사이즈 억제됨)")
+    parser.add_argument("--det-type", type=str, default="max", help="det_limit_type")
+    parser.add_argument("--adaptive", action="store_true", help="글자 크기에 맞춰 검출 해상도 자동 선택(--det-side는 상한)")
+    parser.add_argument("--cache-dir", type=str, default="", help="(옵션) OCR 결과 캐시 디렉터리")
+    parser.add_argument("--tile", type=int, default=0, help="(옵션) 긴 변이 이보다 큰 이미지는 타일 OCR (예: 1600)")
+    parser.add_argument("--tile-overlap", type=int, default=256, help="타일 간 겹침(px), 가장 긴 글자 줄보다 크게")
+    parser.add_argument("--tile-workers", type=int, default=2, help="이미지 1장 안에서 동시에 처리할 타일 수")
+    args = parser.parse_args()
+
+    inputs = [Path(p).resolve() for p in args.inputs] or [(BASE_DIR / "Upload_Images" / "image_1.jpg").resolve()]
+    out_dir = Path(args.out).resolve()
+    image_paths = collect_images(inputs)
+
+    t0 = time.perf_counter()
+    ok = failed = 0
+    for meta in run_ocr_batch(
+        image_paths,
         out_dir=out_dir,
-        det_limit_side_len=4000,   # 원본 긴 변보다 크게 잡으면 리사이즈 억제됨
-        det_limit_type="max",
-    )
+        workers=args.workers,
+        det_limit_side_len=args.det_side,
+        det_limit_type=args.det_type,
+        adaptive=args.adaptive,
+        cache_dir=Path(args.cache_dir).resolve() if args.cache_dir else None,
+        tile_size=args.tile or None,
+        tile_overlap=args.tile_overlap,
+        tile_workers=args.tile_workers,
+    ):
+        if "error" in meta:
+            failed += 1
+            print("[FAIL]", meta["input_image"], meta["error"])
+        else:
+            ok += 1
+            print("[OK]", meta["input_image"], f"{meta['elapsed_sec']}s")
+
+    elapsed = time.perf_counter() - t0
+    print(f"\n=== BATCH DONE === ok={ok} failed={failed} total={elapsed:.1f}s ({len(image_paths) / max(elapsed, 1e-9):.2f} img/s)")
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass, field
+import re
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+# -------------------------
+# 알레르기/식이 제한 매칭 (메뉴 줄 + 레시피 재료 → restriction_items 코드)
+# -------------------------
+# 재료 → 제한 코드(restriction_items.item_label_en). 라벨 괄호 안 예시만으로는 부족한 재료 보강
+INGREDIENT_RESTRICTIONS: Dict[str, List[str]] = {
+    "ALG_MILK": ["우유", "치즈", "버터", "생크림", "크림", "요구르트", "요거트", "분유", "연유", "모짜렐라"],
+    "ALG_EGGS": ["달걀", "계란", "메추리알", "마요네즈", "지단", "노른자", "흰자"],
+    "ALG_SOY": ["대두", "콩", "두부", "간장", "진간장", "국간장", "된장", "고추장", "쌈장", "두유", "콩나물", "콩국수", "콩국", "유부", "청국장", "콩기름"],
+    "ALG_PEANUTS": ["땅콩", "땅콩버터"],
+    "ALG_TREE_NUTS": ["아몬드", "호두", "캐슈넛", "잣", "피스타치오", "피칸", "헤이즐넛", "마카다미아"],
+    "ALG_CEREALS_GLUTEN": [
+        "밀", "밀가루", "보리", "호밀", "부침가루", "튀김가루", "빵가루", "빵", "면", "국수", "칼국수",
+        "수제비", "만두", "라면", "우동", "짜장", "짬뽕", "간장", "고추장", "맥주",
+    ],
+    "ALG_FISH": [
+        "생선", "고등어", "갈치", "꽁치", "멸치", "연어", "참치", "명태", "북어", "동태", "황태", "코다리",
+        "대구", "조기", "굴비", "삼치", "가자미", "장어", "광어", "농어", "우럭", "도미", "방어", "숭어", "전어", "민어", "회", "액젓", "멸치액젓", "까나리액젓", "어묵", "명란", "북어포",
+    ],
+    "ALG_CRUSTACEANS": ["새우", "게", "꽃게", "대게", "게장", "간장게장", "게살", "랍스터", "가재", "새우젓", "크랩"],
+    "ALG_MOLLUSCS": [
+        "오징어", "문어", "낙지", "주꾸미", "쭈꾸미", "조개", "굴", "굴국밥", "굴전", "굴소스", "홍합", "전복",
+        "바지락", "꼬막", "관자", "소라", "가리비",
+    ],
+    "ALG_SESAME": ["참깨", "깨", "통깨", "깨소금", "참기름"],
+    "ALG_MUSTARD": ["겨자", "머스터드", "연겨자"],
+    "ALG_CELERY": ["셀러리"],
+    "ALG_SULPHITES": ["와인", "건과일", "식초", "곶감", "건포도"],
+    "ALG_LUPIN": ["루핀", "루핀콩"],
+}
+
+_MEAT = [
+    "고기", "소고기", "쇠고기", "돼지고기", "닭고기", "닭", "닭갈비", "찜닭", "삼계탕", "치킨", "오리", "양고기",
+    "갈비", "불고기", "삼겹살", "목살", "베이컨", "햄", "소시지", "차돌", "양지", "사태", "곱창", "막창", "순대",
+    "족발", "보쌈", "육회", "육수", "사골", "돈가스", "제육",
+]
+_PORK = ["돼지", "돼지고기", "삼겹살", "목살", "베이컨", "햄", "소시지", "순대", "족발", "보쌈", "제육", "돈가스", "돼지국밥"]
+_ALCOHOL = ["술", "청주", "맛술", "미림", "소주", "맥주", "와인", "막걸리", "정종"]
+
+DIET_RESTRICTIONS: Dict[str, List[str]] = {
+    "DIET_VEGETARIAN": _MEAT + INGREDIENT_RESTRICTIONS["ALG_FISH"] + INGREDIENT_RESTRICTIONS["ALG_CRUSTACEANS"]
+    + INGREDIENT_RESTRICTIONS["ALG_MOLLUSCS"],
+    "DIET_VEGAN": _MEAT + INGREDIENT_RESTRICTIONS["ALG_FISH"] + INGREDIENT_RESTRICTIONS["ALG_CRUSTACEANS"]
+    + INGREDIENT_RESTRICTIONS["ALG_MOLLUSCS"] + INGREDIENT_RESTRICTIONS["ALG_MILK"]
+    + INGREDIENT_RESTRICTIONS["ALG_EGGS"] + ["꿀", "젤라틴"],
+    "DIET_HALAL": _PORK + _ALCOHOL,
+}
+
+# 한 글자 용어가 들어 있지만 그 재료가 아닌 것으로 확인된 단어 → 이 단어 안의 한 글자 매칭만 무시
+# - 한 글자 용어는 단어 안에서도 인정(닭강정/냉면/물회/콩밥...), 놓치는 것보다 잘못 경고하는 쪽이 안전
+# - 오탐이 확인되면 여기에 추가(두 글자 이상 용어는 영향 없음: 땅콩 → ALG_PEANUTS는 그대로)
+FALSE_POSITIVE_WORDS: List[str] = [
+    "땅콩", "홍콩",                                  # 콩(ALG_SOY)
+    "비밀", "밀크",                                  # 밀
+    "면역", "면세", "면포", "면보", "면실유",            # 면
+    "회원", "회식", "회사", "회색", "회차", "회오리", "회향",  # 회
+    "굴비", "굴림",                                  # 굴
+    "가게", "게임", "무게", "맵게", "짜게", "달게", "싱겁게", "맛있게", "크게", "작게", "싸게", "게시",  # 게
+    "깨끗",                                         # 깨
+    "기술", "예술", "미술", "수술",                    # 술
+    "꿀맛",                                         # 꿀
+]
+
+
+def _norm(s: str) -> str:
+    # 한글/공백만 남김: keep_korean_only와 달리 다른 글자는 지우지 않고 공백으로 바꿔 단어를 붙이지 않음
+    s = re.sub(r"[^가-힣\s]", " ", s or "")
+    return re.sub(r"\s+", " ", s).strip()
+
+
+# -------------------------
+# 1) Aho–Corasick 오토마톤 (모든 용어를 한 번의 스캔으로)
+# -------------------------
+class AhoCorasick:
+    """
+    - 용어 수와 무관하게 글자마다 상태 전이 1번 → 줄 길이에 비례하는 시간
+    - goto: 상태별 {글자: 다음 상태}, fail: 실패 링크, out: 상태에서 끝나는 용어 id (fail 쪽 출력까지 합쳐 둠)
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.out: List[List[int]] = [[]]
+
+        for pat in patterns:
+            node = 0
+            for ch in pat:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = nxt
+            self.out[node].append(len(self.patterns))
+            self.patterns.append(pat)
+
+        # BFS로 실패 링크 계산
+        q = deque(self.goto[0].values())
+        while q:
+            node = q.popleft()
+            for ch, nxt in self.goto[node].items():
+                q.append(nxt)
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(시작 위치, 용어 id)"""
+        node = 0
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                yield i + 1 - len(patterns[pid]), pid
+
+
+# -------------------------
+# 2) 제한 항목 매처
+# -------------------------
+@dataclass
+class LineFlags:
+    index: int
+    text: str
+    # 제한 코드 → 근거 용어(메뉴 이름에서 직접 / 레시피 재료에서)
+    restrictions: Dict[str, List[str]] = field(default_factory=dict)
+    recipe: Optional[str] = None
+
+    def add(self, code: str, term: str) -> None:
+        terms = self.restrictions.setdefault(code, [])
+        if term not in terms:
+            terms.append(term)
+
+
+RecipeLookup = Callable[[str], Optional[Tuple[str, List[str]]]]  # 메뉴 이름 → (레시피 제목, 재료 목록)
+
+
+class AllergenMatcher:
+    """
+    - 용어 → 제한 코드 집합을 Aho–Corasick 하나로 컴파일
+    - 한 글자 용어(콩/깨/굴/게/면/닭/술...)도 단어 안에서 인정, FALSE_POSITIVE_WORDS 안에 걸린 경우만 제외
+    - 레시피 조회는 주입(없으면 메뉴 이름만 스캔, backend는 recipe_index.RecipeIndex.lookup 사용)
+    """
+
+    def __init__(
+        self,
+        term_codes: Dict[str, Set[str]],
+        recipe_lookup: Optional[RecipeLookup] = None,
+        false_positive_words: Iterable[str] = FALSE_POSITIVE_WORDS,
+    ):
+        self.term_codes = {t: set(c) for t, c in term_codes.items() if t}
+        self.automaton = AhoCorasick(self.term_codes)
+        self.shield = AhoCorasick(w for w in dict.fromkeys(_norm(w).replace(" ", "") for w in false_positive_words) if w)
+        self.recipe_lookup = recipe_lookup
+
+    def scan(self, text: str) -> List[Tuple[str, str]]:
+        """
+        - 정리된 텍스트 → [(제한 코드, 용어)]
+        - 용어는 공백 없이 컴파일돼 있으므로 텍스트도 공백을 빼고 스캔('돼지 고기' 메뉴 ↔ '돼지고기' 용어)
+        - shielded: 오탐 단어가 덮는 글자 위치, 그 위치의 한 글자 용어만 버림
+        """
+        s = _norm(text).replace(" ", "")
+        shielded = bytearray(len(s))
+        for start, pid in self.shield.iter_matches(s):
+            n = len(self.shield.patterns[pid])
+            shielded[start:start + n] = b"\x01" * n
+        found: List[Tuple[str, str]] = []
+        pats = self.automaton.patterns
+        for start, pid in self.automaton.iter_matches(s):
+            term = pats[pid]
+            if len(term) == 1 and shielded[start]:
+                continue
+            for code in self.term_codes[term]:
+                found.append((code, term))
+        return found
+
+    def analyze_line(self, index: int, text: str) -> LineFlags:
+        flags = LineFlags(index=index, text=text)
+        for code, term in self.scan(text):
+            flags.add(code, term)
+        if self.recipe_lookup is not None and _norm(text):
+            hit = self.recipe_lookup(text)
+            if hit is not None:
+                flags.recipe, ingredients = hit
+                # 재료는 하나씩 스캔(공백을 빼고 스캔하므로 이어 붙이면 재료 경계를 넘는 용어가 생김)
+                for ing in ingredients:
+                    for code, term in self.scan(ing):
+                        flags.add(code, term)
+        return flags
+
+
+# -------------------------
+# 3) 용어 소스
+# -------------------------
+def restriction_terms(rows: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    - restriction_items의 (item_label_ko, item_label_en) → (용어, 코드)
+    - '견과류(아몬드, 호두, 캐슈넛)' → 견과류/아몬드/호두/캐슈넛, '밀/글루텐(...)' → 밀/글루텐/...
+    - 식이 항목(비건/할랄 등)은 라벨 자체가 재료가 아니므로 제외(재료 목록은 DIET_RESTRICTIONS)
+    """
+    out = []
+    for label_ko, code in rows:
+        if not code or code.startswith("DIET_"):
+            continue
+        head, _, rest = (label_ko or "").partition("(")
+        terms = head.split("/") + rest.rstrip(")").split(",")
+        for t in terms:
+            t = _norm(t)
+            if t:
+                out.append((t, code))
+    return out
+
+
+def build_matcher(
+    restriction_rows: Iterable[Tuple[str, str]] = (),
+    recipe_lookup: Optional[RecipeLookup] = None,
+) -> AllergenMatcher:
+    term_codes: Dict[str, Set[str]] = {}
+    pairs = restriction_terms(restriction_rows)
+    for mapping in (INGREDIENT_RESTRICTIONS, DIET_RESTRICTIONS):
+        for code, terms in mapping.items():
+            pairs.extend((t, code) for t in terms)
+    for term, code in pairs:
+        term_codes.setdefault(_norm(term).replace(" ", ""), set()).add(code)
+    return AllergenMatcher(term_codes, recipe_lookup=recipe_lookup)
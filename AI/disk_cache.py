@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+
+# -------------------------
+# SQLite 기반 LRU 디스크 캐시 (여러 프로세스가 같은 파일을 공유 가능)
+# -------------------------
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    key         TEXT PRIMARY KEY,
+    value       BLOB NOT NULL,
+    size        INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_last_access ON cache(last_access);
+
+-- 전체 크기/개수를 트리거로 유지 → 매 저장마다 SUM() 스캔 불필요
+CREATE TABLE IF NOT EXISTS cache_totals (
+    id          INTEGER PRIMARY KEY CHECK (id = 1),
+    total_bytes INTEGER NOT NULL,
+    entries     INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO cache_totals (id, total_bytes, entries) VALUES (1, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS trg_cache_insert AFTER INSERT ON cache BEGIN
+    UPDATE cache_totals SET total_bytes = total_bytes + NEW.size, entries = entries + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_cache_delete AFTER DELETE ON cache BEGIN
+    UPDATE cache_totals SET total_bytes = total_bytes - OLD.size, entries = entries - 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS trg_cache_update AFTER UPDATE OF size ON cache BEGIN
+    UPDATE cache_totals SET total_bytes = total_bytes + NEW.size - OLD.size WHERE id = 1;
+END;
+"""
+
+
+class LRUDiskCache:
+    """
+    - key(str) → value(bytes)
+    - max_bytes / max_entries 초과 시 가장 오래 안 쓴 항목부터 삭제
+    - hits/misses는 이 프로세스 기준 카운터
+    """
+
+    def __init__(self, path: Path, max_bytes: int = 512 * 1024 * 1024, max_entries: Optional[int] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE cache SET last_access = ? WHERE key = ?", (time.time(), key))
+            self.hits += 1
+            return bytes(row[0])
+
+    def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """여러 키를 한 번에 조회(없는 키는 결과에서 빠짐)"""
+        found: Dict[str, bytes] = {}
+        if not keys:
+            return found
+        now = time.time()
+        with self._lock:
+            # SQLite 변수 개수 제한(기본 999)을 넘지 않도록 나눠서 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, value FROM cache WHERE key IN ({marks})", chunk).fetchall()
+                for k, v in rows:
+                    found[k] = bytes(v)
+                if rows:
+                    self._conn.executemany(
+                        "UPDATE cache SET last_access = ? WHERE key = ?",
+                        [(now, k) for k, _ in rows],
+                    )
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: Dict[str, bytes]) -> None:
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO cache (key, value, size, last_access) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET value = excluded.value, size = excluded.size, "
+                    "last_access = excluded.last_access",
+                    [(k, sqlite3.Binary(v), len(v), now) for k, v in items.items()],
+                )
+                self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _evict(self) -> None:
+        total_bytes, entries = self._conn.execute(
+            "SELECT total_bytes, entries FROM cache_totals WHERE id = 1"
+        ).fetchone()
+        while entries > 0 and (
+            total_bytes > self.max_bytes
+            or (self.max_entries is not None and entries > self.max_entries)
+        ):
+            # 한 행씩 지우면 느리므로 오래된 순으로 5%씩 묶어서 삭제
+            n = max(1, entries // 20)
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY last_access ASC LIMIT ?)",
+                (n,),
+            )
+            total_bytes, entries = self._conn.execute(
+                "SELECT total_bytes, entries FROM cache_totals WHERE id = 1"
+            ).fetchone()
+
+    def stats(self) -> dict:
+        with self._lock:
+            total_bytes, entries = self._conn.execute(
+                "SELECT total_bytes, entries FROM cache_totals WHERE id = 1"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": total_bytes,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
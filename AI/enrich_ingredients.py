@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+import argparse
+import json
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from glossary import get_glossary
+from process_pool import bounded_imap, worker_config
+from replace_english import TranslationMemory, get_translator, keep_korean_only, translate_batch
+
+
+# -------------------------
+# 레시피 코퍼스 ingredients_en 일괄 채우기 (오프라인 작업)
+# - 재료 이름은 레시피마다 반복(소금, 참기름, 진간장 ...) → 코퍼스 전체에서 중복 제거 후 한 번씩만 번역
+# - 번역 키는 메뉴 번역과 같은 keep_korean_only() 결과 → 번역 메모리(TranslationMemory) 항목을 서로 재사용
+# - 번역 결과는 체크포인트(JSONL)에 배치마다 이어 쓰기 → 중간에 끊겨도 다시 실행하면 남은 것만 번역
+# - 마지막에 레시피 JSON에 ingredients_en을 채워 다시 씀(recipe_kb/glossary는 JSON이 바뀌면 알아서 다시 빌드)
+# -------------------------
+BASE_DIR = Path(__file__).resolve().parent
+RECIPES_PATH = BASE_DIR / "korean_food_recipes.json"
+CHECKPOINT_PATH = BASE_DIR / "cache" / "ingredients_en.ckpt.jsonl"
+
+
+def collect_vocabulary(recipes: Iterable[dict]) -> List[str]:
+    """keep_korean_only()로 정리한 재료 이름, 많이 나오는 순(일찍 끊겨도 자주 쓰는 재료부터 채워짐)"""
+    counts = Counter(keep_korean_only(x) for r in recipes for x in (r.get("ingredients_ko") or []))
+    counts.pop("", None)
+    return [ko for ko, _ in counts.most_common()]
+
+
+def load_checkpoint(path: Path) -> Dict[str, str]:
+    """이미 번역한 {재료: 번역}, 마지막 줄이 쓰다 끊긴 경우는 무시하고 파일에서도 잘라냄(이어 쓰기가 붙지 않도록)"""
+    done: Dict[str, str] = {}
+    if not path.exists():
+        return done
+    valid = 0
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                row = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                break
+            if not line.endswith(b"\n"):
+                break
+            done[row["ko"]] = row["en"]
+            valid += len(line)
+    if valid < path.stat().st_size:
+        os.truncate(path, valid)
+    return done
+
+
+def append_checkpoint(f, pairs: Dict[str, str]) -> None:
+    for ko, en in pairs.items():
+        f.write(json.dumps({"ko": ko, "en": en}, ensure_ascii=False) + "\n")
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def apply_translations(recipes: List[dict], mapping: Dict[str, str]) -> int:
+    """
+    - 재료가 모두 번역된 레시피만 ingredients_en을 같은 길이로 채움, 채운 레시피 수 반환
+    - 한글이 없는 재료(숫자/영문 등)는 그대로, 빈 재료는 빈 문자열
+    """
+    n = 0
+    for r in recipes:
+        ko_list = r.get("ingredients_ko") or []
+        en_list = [mapping.get(keep_korean_only(x), "") if keep_korean_only(x) else x.strip() for x in ko_list]
+        if ko_list and all(en or not ko.strip() for ko, en in zip(ko_list, en_list)):
+            r["ingredients_en"] = en_list
+            n += 1
+    return n
+
+
+def write_recipes(recipes: List[dict], path: Path) -> None:
+    # 임시 파일에 쓰고 rename → 쓰는 도중 끊겨도 원본 JSON은 그대로
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(recipes, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# -------------------------
+# 번역 워커 (프로세스마다 번역 모델 1개)
+# -------------------------
+def _init_translate_worker(batch_size: int) -> None:
+    worker_config("translate").update(batch_size=batch_size, translator=get_translator("en"))
+
+
+def _translate_task(chunk: List[str]) -> Dict[str, str]:
+    # 사전/번역 메모리는 메인 프로세스에서 먼저 거름 → 워커는 번역 모델만
+    cfg = worker_config("translate")
+    return translate_batch(chunk, translator=cfg["translator"], batch_size=cfg["batch_size"], max_length=64)
+
+
+def translate_vocabulary(
+    terms: List[str],
+    workers: int = 1,
+    chunk_size: int = 256,
+    batch_size: int = 32,
+) -> Iterator[Dict[str, str]]:
+    """
+    - chunk_size개씩 나눠 번역 모델로 번역, 끝나는 순서대로 {재료: 번역} yield
+    - workers > 1이면 spawn 프로세스 풀(프로세스마다 모델 로드), 동시에 제출하는 묶음은 workers * 2개까지
+    """
+    chunks = [terms[i:i + chunk_size] for i in range(0, len(terms), chunk_size)]
+    yield from bounded_imap(
+        _translate_task,
+        chunks,
+        workers=workers,
+        max_in_flight=workers * 2,
+        initializer=_init_translate_worker,
+        initargs=(batch_size,),
+    )
+
+
+def enrich_recipes(
+    recipes_path: Path = RECIPES_PATH,
+    out_path: Optional[Path] = None,
+    checkpoint_path: Path = CHECKPOINT_PATH,
+    workers: int = 1,
+    chunk_size: int = 256,
+    batch_size: int = 32,
+    use_glossary: bool = True,
+    memory: Optional[TranslationMemory] = None,
+) -> dict:
+    """
+    - 체크포인트 → 음식 용어 사전 → (옵션) 번역 메모리 → 번역 모델 순으로 채우고, 모델 번역만 번역 메모리에도 저장(메뉴 번역과 공유)
+    - 반환: 통계(재료 수, 새로 번역한 수, 초당 처리량 등)
+    """
+    recipes_path = Path(recipes_path)
+    out_path = Path(out_path) if out_path else recipes_path
+    checkpoint_path = Path(checkpoint_path)
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+    recipes = json.loads(recipes_path.read_text(encoding="utf-8"))
+    vocab = collect_vocabulary(recipes)
+    done = load_checkpoint(checkpoint_path)
+    todo = [ko for ko in vocab if ko not in done]
+    print(f"[enrich] recipes={len(recipes)} vocabulary={len(vocab)} checkpoint={len(done)} todo={len(todo)}")
+
+    with open(checkpoint_path, "a", encoding="utf-8") as ckpt:
+        # translate_batch와 같은 순서: 음식 용어 사전 → 번역 메모리 → 모델
+        if use_glossary and todo:
+            hits = get_glossary().lookup_many(todo)
+            append_checkpoint(ckpt, hits)
+            done.update(hits)
+            todo = [ko for ko in todo if ko not in hits]
+            print(f"[enrich] glossary hits={len(hits)} todo={len(todo)}")
+
+        if memory is not None and todo:
+            cached = memory.lookup(todo)
+            append_checkpoint(ckpt, cached)
+            done.update(cached)
+            todo = [ko for ko in todo if ko not in cached]
+            print(f"[enrich] translation memory hits={len(cached)} todo={len(todo)}")
+
+        t0 = time.perf_counter()
+        n = 0
+        for pairs in translate_vocabulary(todo, workers, chunk_size, batch_size):
+            append_checkpoint(ckpt, pairs)
+            if memory is not None:
+                memory.save(pairs)  # 모델 번역만(사전 번역은 저장 X → 사전이 바뀌어도 메모리가 낡지 않음)
+            done.update(pairs)
+            n += len(pairs)
+            elapsed = time.perf_counter() - t0
+            rate = n / elapsed if elapsed > 0 else 0.0
+            eta = (len(todo) - n) / rate if rate > 0 else 0.0
+            print(f"[enrich] {n}/{len(todo)} terms  {rate:.1f} terms/s  eta {eta:.0f}s")
+        elapsed = time.perf_counter() - t0
+
+    filled = apply_translations(recipes, done)
+    write_recipes(recipes, out_path)
+    stats = {
+        "recipes": len(recipes),
+        "recipes_filled": filled,
+        "vocabulary": len(vocab),
+        "translated": n,
+        "elapsed_sec": round(elapsed, 2),
+        "terms_per_sec": round(n / elapsed, 1) if elapsed > 0 else 0.0,
+    }
+    print(f"[enrich] wrote {out_path}: {json.dumps(stats)}")
+    return stats
+
+
+# -------------------------
+# 실행
+# -------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipes", type=str, default=str(RECIPES_PATH), help="레시피 JSON")
+    parser.add_argument("--out", type=str, default="", help="(옵션) 결과 JSON (기본: --recipes 덮어쓰기)")
+    parser.add_argument("--checkpoint", type=str, default=str(CHECKPOINT_PATH), help="진행 체크포인트(JSONL)")
+    parser.add_argument("--workers", type=int, default=1, help="번역 워커 프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=256, help="체크포인트 단위(재료 수)")
+    parser.add_argument("--batch-size", type=int, default=32, help="모델 배치 크기")
+    parser.add_argument("--tm", type=str, default=str(BASE_DIR / "cache" / "translation_memory.sqlite3"), help="번역 메모리 SQLite 경로")
+    parser.add_argument("--no-tm", action="store_true", help="번역 메모리 사용 안 함")
+    parser.add_argument("--no-glossary", action="store_true", help="음식 용어 사전 없이 전부 번역 모델 사용")
+    args = parser.parse_args()
+
+    enrich_recipes(
+        recipes_path=Path(args.recipes).resolve(),
+        out_path=Path(args.out).resolve() if args.out else None,
+        checkpoint_path=Path(args.checkpoint).resolve(),
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        batch_size=args.batch_size,
+        use_glossary=not args.no_glossary,
+        memory=None if args.no_tm else TranslationMemory(Path(args.tm).resolve()),
+    )
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from pathlib import Path
+import json
+import re
+import threading
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# -------------------------
+# 음식 용어 사전 (번역 모델 앞단: 아는 요리/재료 이름은 사전으로 바로 번역)
+# -------------------------
+BASE_DIR = Path(__file__).resolve().parent
+SEED_GLOSSARY_PATH = BASE_DIR / "food_glossary.json"
+RECIPES_PATH = BASE_DIR / "korean_food_recipes.json"
+
+_END = ""  # trie에서 단어 끝 표시 키
+
+# 한국어는 조리법이 뒤(명란구이), 영어는 앞(Grilled Pollock Roe)
+_METHOD_WORDS = {"Grilled", "Stir-fried", "Braised", "Steamed", "Seasoned"}
+
+# 국물 요리 머리말: 감자탕(뼈해장국), 부대찌개처럼 재료 조각 + 머리말로 조합하면 틀리는 고유 요리명이 많음 → 분해 번역 X
+_DISH_HEADS = ("찌개", "전골", "탕", "국")
+
+
+def _norm(s: str) -> str:
+    # replace_english.keep_korean_only와 같은 규칙(한글/공백만)
+    s = re.sub(r"[^가-힣\s]", "", s or "")
+    return re.sub(r"\s+", " ", s).strip()
+
+
+class Glossary:
+    """
+    - exact: 정리된 한글 → 영어 (통째로 일치)
+    - trie: 공백 없는 용어의 글자 trie (복합어 분해용 접두 검색)
+    """
+
+    def __init__(self):
+        self.exact: Dict[str, str] = {}
+        self.trie: dict = {}
+        self.dishes: Set[str] = set()  # 번역은 모르지만 요리 이름인 단어(레시피 제목) → 분해하지 않고 번역 모델로
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def add(self, ko: str, en: str) -> None:
+        ko = _norm(ko)
+        en = (en or "").strip()
+        if not ko or not en:
+            return
+        self.exact[ko] = en
+
+        key = ko.replace(" ", "")
+        node = self.trie
+        for ch in key:
+            node = node.setdefault(ch, {})
+        node[_END] = en
+
+    def update(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        for ko, en in pairs:
+            self.add(ko, en)
+
+    def add_dishes(self, names: Iterable[str]) -> None:
+        self.dishes.update(_norm(x).replace(" ", "") for x in names if _norm(x))
+
+    def _prefixes(self, s: str, start: int) -> List[Tuple[int, str]]:
+        """s[start:]의 접두어 중 사전에 있는 것들 (끝 위치, 번역)"""
+        found = []
+        node = self.trie
+        for i in range(start, len(s)):
+            node = node.get(s[i])
+            if node is None:
+                break
+            if _END in node:
+                found.append((i + 1, node[_END]))
+        return found
+
+    def _segment(self, token: str) -> Optional[List[Tuple[str, str]]]:
+        """
+        - 띄어쓰기 없는 복합어를 사전 용어로 빈틈없이 나눔(조각 수 최소), 반환: [(한글 조각, 번역)]
+        - 한 글자 용어(국/밥/탕/전...)는 잘못 쪼개지기 쉬워 맨 끝 조각일 때만 허용
+        """
+        n = len(token)
+        best: List[Optional[List[Tuple[str, str]]]] = [None] * (n + 1)
+        best[0] = []
+        for i in range(n):
+            if best[i] is None:
+                continue
+            for j, en in self._prefixes(token, i):
+                if j - i == 1 and j != n:
+                    continue
+                cand = best[i] + [(token[i:j], en)]
+                if best[j] is None or len(cand) < len(best[j]):
+                    best[j] = cand
+        return best[n]
+
+    def _compose(self, token: str) -> Optional[List[str]]:
+        """
+        - 사전에 통째로 없는 단어를 조각 번역으로 조합, 조합이 믿을 만하지 않으면 None(번역 모델로)
+        - 레시피 제목에 나온 요리 이름이거나, 국물 요리 머리말(탕/국/찌개/전골)로 끝나면 조합하지 않음
+        """
+        if token in self.dishes:
+            return None
+        seg = self._segment(token)
+        if seg is None:
+            return None
+        if len(seg) > 1 and seg[-1][0] in _DISH_HEADS:
+            return None
+        parts = [en for _, en in seg]
+        if len(parts) > 1 and parts[-1] in _METHOD_WORDS:
+            parts = [parts[-1]] + parts[:-1]
+        return parts
+
+    def lookup(self, ko: str) -> Optional[str]:
+        """
+        - 1) 줄 전체(띄어쓰기 유무 모두) 일치
+        - 2) 단어마다 일치 또는 복합어 조합(_compose)이 모두 성공하면 이어 붙임
+        - 모르는 단어/조합하면 안 되는 요리 이름이 하나라도 있으면 None → 번역 모델로
+        """
+        ko = _norm(ko)
+        if not ko:
+            return None
+        hit = self.exact.get(ko) or self.exact.get(ko.replace(" ", ""))
+        if hit:
+            return hit
+
+        parts: List[str] = []
+        for tok in ko.split(" "):
+            en = self.exact.get(tok)
+            if en:
+                parts.append(en)
+                continue
+            seg = self._compose(tok)
+            if seg is None:
+                return None
+            parts.extend(seg)
+        return " ".join(parts)
+
+    def lookup_many(self, kos: Iterable[str]) -> Dict[str, str]:
+        out: Dict[str, str] = {}
+        for ko in kos:
+            en = self.lookup(ko)
+            if en:
+                out[ko] = en
+        return out
+
+
+# -------------------------
+# 사전 소스
+# -------------------------
+def seed_pairs(path: Path = SEED_GLOSSARY_PATH) -> List[Tuple[str, str]]:
+    if not path.exists():
+        return []
+    return list(json.loads(path.read_text(encoding="utf-8")).items())
+
+
+def recipe_pairs(path: Path = RECIPES_PATH) -> List[Tuple[str, str]]:
+    """ingredients_ko / ingredients_en 길이가 같은(번역이 채워진) 레시피만 사용"""
+    if not path.exists():
+        return []
+    pairs = []
+    for r in json.loads(path.read_text(encoding="utf-8")):
+        ko_list = r.get("ingredients_ko") or []
+        en_list = r.get("ingredients_en") or []
+        if ko_list and len(ko_list) == len(en_list):
+            pairs.extend(zip(ko_list, en_list))
+    return pairs
+
+
+def recipe_dish_names(path: Path = RECIPES_PATH) -> List[str]:
+    """레시피 제목에서 국물 요리 머리말로 끝나는 단어(애호박찌개, 감자탕 ...) - 고유 요리명으로 보고 분해 번역 X"""
+    if not path.exists():
+        return []
+    names = set()
+    for r in json.loads(path.read_text(encoding="utf-8")):
+        for tok in _norm(r.get("ko") or "").split(" "):
+            if any(tok.endswith(h) and len(tok) > len(h) for h in _DISH_HEADS):
+                names.add(tok)
+    return sorted(names)
+
+
+# 제한 항목 카탈로그 용어의 영어 표기 - item_label_en은 코드(ALG_CEREALS_GLUTEN)라 그대로 쓰면 'Cereals Gluten'이 됨
+# - 여기 없는 용어는 사전에 넣지 않고 번역 모델에 맡김(사전이 모델/메모리보다 먼저라 틀린 표기가 덮어씀)
+CATALOG_TERMS_EN: Dict[str, str] = {
+    "우유": "Milk",
+    "달걀": "Egg",
+    "계란": "Egg",
+    "대두": "Soybean",
+    "땅콩": "Peanut",
+    "견과류": "Tree Nuts",
+    "아몬드": "Almond",
+    "호두": "Walnut",
+    "캐슈넛": "Cashew",
+    "밀": "Wheat",
+    "글루텐": "Gluten",
+    "보리": "Barley",
+    "호밀": "Rye",
+    "생선": "Fish",
+    "고등어": "Mackerel",
+    "갈치": "Hairtail",
+    "꽁치": "Pacific Saury",
+    "갑각류": "Shellfish",
+    "새우": "Shrimp",
+    "랍스터": "Lobster",
+    "연체동물": "Molluscs",
+    "오징어": "Squid",
+    "문어": "Octopus",
+    "조개": "Clam",
+    "참깨": "Sesame Seeds",
+    "겨자": "Mustard",
+    "머스터드": "Mustard",
+    "셀러리": "Celery",
+    "아황산염": "Sulphites",
+    "와인": "Wine",
+    "건과일": "Dried Fruit",
+    "식초": "Vinegar",
+    "루핀": "Lupin",
+    "루핀콩": "Lupin Beans",
+}
+
+
+def restriction_pairs(rows: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    """
+    - restriction_items의 (item_label_ko, item_label_en)
+    - '밀/글루텐(밀, 보리, 호밀)' → 밀/글루텐/보리/호밀 각각
+    - item_label_en이 코드(ALG_MILK)면 CATALOG_TERMS_EN에 있는 용어만, 사람이 쓴 영어 라벨이면 대표어에 그대로 사용
+    """
+    pairs = []
+    for label_ko, label_en in rows:
+        head, _, rest = (label_ko or "").partition("(")
+        label_en = (label_en or "").strip()
+        is_code = bool(re.fullmatch(r"[A-Z0-9_]+", label_en))
+        for term in head.split("/"):
+            term = _norm(term)
+            if not is_code and label_en:
+                pairs.append((term, label_en))
+            elif term in CATALOG_TERMS_EN:
+                pairs.append((term, CATALOG_TERMS_EN[term]))
+        for term in rest.rstrip(")").split(","):
+            term = _norm(term)
+            if term in CATALOG_TERMS_EN:
+                pairs.append((term, CATALOG_TERMS_EN[term]))
+    return pairs
+
+
+def build_glossary(restriction_rows: Iterable[Tuple[str, str]] = ()) -> Glossary:
+    """
+    - 우선순위: 제한 항목 카탈로그(restriction_rows) < 레시피 재료 번역 < 기본 사전(뒤에 넣은 것이 덮어씀)
+    - 레시피 제목의 요리 이름은 번역 없이 '분해 금지' 목록으로
+    """
+    g = Glossary()
+    g.update(restriction_pairs(restriction_rows))
+    g.update(recipe_pairs())
+    g.update(seed_pairs())
+    g.add_dishes(recipe_dish_names())
+    return g
+
+
+_glossary: Optional[Glossary] = None
+_glossary_lock = threading.Lock()
+
+
+def get_glossary(restriction_rows: Optional[Iterable[Tuple[str, str]]] = None) -> Glossary:
+    """
+    - 프로세스당 1번 빌드(시드 + 레시피 재료/제목 + 제한 항목 카탈로그)
+    - restriction_rows: restriction_items의 (item_label_ko, item_label_en), 주면 그 카탈로그로 다시 빌드
+    """
+    global _glossary
+    if _glossary is None or restriction_rows is not None:
+        with _glossary_lock:
+            if _glossary is None or restriction_rows is not None:
+                _glossary = build_glossary(restriction_rows or ())
+    return _glossary
+
+
+def set_glossary(glossary: Glossary) -> None:
+    """호출자가 만든 사전으로 교체"""
+    global _glossary
+    with _glossary_lock:
+        _glossary = glossary
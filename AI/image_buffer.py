@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property
+from io import BytesIO
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+from PIL import Image
+
+
+# -------------------------
+# 이미지 1회 디코딩 → OCR(BGR ndarray)과 렌더링(PIL)이 같은 버퍼 공유
+# -------------------------
+@dataclass
+class DecodedImage:
+    """
+    - data: 원본 파일 바이트(캐시 키 / 축소 디코딩용, 파일은 한 번만 읽음)
+    - bgr: PaddleOCR 입력 규약(HxWx3 uint8, BGR), 처음 접근할 때 한 번만 디코딩
+    - OCR 캐시 적중 시에는 렌더링 전까지 디코딩 자체를 안 함
+    """
+    path: str
+    data: bytes
+
+    @cached_property
+    def bgr(self) -> np.ndarray:
+        with Image.open(BytesIO(self.data)) as im:
+            if im.mode != "RGB":
+                im = im.convert("RGB")
+            w, h = im.size
+            # RGB → BGR 순서 변환을 Pillow가 C로 처리(중간 RGB 배열/복사본 없음)
+            buf = im.tobytes("raw", "BGR")
+        return np.frombuffer(buf, dtype=np.uint8).reshape(h, w, 3)
+
+    @cached_property
+    def size(self) -> Tuple[int, int]:
+        """(w, h) - 디코딩 전이면 헤더만 읽음"""
+        if "bgr" in self.__dict__:
+            h, w = self.bgr.shape[:2]
+            return w, h
+        with Image.open(BytesIO(self.data)) as im:
+            return im.size
+
+    def to_pil(self) -> Image.Image:
+        """렌더링용 RGB 이미지(다시 디코딩하지 않고 bgr 버퍼에서 채널 순서만 바꿔 복사)"""
+        w, h = self.size
+        return Image.frombuffer("RGB", (w, h), self.bgr, "raw", "BGR", 0, 1)
+
+    def release(self) -> None:
+        """디코딩 버퍼 해제(렌더링용 PIL 이미지로 옮긴 뒤 최대 메모리 줄이기), 크기 정보는 유지"""
+        _ = self.size  # 해제 전에 크기 캐시
+        self.__dict__.pop("bgr", None)
+
+    def draft_bgr(self, max_side: int) -> Tuple[np.ndarray, float]:
+        """
+        - 긴 변이 max_side 근처가 되도록 축소 디코딩(JPEG은 1/2, 1/4, 1/8 스케일로 DCT 단계에서 줄임)
+        - 예비 검출처럼 원본 해상도가 필요 없는 곳용
+        - 반환: (BGR ndarray, 축소 비율 = 디코딩 크기 / 원본 크기)
+        """
+        with Image.open(BytesIO(self.data)) as im:
+            orig_w, orig_h = im.size
+            scale = min(1.0, max_side / max(orig_w, orig_h))
+            # draft는 요청 크기 이상인 가장 작은 스케일을 고름(JPEG 외 포맷은 무시됨)
+            im.draft("RGB", (max(1, int(orig_w * scale)), max(1, int(orig_h * scale))))
+            if im.mode != "RGB":
+                im = im.convert("RGB")
+            w, h = im.size
+            buf = im.tobytes("raw", "BGR")
+        return np.frombuffer(buf, dtype=np.uint8).reshape(h, w, 3), w / orig_w
+
+
+def load_image(src: Union[str, Path, bytes, "DecodedImage"], name: str = "") -> DecodedImage:
+    """경로/바이트(업로드 등)를 DecodedImage로, 이미 DecodedImage면 그대로"""
+    if isinstance(src, DecodedImage):
+        return src
+    if isinstance(src, (bytes, bytearray)):
+        return DecodedImage(path=name, data=bytes(src))
+    return DecodedImage(path=str(src), data=Path(src).read_bytes())
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import argparse
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+from PIL import Image
+
+from disk_cache import LRUDiskCache
+from glossary import Glossary, get_glossary
+from image_buffer import DecodedImage, load_image
+from ocr_items import OcrItems
+from PaddleOCR import OcrResult, collect_images, open_ocr_cache, run_ocr, save_ocr_result
+from replace_english import (
+    DEFAULT_FONTS,
+    TranslationMemory,
+    erase_korean,
+    load_items_for_image,
+    render_translation,
+    translate_for_lang,
+)
+
+
+# -------------------------
+# 1) 설정 / 이미지 1장 처리 상태
+# -------------------------
+@dataclass
+class PipelineConfig:
+    langs: List[str] = field(default_factory=lambda: ["en"])
+    font_paths: Dict[str, str] = field(default_factory=lambda: dict(DEFAULT_FONTS))
+    fill: str = "white"
+    memory: Optional[TranslationMemory] = None
+    glossary: Optional[Glossary] = None
+    ocr_cache: Optional[LRUDiskCache] = None
+    ocr_kwargs: Dict[str, Any] = field(default_factory=dict)  # run_ocr() 인자(det_limit_side_len, adaptive ...)
+
+
+@dataclass
+class MenuPage:
+    """
+    - OCR → 번역 → 렌더링 단계 사이를 메모리로 넘기는 상태(중간 JSON 파일/파싱 없음)
+    - 각 단계가 끝나면 다음 단계에 필요 없는 큰 버퍼(디코딩 배열, 지운 바탕)는 바로 놓아줌
+    """
+    image: DecodedImage
+    ocr: Optional[OcrResult] = None
+    items: Optional[OcrItems] = None                    # 원본 좌표 기준 줄 목록(kos/boxes와 같은 순서)
+    kos: List[str] = field(default_factory=list)        # 줄별 정리된 한글
+    boxes: Optional[np.ndarray] = None                  # 원본 좌표 정수 bbox (N, 4)
+    base: Optional[Image.Image] = None                  # 한글을 지운 바탕
+    translations: Dict[str, Dict[str, str]] = field(default_factory=dict)  # 언어 → {한글: 번역}
+    rendered: Dict[str, Image.Image] = field(default_factory=dict)
+    outputs: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def stem(self) -> str:
+        return Path(self.image.path).stem or "image"
+
+
+# -------------------------
+# 2) 단계 (streaming_pipeline에서도 단계별로 재사용)
+# -------------------------
+def stage_ocr(page: MenuPage, cfg: PipelineConfig) -> None:
+    t0 = time.perf_counter()
+    page.ocr = run_ocr(page.image, cache=cfg.ocr_cache, **cfg.ocr_kwargs)
+    page.timings["ocr"] = round(time.perf_counter() - t0, 3)
+
+
+def stage_prepare(page: MenuPage, cfg: PipelineConfig) -> None:
+    """OCR 결과 → 원본 좌표 박스 + 한글 줄 지운 바탕 (언어와 무관, 이미지당 한 번)"""
+    t0 = time.perf_counter()
+    img = page.image.to_pil()
+    page.image.release()  # 이후로는 PIL 이미지만 사용
+    items, boxes, polys = load_items_for_image(page.ocr.to_json(), *img.size)
+    page.kos, page.base = erase_korean(img, items, boxes, polys, fill=cfg.fill)
+    page.items, page.boxes = items, boxes
+    page.timings["prepare"] = round(time.perf_counter() - t0, 3)
+
+
+def stage_translate(pages: List[MenuPage], cfg: PipelineConfig) -> None:
+    """
+    - 여러 이미지의 한글 줄을 언어별로 합쳐 한 번에 배치 번역(중복 문장은 한 번만)
+    - 이미지 1장이면 그대로 1장 분량 배치
+    """
+    t0 = time.perf_counter()
+    kos = {ko for p in pages for ko in p.kos if ko}
+    for lang in cfg.langs:
+        cache = translate_for_lang(kos, lang, memory=cfg.memory, glossary=cfg.glossary)
+        for p in pages:
+            p.translations[lang] = cache
+    elapsed = round(time.perf_counter() - t0, 3)
+    for p in pages:
+        p.timings["translate"] = elapsed
+
+
+def iter_translate_lines(page: MenuPage, cfg: PipelineConfig, chunk_lines: int = 8) -> Iterator[List[int]]:
+    """
+    - stage_translate()의 한 장짜리 점진 버전: 위쪽 줄부터 chunk_lines개씩 번역해 page.translations에 채움
+    - 번역이 끝난 줄 인덱스를 묶음마다 yield → 호출자가 전체 번역 전에 줄 단위 결과를 내보낼 수 있음
+    """
+    t0 = time.perf_counter()
+    for lang in cfg.langs:
+        page.translations.setdefault(lang, {})
+    order = [i for i in np.argsort(page.boxes[:, 1], kind="stable") if page.kos[i]] if len(page.kos) else []
+    for start in range(0, len(order), chunk_lines):
+        idx = [int(i) for i in order[start:start + chunk_lines]]
+        kos = {page.kos[i] for i in idx}
+        for lang in cfg.langs:
+            page.translations[lang].update(translate_for_lang(kos, lang, memory=cfg.memory, glossary=cfg.glossary))
+        yield idx
+    page.timings["translate"] = round(time.perf_counter() - t0, 3)
+
+
+def stage_render(page: MenuPage, cfg: PipelineConfig) -> None:
+    t0 = time.perf_counter()
+    for lang in cfg.langs:
+        page.rendered[lang], _ = render_translation(
+            page.base, page.boxes, page.kos, page.translations[lang], cfg.font_paths[lang],
+        )
+    page.base = None
+    page.timings["render"] = round(time.perf_counter() - t0, 3)
+
+
+def save_page(page: MenuPage, out_dir: Path, save_json: bool = False) -> Dict[str, str]:
+    """
+    - 결과 이미지: {stem}_translated_{lang}.jpg
+    - save_json=True일 때만 OCR JSON/메타도 저장(PaddleOCR.py와 같은 파일명)
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for lang, img in page.rendered.items():
+        path = out_dir / f"{page.stem}_translated_{lang}.jpg"
+        img.save(path)
+        page.outputs[lang] = str(path)
+    if save_json and page.ocr is not None:
+        meta = save_ocr_result(page.ocr, out_dir)
+        page.outputs["json"] = meta["json_path"]
+        page.outputs["meta"] = meta["meta_path"]
+    return page.outputs
+
+
+# -------------------------
+# 3) 한 장 처리 API
+# -------------------------
+def process_image(
+    src: Union[str, Path, bytes, DecodedImage],
+    cfg: PipelineConfig,
+    out_dir: Optional[Path] = None,
+    save_json: bool = False,
+) -> MenuPage:
+    """
+    - 이미지(경로/바이트) → 언어별 결과 이미지(page.rendered), 한 프로세스 안에서 메모리로만 전달
+    - out_dir를 줄 때만 파일로 저장
+    """
+    t0 = time.perf_counter()
+    page = MenuPage(image=load_image(src))
+    stage_ocr(page, cfg)
+    stage_prepare(page, cfg)
+    stage_translate([page], cfg)
+    stage_render(page, cfg)
+    if out_dir is not None:
+        save_page(page, out_dir, save_json=save_json)
+    page.timings["total"] = round(time.perf_counter() - t0, 3)
+    return page
+
+
+def process_images(
+    srcs: Iterable[Union[str, Path]],
+    cfg: PipelineConfig,
+    out_dir: Optional[Path] = None,
+    save_json: bool = False,
+) -> Iterable[MenuPage]:
+    """여러 장을 순서대로 처리(실패한 이미지는 page.error에 기록하고 계속)"""
+    for src in srcs:
+        try:
+            yield process_image(src, cfg, out_dir=out_dir, save_json=save_json)
+        except Exception as e:
+            yield MenuPage(image=DecodedImage(path=str(src), data=b""), error=f"{type(e).__name__}: {e}")
+
+
+def build_config(
+    langs: List[str],
+    font_paths: Optional[Dict[str, str]] = None,
+    tm_path: Optional[Path] = None,
+    ocr_cache_dir: Optional[Path] = None,
+    use_glossary: bool = True,
+    fill: str = "white",
+    **ocr_kwargs: Any,
+) -> PipelineConfig:
+    return PipelineConfig(
+        langs=langs,
+        font_paths={**DEFAULT_FONTS, **(font_paths or {})},
+        fill=fill,
+        memory=TranslationMemory(tm_path) if tm_path else None,
+        glossary=get_glossary() if use_glossary else None,
+        ocr_cache=open_ocr_cache(ocr_cache_dir) if ocr_cache_dir else None,
+        ocr_kwargs=ocr_kwargs,
+    )
+
+
+# -------------------------
+# 4) 실행
+# -------------------------
+if __name__ == "__main__":
+    BASE_DIR = Path(__file__).resolve().parent
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="*", help="이미지 파일 또는 디렉터리. 생략 시 Upload_Images/image_1.jpg")
+    parser.add_argument("--out", type=str, default=str(BASE_DIR / "ocr_output"), help="결과 이미지 저장 디렉터리")
+    parser.add_argument("--save-json", action="store_true", help="OCR JSON/메타도 저장(기본: 저장 안 함)")
+    parser.add_argument("--langs", type=str, default="en", help="대상 언어(쉼표 구분, 예: en,ja,zh)")
+    parser.add_argument("--font", type=str, default=DEFAULT_FONTS["en"], help="영문 폰트 경로")
+    parser.add_argument("--font-ja", type=str, default=DEFAULT_FONTS["ja"], help="일본어 폰트 경로")
+    parser.add_argument("--font-zh", type=str, default=DEFAULT_FONTS["zh"], help="중국어 폰트 경로")
+    parser.add_argument("--det-side", type=int, default=4000, help="det_limit_side_len")
+    parser.add_argument("--adaptive", action="store_true", help="글자 크기에 맞춰 검출 해상도 자동 선택")
+    parser.add_argument("--cache-dir", type=str, default=str(BASE_DIR / "cache"), help="OCR 캐시/번역 메모리 디렉터리")
+    parser.add_argument("--no-cache", action="store_true", help="OCR 캐시/번역 메모리 사용 안 함")
+    parser.add_argument("--no-glossary", action="store_true", help="음식 용어 사전 없이 전부 번역 모델 사용")
+    parser.add_argument("--fill", type=str, default="white", choices=["white", "border"], help="지운 자리 채우기")
+    args = parser.parse_args()
+
+    inputs = [Path(p).resolve() for p in args.inputs] or [(BASE_DIR / "Upload_Images" / "image_1.jpg").resolve()]
+    cache_dir = None if args.no_cache else Path(args.cache_dir).resolve()
+
+    cfg = build_config(
+        langs=[x.strip() for x in args.langs.split(",") if x.strip()],
+        font_paths={"en": args.font, "ja": args.font_ja, "zh": args.font_zh},
+        tm_path=cache_dir / "translation_memory.sqlite3" if cache_dir else None,
+        ocr_cache_dir=cache_dir,
+        use_glossary=not args.no_glossary,
+        fill=args.fill,
+        det_limit_side_len=args.det_side,
+        adaptive=args.adaptive,
+    )
+
+    for page in process_images(collect_images(inputs), cfg, out_dir=Path(args.out).resolve(), save_json=args.save_json):
+        if page.error:
+            print("[FAIL]", page.image.path, page.error)
+        else:
+            print("[OK]", page.image.path, json.dumps(page.timings), list(page.outputs.values()))
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+
+# -------------------------
+# OCR 결과의 배열 표현 (좌표 변환을 줄 단위 루프 없이 한 번에)
+# -------------------------
+@dataclass
+class OcrItems:
+    texts: List[str]
+    scores: np.ndarray    # (N,)
+    boxes: np.ndarray     # (N, 4) [x1, y1, x2, y2]
+    polys: np.ndarray     # (N, 4, 2)
+    has_poly: np.ndarray  # (N,) bool, 원본 JSON에 4점 poly가 있었는지
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @classmethod
+    def from_json(cls, data: dict) -> "OcrItems":
+        """
+        - rec_boxes 우선, 없으면 rec_polys의 외접 사각형
+        - 둘 다 없는 줄은 제외
+        """
+        texts = list(data.get("rec_texts") or [])
+        n = len(texts)
+        raw_polys = data.get("rec_polys") or []
+        raw_boxes = data.get("rec_boxes") or []
+
+        polys = np.zeros((n, 4, 2), dtype=np.float64)
+        has_poly = np.zeros(n, dtype=bool)
+        if len(raw_polys) >= n and n and all(len(p) == 4 for p in raw_polys[:n]):
+            # 일반적인 경우(PaddleOCR 4점 poly): 한 번에 변환
+            polys[:] = np.asarray(raw_polys[:n], dtype=np.float64)
+            has_poly[:] = True
+        else:
+            for i, p in enumerate(raw_polys[:n]):
+                if p is not None and len(p) == 4:
+                    polys[i] = np.asarray(p, dtype=np.float64)
+                    has_poly[i] = True
+
+        boxes = np.zeros((n, 4), dtype=np.float64)
+        has_box = np.zeros(n, dtype=bool)
+        if len(raw_boxes) >= n and n and all(b is not None and len(b) == 4 for b in raw_boxes[:n]):
+            boxes[:] = np.asarray(raw_boxes[:n], dtype=np.float64)
+            has_box[:] = True
+        else:
+            for i, b in enumerate(raw_boxes[:n]):
+                if b is not None and len(b) == 4:
+                    boxes[i] = np.asarray(b, dtype=np.float64)
+                    has_box[i] = True
+
+        need = ~has_box & has_poly
+        if need.any():
+            boxes[need] = polys_to_bboxes(polys[need])
+
+        scores = np.asarray((data.get("rec_scores") or [1.0] * n)[:n], dtype=np.float64)
+        if scores.shape[0] < n:
+            scores = np.pad(scores, (0, n - scores.shape[0]), constant_values=1.0)
+
+        keep = has_box | has_poly
+        if not keep.all():
+            idx = np.flatnonzero(keep)
+            return cls([texts[i] for i in idx], scores[idx], boxes[idx], polys[idx], has_poly[idx])
+        return cls(texts, scores, boxes, polys, has_poly)
+
+    def coord_space(self, orig_w: int, orig_h: int) -> str:
+        """최대 x2/y2가 원본의 110% 이내면 'orig', 아니면 검출 입력(축소) 좌표로 보고 'scaled'"""
+        if len(self) == 0:
+            return "orig"
+        max_x2, max_y2 = self.boxes[:, 2].max(), self.boxes[:, 3].max()
+        if max_x2 <= orig_w * 1.10 and max_y2 <= orig_h * 1.10:
+            return "orig"
+        return "scaled"
+
+    def scaled_to_orig(self, s: float) -> "OcrItems":
+        """검출 좌표(scale s) → 원본 좌표, 박스/poly 전체를 한 번에 나눔"""
+        if s == 0:
+            s = 1.0
+        return OcrItems(self.texts, self.scores, self.boxes / s, self.polys / s, self.has_poly)
+
+    def rounded(self) -> Tuple[np.ndarray, np.ndarray]:
+        """그리기용 정수 좌표 (boxes (N,4), polys (N,4,2))"""
+        return np.rint(self.boxes).astype(np.int64), np.rint(self.polys).astype(np.int64)
+
+
+def polys_to_bboxes(polys: np.ndarray) -> np.ndarray:
+    """(N, K, 2) → (N, 4), 외접 사각형 좌표는 int()처럼 소수점 절삭"""
+    mins = np.trunc(polys.min(axis=1))
+    maxs = np.trunc(polys.max(axis=1))
+    return np.concatenate([mins, maxs], axis=1)
+
+
+def det_scale_for(width: int, height: int, limit_type: str, limit_side_len: float) -> float:
+    """PaddleOCR 검출 전처리와 같은 규칙으로 원본 → 검출 입력 비율 계산"""
+    if limit_side_len <= 0:
+        return 1.0
+    if limit_type == "max":
+        long_side = max(width, height)
+        return 1.0 if long_side <= limit_side_len else limit_side_len / long_side
+    if limit_type == "min":
+        short_side = min(width, height)
+        return 1.0 if short_side >= limit_side_len else limit_side_len / short_side
+    return 1.0
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+# -------------------------
+# 큰 이미지 타일 분할 + 겹침 영역 중복 라인 병합
+# -------------------------
+Tile = Tuple[int, int, int, int]  # (x0, y0, x1, y1)
+
+
+def _axis_starts(length: int, tile: int, overlap: int) -> List[int]:
+    if length <= tile:
+        return [0]
+    step = max(1, tile - overlap)
+    n = -(-(length - overlap) // step)  # ceil: overlap 이상 겹치도록 필요한 타일 수
+    # 마지막 타일이 끝에 딱 맞도록 시작점을 고르게 분배(겹침은 overlap 이상)
+    return [round(i * (length - tile) / (n - 1)) for i in range(n)]
+
+
+def tile_grid(width: int, height: int, tile_size: int, overlap: int) -> List[Tile]:
+    """
+    - tile_size 정사각 타일, 이웃 타일끼리 overlap px 겹침
+    - overlap은 가장 긴 글자 줄보다 크게 잡아야 경계에 걸친 줄이 어느 한 타일엔 온전히 들어감
+    """
+    tiles = []
+    for y0 in _axis_starts(height, tile_size, overlap):
+        for x0 in _axis_starts(width, tile_size, overlap):
+            tiles.append((x0, y0, min(width, x0 + tile_size), min(height, y0 + tile_size)))
+    return tiles
+
+
+def offset_polys(polys: np.ndarray, x0: int, y0: int) -> np.ndarray:
+    """타일 좌표 (N, K, 2) → 원본 좌표"""
+    if polys.size == 0:
+        return polys
+    return polys + np.array([x0, y0], dtype=polys.dtype)
+
+
+def merge_duplicate_lines(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    min_overlap: float = 0.5,
+) -> List[int]:
+    """
+    - boxes: (N, 4) 원본 좌표 [x1, y1, x2, y2]
+    - 겹침 영역에서 두 타일이 같은 줄을 잡으면, 면적이 큰 쪽(경계에 잘리지 않은 쪽)을 남김
+    - 작은 박스 면적 대비 교집합 비율이 min_overlap 이상이면 중복으로 판단
+    - 남길 인덱스를 원래 순서대로 반환
+    """
+    n = len(boxes)
+    if n == 0:
+        return []
+
+    boxes = boxes.astype(np.float64)
+    areas = np.maximum(0.0, boxes[:, 2] - boxes[:, 0]) * np.maximum(0.0, boxes[:, 3] - boxes[:, 1])
+    # 면적 큰 순, 같으면 점수 높은 순
+    order = np.lexsort((-scores, -areas))
+
+    kept: List[int] = []
+    for i in order:
+        if kept:
+            k = np.array(kept)
+            ix1 = np.maximum(boxes[i, 0], boxes[k, 0])
+            iy1 = np.maximum(boxes[i, 1], boxes[k, 1])
+            ix2 = np.minimum(boxes[i, 2], boxes[k, 2])
+            iy2 = np.minimum(boxes[i, 3], boxes[k, 3])
+            inter = np.maximum(0.0, ix2 - ix1) * np.maximum(0.0, iy2 - iy1)
+            smaller = np.maximum(1e-6, np.minimum(areas[i], areas[k]))
+            if np.any(inter / smaller >= min_overlap):
+                continue
+        kept.append(int(i))
+
+    return sorted(kept)
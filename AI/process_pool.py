@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+import multiprocessing
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# -------------------------
+# 워커 프로세스 풀 (OCR 배치 / 재료 번역 배치 공용)
+# -------------------------
+# 워커 프로세스 안에서만 채워지는 설정(initializer가 세팅), 모듈마다 이름으로 구분
+_worker_configs: Dict[str, dict] = {}
+
+_EXHAUSTED = object()
+
+
+def worker_config(name: str) -> dict:
+    """initializer가 채우고 작업 함수가 읽는 워커별 설정(workers=1이면 현재 프로세스의 것)"""
+    return _worker_configs.setdefault(name, {})
+
+
+def bounded_imap(
+    task: Callable[[T], R],
+    items: Iterable[T],
+    workers: int = 1,
+    max_in_flight: Optional[int] = None,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """
+    - items를 task로 처리해 끝나는 순서대로 결과 yield
+    - workers <= 1이면 현재 프로세스에서 initializer 1번 + 순서대로 처리
+    - workers > 1이면 spawn 프로세스 풀(Paddle/torch 런타임은 fork 안전하지 않음), 제출은 max_in_flight개까지
+    - 호출자가 중간에 그만두거나(close) 작업이 예외를 내면 아직 시작 안 한 작업은 취소, 실행 중인 것만 끝나면 풀 종료
+    """
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for item in items:
+            yield task(item)
+        return
+
+    if max_in_flight is None:
+        max_in_flight = workers * 2
+
+    ctx = multiprocessing.get_context("spawn")
+    ex = ProcessPoolExecutor(max_workers=workers, mp_context=ctx, initializer=initializer, initargs=initargs)
+    try:
+        pending: Set[Future] = set()
+        it = iter(items)
+        for item in it:
+            pending.add(ex.submit(task, item))
+            if len(pending) >= max_in_flight:
+                break
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                yield fut.result()
+                nxt = next(it, _EXHAUSTED)
+                if nxt is not _EXHAUSTED:
+                    pending.add(ex.submit(task, nxt))
+    finally:
+        ex.shutdown(wait=True, cancel_futures=True)
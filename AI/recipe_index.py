@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+import argparse
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from recipe_kb import BASE_DIR, KB_PATH, RECIPES_PATH, RecipeKB, atomic_write, compile_kb, get_recipe_kb
+
+
+# -------------------------
+# 레시피 이름 유사도 검색 (OCR 글자 누락/오인식에도 후보를 찾도록 음절 n-gram 역색인)
+# -------------------------
+INDEX_DIR = BASE_DIR / "cache" / "recipe_index"   # n-gram postings만 (.npy, 메모리 매핑으로 로드)
+
+GRAM_SIZES = (2, 3)   # 음절 2-gram + 3-gram (짧은 메뉴 이름은 3-gram만으로는 한 글자 오류에 너무 약함)
+DOC_WEIGHT = 0.05     # Tversky 가중치: 레시피 제목 쪽 남는 n-gram은 조금만 감점(제목이 메뉴 이름보다 김)
+_ARRAYS = ("offsets", "postings", "doc_len")
+
+
+def _compact(s: str) -> str:
+    # 한글만, 공백 없이 (replace_english.keep_korean_only 규칙에서 공백까지 제거)
+    return re.sub(r"[^가-힣]", "", s or "")
+
+
+def syllable_grams(text: str) -> List[str]:
+    """중복 제거된 음절 n-gram, 두 글자 미만이면 글자 자체"""
+    s = _compact(text)
+    if len(s) < min(GRAM_SIZES):
+        return [s] if s else []
+    grams = {s[i:i + n] for n in GRAM_SIZES for i in range(len(s) - n + 1)}
+    return sorted(grams)
+
+
+@dataclass
+class RecipeHit:
+    doc: int
+    title: str
+    score: float
+
+
+class RecipeIndex:
+    """
+    - vocab: n-gram → id, postings는 CSR(offsets + doc id 배열)로 저장 → 코퍼스가 커져도 메모리 연속, 저장/로드 빠름
+    - doc id = RecipeKB 레시피 id: 제목/재료는 KB(메모리 매핑)에서 필요할 때만 읽음 → 워커마다 코퍼스 사본을 들고 있지 않음
+    - 질의: 질의 n-gram의 postings를 이어 붙여 문서별 공유 n-gram 수를 한 번에 셈(np.unique)
+    - 점수: Tversky(공유 / (공유 + 질의 남는 수 + DOC_WEIGHT * 제목 남는 수)), 질의 n-gram이 모두 제목에 있으면 제목이 짧을수록 1.0에 가까움
+    """
+
+    def __init__(
+        self,
+        kb: RecipeKB,
+        vocab: Dict[str, int],
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        doc_len: np.ndarray,
+    ):
+        self.kb = kb
+        self.vocab = vocab
+        self.offsets = offsets
+        self.postings = postings
+        self.doc_len = doc_len
+
+    def __len__(self) -> int:
+        return len(self.doc_len)
+
+    @classmethod
+    def build(cls, kb: RecipeKB) -> "RecipeIndex":
+        vocab: Dict[str, int] = {}
+        pairs: List[Tuple[int, int]] = []  # (gram id, doc id)
+        doc_len: List[int] = []
+        for doc in range(len(kb)):
+            grams = syllable_grams(kb.title(doc))
+            doc_len.append(len(grams))
+            for g in grams:
+                pairs.append((vocab.setdefault(g, len(vocab)), doc))
+
+        arr = np.array(pairs, dtype=np.int32).reshape(-1, 2)
+        order = np.lexsort((arr[:, 1], arr[:, 0]))
+        arr = arr[order]
+        counts = np.bincount(arr[:, 0], minlength=len(vocab)) if len(arr) else np.zeros(len(vocab), dtype=np.int64)
+        offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(kb, vocab, offsets, arr[:, 1].copy(), np.array(doc_len, dtype=np.int32))
+
+    def save(self, index_dir: Path = INDEX_DIR) -> None:
+        """배열은 .npy(메모리 매핑 가능), n-gram 목록은 마지막에 써서 저장 완료 표시로도 사용"""
+        index_dir = Path(index_dir)
+        index_dir.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAYS:
+            with atomic_write(index_dir / f"{name}.npy") as f:
+                np.save(f, getattr(self, name))
+        grams = sorted(self.vocab, key=self.vocab.get)
+        with atomic_write(index_dir / "grams.txt") as f:
+            f.write("\n".join(grams).encode("utf-8"))
+
+    @classmethod
+    def load(cls, kb: RecipeKB, index_dir: Path = INDEX_DIR) -> "RecipeIndex":
+        """postings/offsets/doc_len은 읽기 전용 메모리 매핑 → 워커 프로세스끼리 OS 페이지 캐시 공유"""
+        index_dir = Path(index_dir)
+        text = (index_dir / "grams.txt").read_text(encoding="utf-8")
+        grams = text.split("\n") if text else []
+        arrays = {name: np.load(index_dir / f"{name}.npy", mmap_mode="r") for name in _ARRAYS}
+        if len(arrays["offsets"]) != len(grams) + 1 or len(arrays["doc_len"]) != len(kb):
+            raise ValueError(f"recipe index does not match the KB: {index_dir}")
+        return cls(kb=kb, vocab={g: i for i, g in enumerate(grams)}, **arrays)
+
+    def query(self, text: str, k: int = 5, min_score: float = 0.0) -> List[RecipeHit]:
+        grams = syllable_grams(text)
+        if not grams or len(self) == 0:
+            return []
+        ids = [self.vocab[g] for g in grams if g in self.vocab]
+        if not ids:
+            return []
+
+        # 질의 n-gram들의 postings를 이어 붙여 문서별 공유 개수 계산(후보 문서만 다룸)
+        lists = [self.postings[self.offsets[i]:self.offsets[i + 1]] for i in ids]
+        docs, shared = np.unique(np.concatenate(lists), return_counts=True)
+
+        q = len(grams)
+        d = self.doc_len[docs]
+        scores = shared / (shared + (q - shared) + DOC_WEIGHT * (d - shared))
+
+        if len(docs) > k:
+            top = np.argpartition(-scores, k)[:k]
+        else:
+            top = np.arange(len(docs))
+        # 점수 높은 순, 같으면 제목 짧은 순
+        top = top[np.lexsort((d[top], -scores[top]))]
+        return [
+            RecipeHit(doc=int(docs[i]), title=self.kb.title(int(docs[i])), score=float(scores[i]))
+            for i in top
+            if scores[i] >= min_score
+        ]
+
+    def lookup(self, text: str, min_score: float = 0.5) -> Optional[Tuple[str, List[str]]]:
+        """allergen_matcher의 recipe_lookup 형식: 가장 비슷한 레시피 (제목, 재료), 점수가 낮으면 None"""
+        if len(_compact(text)) < 2:
+            return None
+        hits = self.query(text, k=1, min_score=min_score)
+        if not hits:
+            return None
+        return hits[0].title, self.kb.ingredients(hits[0].doc)
+
+
+_index: Optional[RecipeIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_recipe_index(recipes_path: Path = RECIPES_PATH, index_dir: Path = INDEX_DIR) -> RecipeIndex:
+    """
+    - 프로세스당 1번: 저장된 인덱스가 KB보다 최신이면 메모리 매핑으로 로드, 아니면 KB에서 빌드 후 저장
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                kb = get_recipe_kb(recipes_path)
+                marker = Path(index_dir) / "grams.txt"
+                index = None
+                if marker.exists() and marker.stat().st_mtime >= kb.path.stat().st_mtime:
+                    try:
+                        index = RecipeIndex.load(kb, index_dir)
+                    except (OSError, ValueError) as e:
+                        print("[recipe_index] rebuild:", e)
+                if index is None:
+                    RecipeIndex.build(kb).save(index_dir)
+                    index = RecipeIndex.load(kb, index_dir)
+                _index = index
+    return _index
+
+
+# -------------------------
+# 실행 (인덱스 미리 빌드 + 질의 확인)
+# -------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("queries", nargs="*", help="검색할 메뉴 이름")
+    parser.add_argument("--recipes", type=str, default=str(RECIPES_PATH), help="레시피 JSON")
+    parser.add_argument("--kb", type=str, default=str(KB_PATH), help="컴파일된 레시피 KB")
+    parser.add_argument("--out", type=str, default=str(INDEX_DIR), help="인덱스 저장 디렉터리")
+    parser.add_argument("-k", type=int, default=5, help="후보 수")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    kb = RecipeKB(compile_kb(Path(args.recipes), Path(args.kb)))
+    RecipeIndex.build(kb).save(Path(args.out))
+    index = RecipeIndex.load(kb, Path(args.out))
+    print(f"built: docs={len(index)} grams={len(index.vocab)} postings={len(index.postings)} "
+          f"({time.perf_counter() - t0:.2f}s) → {args.out}")
+
+    for q in args.queries:
+        t0 = time.perf_counter()
+        hits = index.query(q, k=args.k)
+        print(f"\n[{q}] {(time.perf_counter() - t0) * 1000:.2f}ms")
+        for h in hits:
+            print(f"  {h.score:.3f}  {h.title}")
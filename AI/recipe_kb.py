@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+import argparse
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+# -------------------------
+# 레시피 지식 베이스: JSON → 메모리 매핑 바이너리
+# - 재료 이름은 한 번만 저장(intern)하고 레시피는 재료 id 배열(CSR)로
+# - 열 때 헤더만 읽음(파싱 X), 여러 워커 프로세스가 같은 파일을 OS 페이지 캐시로 읽기 전용 공유
+# -------------------------
+BASE_DIR = Path(__file__).resolve().parent
+RECIPES_PATH = BASE_DIR / "korean_food_recipes.json"
+KB_PATH = BASE_DIR / "cache" / "recipes.rkb"
+
+MAGIC = b"RKB1"
+VERSION = 1
+
+# 섹션 순서/자료형은 고정(헤더에는 위치와 개수만)
+SECTIONS: List[Tuple[str, str]] = [
+    ("title_off", "<u8"),     # 레시피 제목 문자열 위치 (n_recipes + 1)
+    ("title_blob", "u1"),     # UTF-8 바이트
+    ("ing_off", "<u8"),       # 재료 이름(한글) 위치 (n_ingredients + 1)
+    ("ing_blob", "u1"),
+    ("ing_en_off", "<u8"),    # 재료 이름(영문, 없으면 빈 문자열)
+    ("ing_en_blob", "u1"),
+    ("ing_sorted", "<i4"),    # 재료 id를 이름(바이트) 순으로 정렬 → 이름 → id 이진 탐색
+    ("recipe_ptr", "<i8"),    # 레시피 → 재료 CSR (n_recipes + 1)
+    ("recipe_ing", "<i4"),
+    ("ing_ptr", "<i8"),       # 재료 → 레시피 역 CSR (n_ingredients + 1)
+    ("ing_recipes", "<i4"),
+]
+_HEADER = struct.Struct("<4sIII")          # magic, version, n_recipes, n_ingredients
+_SECTION = struct.Struct("<QQ")            # offset(byte), count(원소 수)
+_ALIGN = 8
+
+
+def _string_table(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    encoded = [s.encode("utf-8") for s in strings]
+    off = np.zeros(len(encoded) + 1, dtype="<u8")
+    np.cumsum([len(b) for b in encoded], out=off[1:])
+    return off, np.frombuffer(b"".join(encoded), dtype="u1")
+
+
+@contextmanager
+def atomic_write(path: Path) -> Iterator[BinaryIO]:
+    """
+    - 같은 디렉터리의 고유한 임시 파일에 쓰고 끝나면 rename → 읽는 쪽은 항상 완성된 파일만 봄
+    - 여러 프로세스가 동시에 다시 빌드해도 임시 파일이 겹치지 않음(마지막 rename이 이김), 실패하면 임시 파일 삭제
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def compile_kb(recipes_path: Path = RECIPES_PATH, out_path: Path = KB_PATH) -> Path:
+    """
+    - ingredients_ko를 정리(strip)해 intern, ingredients_en은 같은 길이로 채워진 레시피에서만 가져옴
+    - 임시 파일에 쓰고 rename → 읽는 중인 워커가 반쯤 쓴 파일을 보지 않음
+    """
+    recipes = json.loads(Path(recipes_path).read_text(encoding="utf-8"))
+
+    titles: List[str] = []
+    ing_ids: Dict[str, int] = {}
+    ing_en: List[str] = []
+    ptr = [0]
+    flat: List[int] = []
+    for r in recipes:
+        titles.append(r.get("ko") or "")
+        ko_list = [x.strip() for x in (r.get("ingredients_ko") or [])]
+        en_list = r.get("ingredients_en") or []
+        aligned = len(en_list) == len(ko_list)
+        seen = set()
+        for k, ko in enumerate(ko_list):
+            if not ko or ko in seen:
+                continue
+            seen.add(ko)
+            j = ing_ids.setdefault(ko, len(ing_ids))
+            if j == len(ing_en):
+                ing_en.append("")
+            if aligned and not ing_en[j] and en_list[k]:
+                ing_en[j] = en_list[k].strip()
+            flat.append(j)
+        ptr.append(len(flat))
+
+    names = sorted(ing_ids, key=ing_ids.get)
+    recipe_ptr = np.array(ptr, dtype="<i8")
+    recipe_ing = np.array(flat, dtype="<i4")
+
+    # 역 CSR: 재료 id 순으로 (재료, 레시피) 정렬
+    rec_of = np.repeat(np.arange(len(titles), dtype="<i4"), np.diff(recipe_ptr))
+    order = np.lexsort((rec_of, recipe_ing))
+    ing_ptr = np.zeros(len(names) + 1, dtype="<i8")
+    np.cumsum(np.bincount(recipe_ing, minlength=len(names)), out=ing_ptr[1:])
+
+    title_off, title_blob = _string_table(titles)
+    ing_off, ing_blob = _string_table(names)
+    ing_en_off, ing_en_blob = _string_table(ing_en)
+    ing_sorted = np.array(sorted(range(len(names)), key=lambda j: names[j].encode("utf-8")), dtype="<i4")
+
+    arrays = {
+        "title_off": title_off, "title_blob": title_blob,
+        "ing_off": ing_off, "ing_blob": ing_blob,
+        "ing_en_off": ing_en_off, "ing_en_blob": ing_en_blob,
+        "ing_sorted": ing_sorted,
+        "recipe_ptr": recipe_ptr, "recipe_ing": recipe_ing,
+        "ing_ptr": ing_ptr, "ing_recipes": rec_of[order],
+    }
+
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    header_size = _HEADER.size + _SECTION.size * len(SECTIONS)
+    with atomic_write(out_path) as f:
+        f.write(b"\0" * header_size)
+        table = []
+        for name, dtype in SECTIONS:
+            pad = (-f.tell()) % _ALIGN
+            f.write(b"\0" * pad)
+            arr = np.ascontiguousarray(arrays[name], dtype=dtype)
+            table.append((f.tell(), arr.size))
+            f.write(arr.tobytes())
+        f.seek(0)
+        f.write(_HEADER.pack(MAGIC, VERSION, len(titles), len(names)))
+        for off, count in table:
+            f.write(_SECTION.pack(off, count))
+    return out_path
+
+
+class RecipeKB:
+    """
+    - 파일 전체를 np.memmap(읽기 전용)으로 열고 섹션은 그 위의 뷰 → 여는 비용은 코퍼스 크기와 무관
+    - 문자열은 필요한 것만 그때그때 디코딩
+    """
+
+    def __init__(self, path: Path = KB_PATH):
+        self.path = Path(path)
+        self._mm = np.memmap(self.path, dtype="u1", mode="r")
+        magic, version, self.n_recipes, self.n_ingredients = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"not a recipe KB (v{VERSION}): {self.path}")
+
+        pos = _HEADER.size
+        for name, dtype in SECTIONS:
+            off, count = _SECTION.unpack_from(self._mm, pos)
+            pos += _SECTION.size
+            nbytes = count * np.dtype(dtype).itemsize
+            setattr(self, name, self._mm[off:off + nbytes].view(dtype))
+
+    def __len__(self) -> int:
+        return self.n_recipes
+
+    @staticmethod
+    def _str(off: np.ndarray, blob: np.ndarray, i: int) -> str:
+        return blob[off[i]:off[i + 1]].tobytes().decode("utf-8")
+
+    def title(self, i: int) -> str:
+        return self._str(self.title_off, self.title_blob, i)
+
+    def ingredient(self, j: int) -> str:
+        return self._str(self.ing_off, self.ing_blob, j)
+
+    def ingredient_en(self, j: int) -> str:
+        return self._str(self.ing_en_off, self.ing_en_blob, j)
+
+    def ingredient_ids(self, i: int) -> np.ndarray:
+        return self.recipe_ing[self.recipe_ptr[i]:self.recipe_ptr[i + 1]]
+
+    def ingredients(self, i: int) -> List[str]:
+        return [self.ingredient(int(j)) for j in self.ingredient_ids(i)]
+
+    def recipes_with(self, j: int) -> np.ndarray:
+        """재료 id → 그 재료가 들어간 레시피 id들"""
+        return self.ing_recipes[self.ing_ptr[j]:self.ing_ptr[j + 1]]
+
+    def ingredient_id(self, name: str) -> Optional[int]:
+        """재료 이름 → id (정렬 순서 배열에서 이진 탐색, 사전(dict) 빌드 없음)"""
+        key = name.strip().encode("utf-8")
+        lo, hi = 0, len(self.ing_sorted)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            j = int(self.ing_sorted[mid])
+            cur = self.ing_blob[self.ing_off[j]:self.ing_off[j + 1]].tobytes()
+            if cur < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.ing_sorted):
+            j = int(self.ing_sorted[lo])
+            if self.ing_blob[self.ing_off[j]:self.ing_off[j + 1]].tobytes() == key:
+                return j
+        return None
+
+    def recipe(self, i: int) -> dict:
+        """원래 JSON 한 항목과 같은 형태(중복 재료는 제거됨)"""
+        ids = self.ingredient_ids(i)
+        en = [self.ingredient_en(int(j)) for j in ids]
+        return {
+            "ko": self.title(i),
+            "ingredients_ko": [self.ingredient(int(j)) for j in ids],
+            "ingredients_en": en if all(en) else [],
+        }
+
+    def iter_recipes(self) -> Iterator[dict]:
+        for i in range(self.n_recipes):
+            yield self.recipe(i)
+
+
+_kb: Optional[RecipeKB] = None
+_kb_lock = threading.Lock()
+
+
+def get_recipe_kb(recipes_path: Path = RECIPES_PATH, kb_path: Path = KB_PATH) -> RecipeKB:
+    """프로세스당 1번: 컴파일된 KB가 JSON보다 오래됐거나 없으면 다시 컴파일 후 매핑"""
+    global _kb
+    if _kb is None:
+        with _kb_lock:
+            if _kb is None:
+                kb_path = Path(kb_path)
+                if not kb_path.exists() or (
+                    Path(recipes_path).exists() and kb_path.stat().st_mtime < Path(recipes_path).stat().st_mtime
+                ):
+                    compile_kb(recipes_path, kb_path)
+                _kb = RecipeKB(kb_path)
+    return _kb
+
+
+# -------------------------
+# 실행 (컴파일 + 확인)
+# -------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recipes", type=str, default=str(RECIPES_PATH), help="레시피 JSON")
+    parser.add_argument("--out", type=str, default=str(KB_PATH), help="출력 KB 파일")
+    parser.add_argument("--ingredient", type=str, default="", help="(옵션) 이 재료가 들어간 레시피 출력")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    path = compile_kb(Path(args.recipes), Path(args.out))
+    print(f"compiled: {path} ({path.stat().st_size / 1024:.1f} KiB, {time.perf_counter() - t0:.2f}s)")
+
+    t0 = time.perf_counter()
+    kb = RecipeKB(path)
+    print(f"opened: recipes={kb.n_recipes} ingredients={kb.n_ingredients} ({(time.perf_counter() - t0) * 1000:.2f}ms)")
+
+    if args.ingredient:
+        j = kb.ingredient_id(args.ingredient)
+        if j is None:
+            print("unknown ingredient:", args.ingredient)
+        else:
+            for i in kb.recipes_with(j):
+                print(" -", kb.title(int(i)))
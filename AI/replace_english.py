@@ -2,12 +2,21 @@ from __future__ import annotations
 
 from pathlib import Path
 import json
+import os
 import re
 import argparse
-from typing import Any, Dict, List, Tuple, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Dict, Iterable, List, Tuple, Optional
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from disk_cache import LRUDiskCache
+from glossary import Glossary, get_glossary
+from ocr_items import OcrItems, det_scale_for
+
 
 # -------------------------
 # 1) 한글만 추출
@@ -22,20 +31,161 @@ def keep_korean_only(s: str) -> str:
 
 
 # -------------------------
-# 2) 번역기(로컬 HF Marian)
+# 2) 번역기(로컬 HF) - 언어별로 처음 쓸 때 로드, 프로세스당 1개
 # -------------------------
-def build_translator():
-    from transformers import pipeline
-    return pipeline("translation", model="Helsinki-NLP/opus-mt-ko-en")
+TRANSLATION_MODEL = "Helsinki-NLP/opus-mt-ko-en"
+
+# 대상 언어 → 번역 모델 설정 (opus-mt에는 ko→ja/zh가 없어 NLLB 사용)
+LANG_MODELS: Dict[str, Dict[str, str]] = {
+    "en": {"model": TRANSLATION_MODEL},
+    "ja": {"model": "facebook/nllb-200-distilled-600M", "src_lang": "kor_Hang", "tgt_lang": "jpn_Jpan"},
+    "zh": {"model": "facebook/nllb-200-distilled-600M", "src_lang": "kor_Hang", "tgt_lang": "zho_Hans"},
+}
 
-translator = build_translator()
+_translators: Dict[str, Any] = {}      # 언어 → 번역 함수
+_pipelines: Dict[str, Any] = {}        # 모델 id → 로드된 pipeline (ja/zh는 같은 NLLB를 공유)
+_translator_lock = threading.Lock()
 
-def ko_to_en(text: str) -> str:
+
+def lang_model_id(lang: str) -> str:
+    """번역 메모리 키 등에 쓰는 모델 식별자(같은 NLLB라도 대상 언어가 다르면 다른 id)"""
+    cfg = LANG_MODELS[lang]
+    return cfg["model"] if "tgt_lang" not in cfg else f"{cfg['model']}:{cfg['tgt_lang']}"
+
+def build_translator(model: str = TRANSLATION_MODEL, **kwargs):
+    from transformers import pipeline
+    return pipeline("translation", model=model, **kwargs)
+
+def get_translator(lang: str = "en"):
+    """
+    - import 시점이 아니라 첫 번역 때 모델 로드(한글 정리/레이아웃 함수만 쓰는 곳은 로드 비용 X)
+    - 모델은 id당 1번만 로드: ja/zh는 같은 NLLB pipeline에 src_lang/tgt_lang만 호출마다 넘김(600M 모델 사본 1개)
+    """
+    tr = _translators.get(lang)
+    if tr is None:
+        with _translator_lock:
+            tr = _translators.get(lang)
+            if tr is None:
+                cfg = dict(LANG_MODELS[lang])
+                model = cfg.pop("model")
+                base = _pipelines.get(model)
+                if base is None:
+                    base = _pipelines[model] = build_translator(model)
+                tr = partial(base, **cfg) if cfg else base
+                _translators[lang] = tr
+    return tr
+
+def set_translator(translator, lang: str = "en") -> None:
+    """이미 로드된 번역기(다른 모듈/서버와 공유하는 인스턴스)를 주입"""
+    with _translator_lock:
+        _translators[lang] = translator
+
+def warmup_translator(lang: str = "en") -> None:
+    """서버/워커 시작 시 호출: 모델 로드 + 첫 추론 초기화 비용을 미리 치름"""
+    get_translator(lang)("김치", max_length=16)
+
+def ko_to_en(text: str, translator=None) -> str:
     if not text:
         return ""
-    out = translator(text, max_length=128)
+    tr = translator if translator is not None else get_translator()
+    out = tr(text, max_length=128)
     return out[0]["translation_text"].strip()
 
+class TranslationMemory:
+    """
+    - 실행/프로세스 간 공유되는 번역 캐시 (SQLite, LRU 개수 제한)
+    - 키: 모델 id + keep_korean_only()로 정리된 한글
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        model_id: str = TRANSLATION_MODEL,
+        max_entries: int = 200_000,
+        store: Optional[LRUDiskCache] = None,
+    ):
+        self.model_id = model_id
+        self.store = store if store is not None else LRUDiskCache(path, max_bytes=256 * 1024 * 1024, max_entries=max_entries)
+
+    def with_model(self, model_id: str) -> "TranslationMemory":
+        """같은 저장소를 공유하면서 다른 모델(언어) 키 공간을 쓰는 뷰"""
+        return TranslationMemory(model_id=model_id, store=self.store)
+
+    def _key(self, ko: str) -> str:
+        return f"{self.model_id}\t{ko}"
+
+    def lookup(self, kos: List[str]) -> Dict[str, str]:
+        found = self.store.get_many([self._key(ko) for ko in kos])
+        prefix = len(self.model_id) + 1
+        return {k[prefix:]: v.decode("utf-8") for k, v in found.items()}
+
+    def save(self, pairs: Dict[str, str]) -> None:
+        self.store.set_many({self._key(ko): en.encode("utf-8") for ko, en in pairs.items()})
+
+    def stats(self) -> dict:
+        return self.store.stats()
+
+
+def translate_batch(
+    texts: Iterable[str],
+    translator=None,
+    batch_size: int = 16,
+    max_length: int = 128,
+    memory: Optional[TranslationMemory] = None,
+    glossary: Optional[Glossary] = None,
+) -> Dict[str, str]:
+    """
+    - 중복 제거한 문자열을 길이순으로 정렬해 batch_size씩 묶어 번역(묶음 안 패딩 최소화)
+    - glossary(음식 용어 사전)로 번역되는 줄은 모델/메모리를 거치지 않음
+    - memory가 있으면 저장된 번역은 모델 없이 바로 쓰고, 새 번역은 저장
+    - 반환: {원문: 번역}
+    """
+    uniq = sorted({t for t in texts if t}, key=len)
+    if not uniq:
+        return {}
+
+    out: Dict[str, str] = {}
+    if glossary is not None:
+        out.update(glossary.lookup_many(uniq))
+        uniq = [t for t in uniq if t not in out]
+        if not uniq:
+            return out
+
+    if memory is not None:
+        out.update(memory.lookup(uniq))
+        uniq = [t for t in uniq if t not in out]
+        if not uniq:
+            return out
+
+    tr = translator if translator is not None else get_translator()
+    fresh: Dict[str, str] = {}
+    for i in range(0, len(uniq), batch_size):
+        chunk = uniq[i:i + batch_size]
+        res = tr(chunk, max_length=max_length, batch_size=len(chunk))
+        for src, r in zip(chunk, res):
+            if isinstance(r, list):  # pipeline 버전에 따라 [{"translation_text": ...}]로 한 번 더 감싸짐
+                r = r[0]
+            fresh[src] = r["translation_text"].strip()
+
+    if memory is not None:
+        memory.save(fresh)
+    out.update(fresh)
+    return out
+
+def translate_for_lang(
+    kos: Iterable[str],
+    lang: str,
+    memory: Optional[TranslationMemory] = None,
+    glossary: Optional[Glossary] = None,
+) -> Dict[str, str]:
+    """언어별 번역기/메모리 키로 translate_batch (음식 용어 사전은 영어 전용)"""
+    return translate_batch(
+        kos,
+        translator=get_translator(lang),
+        memory=memory.with_model(lang_model_id(lang)) if memory is not None else None,
+        glossary=glossary if lang == "en" else None,
+    )
+
 
 # -------------------------
 # 3) JSON 파싱
@@ -43,107 +193,105 @@ def ko_to_en(text: str) -> str:
 def load_json(p: Path) -> dict:
     return json.loads(p.read_text(encoding="utf-8"))
 
-def poly_to_bbox(poly: List[List[float]]) -> Tuple[int, int, int, int]:
-    xs = [pt[0] for pt in poly]
-    ys = [pt[1] for pt in poly]
-    return int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))
-
-def get_items(data: dict) -> List[dict]:
-    texts = data.get("rec_texts", [])
-    polys = data.get("rec_polys", None)
-    boxes = data.get("rec_boxes", None)
-
-    items = []
-    for i in range(len(texts)):
-        t = texts[i]
-        poly = polys[i] if polys and i < len(polys) else None
-        box = boxes[i] if boxes and i < len(boxes) else None
-
-        if box and len(box) == 4:
-            x1, y1, x2, y2 = map(float, box)
-            bbox = (x1, y1, x2, y2)
-        elif poly:
-            bbox = tuple(map(float, poly_to_bbox(poly)))
-        else:
-            continue
-
-        items.append({"text": t, "poly": poly, "bbox": bbox})
-    return items
-
 
 # -------------------------
-# 4) 좌표가 "원본 좌표"인지 자동 판별 + 필요 시 스케일 역변환
+# 4) 검출 축소 비율(OCR 입력 / 원본)
 # -------------------------
 def det_scale_from_params(orig_w: int, orig_h: int, det_params: dict) -> float:
-    limit_type = det_params.get("limit_type", "max")
+    """OCR JSON의 text_det_params → 검출 비율(계산은 PaddleOCR 쪽과 같은 ocr_items.det_scale_for)"""
     limit_side_len = float(det_params.get("limit_side_len", 0) or 0)
-
-    if limit_side_len <= 0:
-        return 1.0
-
-    if limit_type == "max":
-        long_side = max(orig_w, orig_h)
-        return 1.0 if long_side <= limit_side_len else (limit_side_len / long_side)
-    elif limit_type == "min":
-        short_side = min(orig_w, orig_h)
-        return 1.0 if short_side >= limit_side_len else (limit_side_len / short_side)
-    return 1.0
-
-def guess_coord_space(items: List[dict], orig_w: int, orig_h: int) -> str:
-    """
-    rec_boxes 최대값이 원본 크기와 비슷하면 'orig'
-    아니면 'scaled'로 가정(리사이즈된 좌표)
-    """
-    if not items:
-        return "orig"
-
-    max_x2 = max(it["bbox"][2] for it in items)
-    max_y2 = max(it["bbox"][3] for it in items)
-
-    # 원본과의 근접도 판단(10% 여유)
-    if max_x2 <= orig_w * 1.10 and max_y2 <= orig_h * 1.10:
-        return "orig"
-    return "scaled"
-
-def map_box_scaled_to_orig(box: Tuple[float, float, float, float], s: float) -> Tuple[int, int, int, int]:
-    x1, y1, x2, y2 = box
-    if s == 0:
-        s = 1.0
-    return (int(round(x1 / s)), int(round(y1 / s)), int(round(x2 / s)), int(round(y2 / s)))
-
-def map_poly_scaled_to_orig(poly: List[List[float]], s: float) -> List[Tuple[int, int]]:
-    if s == 0:
-        s = 1.0
-    pts = []
-    for p in poly:
-        pts.append((int(round(p[0] / s)), int(round(p[1] / s))))
-    return pts
+    return det_scale_for(orig_w, orig_h, det_params.get("limit_type", "max"), limit_side_len)
 
 
 # -------------------------
 # 5) 자동 줄바꿈 + 폰트 맞춤
 # -------------------------
+# 언어별 기본 폰트 - 일본어/중국어는 라틴 폰트로 그리면 글자가 깨짐
+# - FONT_EN / FONT_JA / FONT_ZH 환경변수로 지정, 없으면 OS별 기본값
+# - Linux 기본값은 Debian 패키지 fonts-dejavu-core, fonts-noto-cjk 경로(backend/Dockerfile에서 설치)
+if os.name == "nt":
+    _OS_FONTS = {
+        "en": r"C:\Windows\Fonts\arial.ttf",
+        "ja": r"C:\Windows\Fonts\msgothic.ttc",
+        "zh": r"C:\Windows\Fonts\msyh.ttc",
+    }
+else:
+    _OS_FONTS = {
+        "en": "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "ja": "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "zh": "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+    }
+DEFAULT_FONTS: Dict[str, str] = {
+    lang: os.getenv(f"FONT_{lang.upper()}", path) for lang, path in _OS_FONTS.items()
+}
+
+# 폰트/글자 폭 측정 결과를 재사용(박스·크기마다 truetype 재로드, 같은 단어 재측정 X)
+@lru_cache(maxsize=512)
+def load_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(font_path, size)
+
+@lru_cache(maxsize=65536)
+def _measure(font_path: str, size: int, text: str) -> Tuple[int, int]:
+    l, t, r, b = load_font(font_path, size).getbbox(text)
+    return (r - l), (b - t)
+
+def _font_key(font: ImageFont.ImageFont) -> Optional[Tuple[str, int]]:
+    path = getattr(font, "path", None)
+    size = getattr(font, "size", None)
+    if isinstance(path, str) and size:
+        return path, int(size)
+    return None
+
 def text_bbox(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont) -> Tuple[int, int]:
+    key = _font_key(font)
+    if key is not None:
+        return _measure(key[0], key[1], text)
     l, t, r, b = draw.textbbox((0, 0), text, font=font)
     return (r - l), (b - t)
 
 def wrap_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont, max_w: int) -> List[str]:
+    """
+    - 단어 폭(캐시) + 공백 폭을 누적해서 판단 → 늘어나는 줄 전체를 매번 다시 재지 않음
+    - 커닝 등으로 생기는 몇 px 오차는 fit_text()의 최종 줄 측정에서 걸러짐
+    """
     words = text.split()
     if not words:
         return []
+    space_w = text_bbox(draw, "a a", font)[0] - text_bbox(draw, "aa", font)[0]
+
     lines = []
-    cur = words[0]
+    cur = [words[0]]
+    cur_w = text_bbox(draw, words[0], font)[0]
     for w in words[1:]:
-        trial = cur + " " + w
-        w_trial, _ = text_bbox(draw, trial, font)
-        if w_trial <= max_w:
-            cur = trial
+        w_w = text_bbox(draw, w, font)[0]
+        if cur_w + space_w + w_w <= max_w:
+            cur.append(w)
+            cur_w += space_w + w_w
         else:
-            lines.append(cur)
-            cur = w
-    lines.append(cur)
+            lines.append(" ".join(cur))
+            cur = [w]
+            cur_w = w_w
+    lines.append(" ".join(cur))
     return lines
 
+def _layout_fits(
+    draw: ImageDraw.ImageDraw,
+    text: str,
+    font: ImageFont.FreeTypeFont,
+    target_w: int,
+    target_h: int,
+    gap: int,
+) -> Optional[List[str]]:
+    lines = wrap_text(draw, text, font, target_w)
+    if not lines:
+        return None
+    max_line_w = max(text_bbox(draw, ln, font)[0] for ln in lines)
+    line_h = text_bbox(draw, "Ag", font)[1]
+    total_h = len(lines) * line_h + (len(lines) - 1) * gap
+    if max_line_w <= target_w and total_h <= target_h:
+        return lines
+    return None
+
 def fit_text(
     draw: ImageDraw.ImageDraw,
     text: str,
@@ -155,89 +303,114 @@ def fit_text(
     pad: int = 4,
     gap: int = 2,
 ) -> Tuple[ImageFont.FreeTypeFont, List[str]]:
+    """박스에 들어가는 가장 큰 글자 크기를 이분 탐색(크기가 커질수록 들어가기 어려워지는 단조성 이용)"""
     target_w = max(1, box_w - 2 * pad)
     target_h = max(1, box_h - 2 * pad)
 
-    for size in range(max_size, min_size - 1, -1):
-        font = ImageFont.truetype(font_path, size)
-        lines = wrap_text(draw, text, font, target_w)
-        if not lines:
-            continue
-        max_line_w = max(text_bbox(draw, ln, font)[0] for ln in lines)
-        line_h = text_bbox(draw, "Ag", font)[1]
-        total_h = len(lines) * line_h + (len(lines) - 1) * gap
-        if max_line_w <= target_w and total_h <= target_h:
-            return font, lines
+    best: Optional[Tuple[ImageFont.FreeTypeFont, List[str]]] = None
+    lo, hi = min_size, max_size
+    while lo <= hi:
+        size = (lo + hi) // 2
+        font = load_font(font_path, size)
+        lines = _layout_fits(draw, text, font, target_w, target_h, gap)
+        if lines is not None:
+            best = (font, lines)
+            lo = size + 1
+        else:
+            hi = size - 1
+
+    if best is not None:
+        return best
 
-    font = ImageFont.truetype(font_path, min_size)
+    font = load_font(font_path, min_size)
     lines = wrap_text(draw, text, font, max(1, box_w - 8))
     return font, lines
 
 
 # -------------------------
-# 6) 원본 이미지에 덮어쓰기
+# 6) 원문 지우기(마스크 1장) + 텍스트 레이어
 # -------------------------
-def replace_on_original(
-    original_image_path: Path,
-    json_path: Path,
-    out_path: Path,
-    font_path: str,
-):
-    img = Image.open(original_image_path).convert("RGB")
-    orig_w, orig_h = img.size
-    draw = ImageDraw.Draw(img)
-
-    data = load_json(json_path)
-    items = get_items(data)
-
-    # 좌표계 판별
-    space = guess_coord_space(items, orig_w, orig_h)
-    det_params = data.get("text_det_params", {})  # JSON에 있으면 활용
-    s = det_scale_from_params(orig_w, orig_h, det_params)
-
-    print("ORIG size:", (orig_w, orig_h))
-    print("coord space guess:", space)
-    print("det scale from params:", s)
-
-    cache: Dict[str, str] = {}
-    replaced = 0
-
-    for it in items:
-        ko = keep_korean_only(it["text"])
-        if not ko:
-            continue
-
-        en = cache.get(ko)
-        if en is None:
-            en = ko_to_en(ko)
-            cache[ko] = en
-        if not en:
-            continue
-
-        # bbox/poly를 원본 좌표로 변환
-        raw_box = it["bbox"]
-        raw_poly = it.get("poly")
-
-        if space == "orig" or s == 1.0:
-            x1, y1, x2, y2 = map(int, map(round, raw_box))
-            poly_pts = [(int(round(p[0])), int(round(p[1]))) for p in raw_poly] if raw_poly else None
-        else:
-            x1, y1, x2, y2 = map_box_scaled_to_orig(raw_box, s)
-            poly_pts = map_poly_scaled_to_orig(raw_poly, s) if raw_poly else None
+def sample_border_colors(arr: np.ndarray, boxes: np.ndarray, ring: int = 3) -> np.ndarray:
+    """
+    - 각 박스 바깥 ring px 테두리의 중앙값 색 (N, 3)
+    - 흰 바탕이 아닌 메뉴판에서도 지운 자리가 배경과 비슷하게 보이도록
+    """
+    h, w = arr.shape[:2]
+    colors = np.full((len(boxes), 3), 255, dtype=np.uint8)
+    for i, (x1, y1, x2, y2) in enumerate(boxes.tolist()):
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(w - 1, x2), min(h - 1, y2)
+        ox1, oy1 = max(0, x1 - ring), max(0, y1 - ring)
+        ox2, oy2 = min(w, x2 + ring + 1), min(h, y2 + ring + 1)
+        strips = [
+            arr[oy1:y1, ox1:ox2],          # 위
+            arr[y2 + 1:oy2, ox1:ox2],      # 아래
+            arr[y1:y2 + 1, ox1:x1],        # 왼쪽
+            arr[y1:y2 + 1, x2 + 1:ox2],    # 오른쪽
+        ]
+        px = np.concatenate([st.reshape(-1, 3) for st in strips])
+        if len(px):
+            colors[i] = np.median(px, axis=0).astype(np.uint8)
+    return colors
+
+def erase_regions(
+    img: Image.Image,
+    boxes: np.ndarray,
+    polys: np.ndarray,
+    has_poly: np.ndarray,
+    fill: str = "white",
+) -> Image.Image:
+    """
+    - 지울 영역 전체를 마스크 1장에 래스터화한 뒤 composite 한 번으로 지움
+    - fill="white": 흰색, fill="border": 영역마다 테두리 색으로 채움
+    - 원본은 그대로 두고 지운 베이스 이미지를 새로 반환(언어별 렌더링에서 재사용)
+    """
+    mask = Image.new("L", img.size, 0)
+    mdraw = ImageDraw.Draw(mask)
 
-        # 원문 지우기(poly가 있으면 정확하게 polygon으로)
-        if poly_pts and len(poly_pts) >= 4:
-            draw.polygon(poly_pts, fill=(255, 255, 255))
+    if fill == "border":
+        colors = sample_border_colors(np.asarray(img), boxes)
+        layer = Image.new("RGB", img.size, (255, 255, 255))
+        ldraw = ImageDraw.Draw(layer)
+    else:
+        colors, layer, ldraw = None, None, None
+
+    for i in range(len(boxes)):
+        # poly가 있으면 정확하게 polygon으로
+        if has_poly[i]:
+            shape = [tuple(pt) for pt in polys[i].tolist()]
+            mdraw.polygon(shape, fill=255)
+            if ldraw is not None:
+                ldraw.polygon(shape, fill=tuple(colors[i].tolist()))
         else:
-            draw.rectangle([x1, y1, x2, y2], fill=(255, 255, 255))
+            shape = boxes[i].tolist()
+            mdraw.rectangle(shape, fill=255)
+            if ldraw is not None:
+                ldraw.rectangle(shape, fill=tuple(colors[i].tolist()))
+
+    if layer is None:
+        layer = Image.new("RGB", img.size, (255, 255, 255))
+    return Image.composite(layer, img, mask)
+
+def draw_text_layer(
+    size: Tuple[int, int],
+    boxes: np.ndarray,
+    texts: List[Tuple[int, str]],
+    font_path: str,
+    pad: int = 4,
+    gap: int = 2,
+) -> Image.Image:
+    """texts: (박스 인덱스, 번역문) 목록 → 투명 RGBA 레이어에 박스 중앙 정렬로 그림"""
+    layer = Image.new("RGBA", size, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
 
+    for i, en in texts:
+        x1, y1, x2, y2 = boxes[i].tolist()
         box_w = max(1, x2 - x1)
         box_h = max(1, y2 - y1)
 
-        font, lines = fit_text(draw, en, box_w, box_h, font_path)
+        font, lines = fit_text(draw, en, box_w, box_h, font_path, pad=pad, gap=gap)
 
-        pad = 4
-        gap = 2
         line_h = text_bbox(draw, "Ag", font)[1]
         total_h = len(lines) * line_h + (len(lines) - 1) * gap
 
@@ -245,19 +418,162 @@ def replace_on_original(
         for ln in lines:
             ln_w, _ = text_bbox(draw, ln, font)
             cur_x = x1 + max(pad, (box_w - ln_w) // 2)
-            draw.text((cur_x, cur_y), ln, fill=(0, 0, 0), font=font)
+            draw.text((cur_x, cur_y), ln, fill=(0, 0, 0, 255), font=font)
             cur_y += line_h + gap
 
-        replaced += 1
+    return layer
+
+def compose(base: Image.Image, text_layer: Image.Image) -> Image.Image:
+    out = base.convert("RGBA")
+    out.alpha_composite(text_layer)
+    return out.convert("RGB")
+
+
+# -------------------------
+# 7) 원본 이미지에 덮어쓰기
+# -------------------------
+def as_rgb(image: Image.Image) -> Image.Image:
+    return image if image.mode == "RGB" else image.convert("RGB")
+
+def load_items_for_image(
+    data: dict, orig_w: int, orig_h: int, verbose: bool = False
+) -> Tuple[OcrItems, np.ndarray, np.ndarray]:
+    """OCR JSON → 원본 좌표 기준 OcrItems + 그리기용 정수 boxes/polys (verbose: 좌표계 판별 결과 출력, CLI용)"""
+    items = OcrItems.from_json(data)
+
+    # 좌표계 판별: OCR 단계가 기록한 값(coord_space/det_scale)이 있으면 그대로, 없으면(이전 JSON) 추정
+    if "coord_space" in data:
+        space = data["coord_space"]
+        s = float(data.get("det_scale", 1.0))
+    else:
+        space = items.coord_space(orig_w, orig_h)
+        det_params = data.get("text_det_params", {})  # JSON에 있으면 활용
+        s = det_scale_from_params(orig_w, orig_h, det_params)
+
+    if verbose:
+        print("ORIG size:", (orig_w, orig_h))
+        print("coord space:", space)
+        print("det scale:", s)
+
+    # bbox/poly를 원본 좌표로 한 번에 변환
+    if space != "orig" and s != 1.0:
+        items = items.scaled_to_orig(s)
+    boxes, polys = items.rounded()
+    return items, boxes, polys
+
+def replace_on_original(
+    original_image_path: Path,
+    json_path: Path,
+    out_path: Path,
+    font_path: str,
+    translator=None,
+    memory: Optional[TranslationMemory] = None,
+    glossary: Optional[Glossary] = None,
+    fill: str = "white",
+    image: Optional[Image.Image] = None,
+):
+    """image: 이미 디코딩된 원본(OCR 단계와 공유하는 DecodedImage.to_pil() 등)이 있으면 파일을 다시 열지 않음"""
+    img = as_rgb(image) if image is not None else Image.open(original_image_path).convert("RGB")
+    items, boxes, polys = load_items_for_image(load_json(json_path), *img.size, verbose=True)
+
+    # 줄마다 모델을 부르지 않고, 이미지 안의 고유 문장을 먼저 모아 배치 번역
+    kos = [keep_korean_only(t) for t in items.texts]
+    cache = translate_batch(kos, translator=translator, memory=memory, glossary=glossary)
+
+    texts = [(i, cache[ko]) for i, ko in enumerate(kos) if ko and cache.get(ko)]
+    idx = np.array([i for i, _ in texts], dtype=np.int64)
+
+    base = erase_regions(img, boxes[idx], polys[idx], items.has_poly[idx], fill=fill)
+    layer = draw_text_layer(img.size, boxes, texts, font_path)
+    out = compose(base, layer)
 
     out_path.parent.mkdir(exist_ok=True)
-    img.save(out_path)
+    out.save(out_path)
     print("Saved:", out_path)
-    print("Replaced:", replaced, "cache:", len(cache))
+    print("Replaced:", len(texts), "cache:", len(cache))
+    if memory is not None:
+        print("Translation memory:", memory.stats())
+
+def erase_korean(
+    img: Image.Image,
+    items: OcrItems,
+    boxes: np.ndarray,
+    polys: np.ndarray,
+    fill: str = "white",
+) -> Tuple[List[str], Image.Image]:
+    """한글이 있는 줄을 모두 지운 바탕(언어와 무관하므로 한 번만) + 줄별 정리된 한글"""
+    kos = [keep_korean_only(t) for t in items.texts]
+    idx = np.array([i for i, ko in enumerate(kos) if ko], dtype=np.int64)
+    base = erase_regions(img, boxes[idx], polys[idx], items.has_poly[idx], fill=fill)
+    return kos, base
+
+def render_translation(
+    base: Image.Image,
+    boxes: np.ndarray,
+    kos: List[str],
+    cache: Dict[str, str],
+    font_path: str,
+) -> Tuple[Image.Image, int]:
+    """지운 바탕 위에 번역문 레이어 합성 → (결과 이미지, 바꾼 줄 수)"""
+    texts = [(i, cache[ko]) for i, ko in enumerate(kos) if ko and cache.get(ko)]
+    layer = draw_text_layer(base.size, boxes, texts, font_path)
+    return compose(base, layer), len(texts)
+
+def translate_and_render(
+    img: Image.Image,
+    data: dict,
+    langs: List[str],
+    font_paths: Dict[str, str],
+    memory: Optional[TranslationMemory] = None,
+    glossary: Optional[Glossary] = None,
+    fill: str = "white",
+) -> Dict[str, Image.Image]:
+    """
+    - OCR 결과(dict, 파일 X)와 원본 이미지 → {언어: 결과 이미지}, 저장은 호출자 몫
+    - 원문 지우기는 한 번만, 언어마다 번역 + 글자 그리기만 반복
+    - 언어별 작업은 스레드로 동시에(모델 추론/Pillow 그리기 모두 대부분 GIL 밖)
+    """
+    items, boxes, polys = load_items_for_image(data, *img.size, verbose=True)
+    kos, base = erase_korean(img, items, boxes, polys, fill=fill)
+
+    def render_one(lang: str) -> Tuple[str, Image.Image]:
+        cache = translate_for_lang(kos, lang, memory=memory, glossary=glossary)
+        out, n = render_translation(base, boxes, kos, cache, font_paths[lang])
+        print(f"Rendered[{lang}]: replaced:", n)
+        return lang, out
+
+    with ThreadPoolExecutor(max_workers=max(1, len(langs))) as ex:
+        return dict(ex.map(render_one, langs))
+
+def render_languages(
+    original_image_path: Path,
+    json_path: Path,
+    out_dir: Path,
+    langs: List[str],
+    font_paths: Dict[str, str],
+    memory: Optional[TranslationMemory] = None,
+    glossary: Optional[Glossary] = None,
+    fill: str = "white",
+    image: Optional[Image.Image] = None,
+) -> Dict[str, Path]:
+    """
+    - translate_and_render() + 저장 → {언어: 출력 경로}, 파일명은 {stem}_translated_{lang}.jpg
+    - image: replace_on_original()과 같음(디코딩된 원본 재사용)
+    """
+    img = as_rgb(image) if image is not None else Image.open(original_image_path).convert("RGB")
+    rendered = translate_and_render(img, load_json(json_path), langs, font_paths, memory, glossary, fill)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths: Dict[str, Path] = {}
+    for lang, out in rendered.items():
+        paths[lang] = out_dir / f"{Path(original_image_path).stem}_translated_{lang}.jpg"
+        out.save(paths[lang])
+        print(f"Saved[{lang}]:", paths[lang])
+    return paths
 
 
 # -------------------------
-# 7) 실행(메타 기반 권장)
+# 8) 실행(메타 기반 권장)
 # -------------------------
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -265,7 +581,14 @@ if __name__ == "__main__":
     parser.add_argument("--img", type=str, default="", help="(옵션) 원본 이미지 경로 직접 지정")
     parser.add_argument("--json", type=str, default="", help="(옵션) OCR json 경로 직접 지정")
     parser.add_argument("--out", type=str, default="", help="(옵션) 출력 이미지 경로")
-    parser.add_argument("--font", type=str, default=r"C:\Windows\Fonts\arial.ttf", help="영문 폰트 경로")
+    parser.add_argument("--font", type=str, default=DEFAULT_FONTS["en"], help="영문 폰트 경로")
+    parser.add_argument("--font-ja", type=str, default=DEFAULT_FONTS["ja"], help="일본어 폰트 경로")
+    parser.add_argument("--font-zh", type=str, default=DEFAULT_FONTS["zh"], help="중국어 폰트 경로")
+    parser.add_argument("--langs", type=str, default="en", help="대상 언어(쉼표 구분, 예: en,ja,zh)")
+    parser.add_argument("--tm", type=str, default="", help="(옵션) 번역 메모리 SQLite 경로 (기본: cache/translation_memory.sqlite3)")
+    parser.add_argument("--no-tm", action="store_true", help="번역 메모리 사용 안 함")
+    parser.add_argument("--no-glossary", action="store_true", help="음식 용어 사전 없이 전부 번역 모델 사용")
+    parser.add_argument("--fill", type=str, default="white", choices=["white", "border"], help="지운 자리 채우기: 흰색 / 테두리 색")
     args = parser.parse_args()
 
     base = Path(__file__).resolve().parent
@@ -283,9 +606,32 @@ if __name__ == "__main__":
         json_path = Path(args.json).resolve()
         out_path = Path(args.out).resolve() if args.out else (base / "ocr_output" / f"{img_path.stem}_translated_replace_on_original.jpg").resolve()
 
-    replace_on_original(
-        original_image_path=img_path,
-        json_path=json_path,
-        out_path=out_path,
-        font_path=args.font,
-    )
+    memory = None
+    if not args.no_tm:
+        tm_path = Path(args.tm).resolve() if args.tm else (base / "cache" / "translation_memory.sqlite3")
+        memory = TranslationMemory(tm_path)
+
+    glossary = None if args.no_glossary else get_glossary()
+    langs = [x.strip() for x in args.langs.split(",") if x.strip()]
+
+    if langs == ["en"]:
+        replace_on_original(
+            original_image_path=img_path,
+            json_path=json_path,
+            out_path=out_path,
+            font_path=args.font,
+            memory=memory,
+            glossary=glossary,
+            fill=args.fill,
+        )
+    else:
+        render_languages(
+            original_image_path=img_path,
+            json_path=json_path,
+            out_dir=out_path.parent,
+            langs=langs,
+            font_paths={"en": args.font, "ja": args.font_ja, "zh": args.font_zh},
+            memory=memory,
+            glossary=glossary,
+            fill=args.fill,
+        )
@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from pathlib import Path
+import argparse
+import json
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from image_buffer import DecodedImage, load_image
+from menu_pipeline import (
+    MenuPage,
+    PipelineConfig,
+    build_config,
+    save_page,
+    stage_prepare,
+    stage_render,
+    stage_translate,
+)
+from PaddleOCR import collect_images, run_ocr_batch
+from replace_english import DEFAULT_FONTS
+
+
+# -------------------------
+# 단계 동시 실행 파이프라인
+# OCR(프로세스 풀) → 준비(스레드) → 번역(배치 워커 1개) → 렌더링(스레드 풀)
+# 단계 사이는 크기 제한 큐: 뒤 단계가 밀리면 앞 단계가 기다림(메모리 일정)
+# -------------------------
+_DONE = object()  # 단계 종료 표시
+_POLL_SEC = 0.1    # 큐 대기 중 중단 요청(stop) 확인 간격
+
+
+def _put(q: "queue.Queue", item, stop: threading.Event) -> bool:
+    """큐가 가득 차 있어도 stop이 켜지면 포기(False) → 소비자가 사라져도 스레드가 영원히 막히지 않음"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_POLL_SEC)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _get(q: "queue.Queue", stop: threading.Event):
+    """stop이 켜지면 _DONE 반환"""
+    while not stop.is_set():
+        try:
+            return q.get(timeout=_POLL_SEC)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def _run_stage(
+    fn: Callable[[MenuPage], None],
+    in_q: "queue.Queue",
+    out_q: "queue.Queue",
+    workers: int,
+    name: str,
+    stop: threading.Event,
+) -> List[threading.Thread]:
+    """
+    - in_q에서 page를 꺼내 fn(page) 후 out_q로 넘기는 스레드 workers개
+    - 앞 단계에서 실패한 page(page.error)는 그대로 통과
+    - 마지막으로 끝나는 스레드만 _DONE을 다음 단계로 전달
+    - stop이 켜지면 큐 대기 중이던 스레드도 바로 종료
+    """
+    remaining = [workers]
+    lock = threading.Lock()
+
+    def loop() -> None:
+        while True:
+            page = _get(in_q, stop)
+            if page is _DONE:
+                _put(in_q, _DONE, stop)  # 같은 단계의 다른 스레드도 끝나도록
+                with lock:
+                    remaining[0] -= 1
+                    if remaining[0] == 0:
+                        _put(out_q, _DONE, stop)
+                return
+            if page.error is None:
+                try:
+                    fn(page)
+                except Exception as e:  # 한 장 실패가 파이프라인 전체를 멈추지 않도록
+                    page.error = f"{name}: {type(e).__name__}: {e}"
+            if not _put(out_q, page, stop):
+                return
+
+    threads = [threading.Thread(target=loop, name=f"{name}-{i}", daemon=True) for i in range(workers)]
+    for t in threads:
+        t.start()
+    return threads
+
+
+def _translate_loop(
+    cfg: PipelineConfig,
+    in_q: "queue.Queue",
+    out_q: "queue.Queue",
+    batch_pages: int,
+    wait_sec: float,
+    stop: threading.Event,
+) -> None:
+    """
+    - 번역 모델은 1개 스레드가 전담(모델 인스턴스 공유, 스레드끼리 경합 X)
+    - 큐에 쌓인 이미지를 최대 batch_pages장까지 모아 한 번에 배치 번역
+    - 첫 장을 받은 뒤 wait_sec만 더 기다림(배치 채우려고 첫 장을 오래 붙잡지 않음)
+    """
+    done = False
+    while not done:
+        batch = [_get(in_q, stop)]
+        deadline = time.perf_counter() + wait_sec
+        while len(batch) < batch_pages and batch[-1] is not _DONE:
+            try:
+                batch.append(in_q.get(timeout=max(0.0, deadline - time.perf_counter())))
+            except queue.Empty:
+                break
+        if batch[-1] is _DONE:
+            batch.pop()
+            done = True
+
+        ok = [p for p in batch if p.error is None]
+        if ok and not stop.is_set():
+            try:
+                stage_translate(ok, cfg)
+            except Exception as e:
+                for p in ok:
+                    p.error = f"translate: {type(e).__name__}: {e}"
+        for p in batch:
+            if not _put(out_q, p, stop):
+                return
+    _put(out_q, _DONE, stop)
+
+
+def run_streaming(
+    image_paths: Iterable[Path],
+    cfg: PipelineConfig,
+    out_dir: Optional[Path] = None,
+    save_json: bool = False,
+    ocr_workers: int = 2,
+    prepare_workers: int = 2,
+    render_workers: int = 2,
+    translate_batch_pages: int = 8,
+    translate_wait_sec: float = 0.05,
+    queue_size: int = 8,
+    ocr_cache_dir: Optional[Path] = None,
+) -> Iterator[MenuPage]:
+    """
+    - 이미지 N+1 OCR, 이미지 N 번역, 이미지 N-1 렌더링이 동시에 진행
+    - 끝나는 순서대로 MenuPage를 yield (입력 순서와 다를 수 있음, 실패는 page.error)
+    - OCR 워커 프로세스는 파일을 직접 읽고 결과(OcrResult)만 돌려줌 → 렌더링용 원본은 메인 프로세스가 파일을 한 번 더 읽음
+      (바이트를 프로세스 간에 넘기지 않는 대신 디스크/페이지 캐시 읽기 2번, 디코딩은 준비 단계에서 1번)
+    - 소비자가 도중에 멈추면(generator close/예외) 모든 단계 스레드를 멈추고 OCR 프로세스 풀도 정리한 뒤 반환
+    - OCR 캐시는 워커 프로세스가 각자 열어야 하므로 cfg.ocr_cache 대신 ocr_cache_dir로 받음
+    - out_dir를 줄 때만 파일 저장(렌더링 스레드에서)
+    """
+    q_ocr: "queue.Queue" = queue.Queue(maxsize=queue_size)
+    q_prep: "queue.Queue" = queue.Queue(maxsize=queue_size)
+    q_tr: "queue.Queue" = queue.Queue(maxsize=queue_size)
+    q_out: "queue.Queue" = queue.Queue(maxsize=queue_size)
+
+    stop = threading.Event()
+    feeder_error: List[BaseException] = []
+
+    def ocr_feeder() -> None:
+        # run_ocr_batch가 동시 제출 수를 제한하고, q_ocr가 가득 차면 여기서 멈춤 → 새 OCR 제출도 멈춤
+        batch = run_ocr_batch(
+            image_paths,
+            workers=ocr_workers,
+            max_in_flight=ocr_workers * 2,
+            cache_dir=ocr_cache_dir,
+            **cfg.ocr_kwargs,
+        )
+        try:
+            for meta in batch:
+                path = meta["input_image"]
+                if "error" in meta:
+                    page = MenuPage(image=DecodedImage(path=path, data=b""), error=f"ocr: {meta['error']}")
+                else:
+                    page = MenuPage(image=load_image(path), ocr=meta["result"])
+                page.timings["ocr"] = meta["elapsed_sec"]
+                if not _put(q_ocr, page, stop):
+                    break
+        except BaseException as e:  # 워커 풀 자체가 죽은 경우: 소비자 쪽에서 다시 raise
+            feeder_error.append(e)
+        finally:
+            batch.close()  # 중단 시 남은 OCR 작업 취소 + 프로세스 풀 종료
+            _put(q_ocr, _DONE, stop)
+
+    def render(page: MenuPage) -> None:
+        stage_render(page, cfg)
+        if out_dir is not None:
+            save_page(page, out_dir, save_json=save_json)
+
+    threads = [threading.Thread(target=ocr_feeder, name="ocr-feeder", daemon=True)]
+    threads[0].start()
+    threads += _run_stage(lambda p: stage_prepare(p, cfg), q_ocr, q_prep, prepare_workers, "prepare", stop)
+    threads.append(threading.Thread(
+        target=_translate_loop,
+        args=(cfg, q_prep, q_tr, translate_batch_pages, translate_wait_sec, stop),
+        name="translate",
+        daemon=True,
+    ))
+    threads[-1].start()
+    threads += _run_stage(render, q_tr, q_out, render_workers, "render", stop)
+
+    try:
+        while True:
+            page = q_out.get()
+            if page is _DONE:
+                break
+            yield page
+    finally:
+        # 정상 종료면 이미 모두 끝나는 중, 중단이면 대기 중인 put/get이 stop을 보고 빠져나옴
+        stop.set()
+        for t in threads:
+            t.join()
+    if feeder_error:
+        raise feeder_error[0]
+
+
+# -------------------------
+# 실행
+# -------------------------
+if __name__ == "__main__":
+    BASE_DIR = Path(__file__).resolve().parent
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="*", help="이미지 파일 또는 디렉터리. 생략 시 Upload_Images")
+    parser.add_argument("--out", type=str, default=str(BASE_DIR / "ocr_output"), help="결과 이미지 저장 디렉터리")
+    parser.add_argument("--save-json", action="store_true", help="OCR JSON/메타도 저장")
+    parser.add_argument("--langs", type=str, default="en", help="대상 언어(쉼표 구분, 예: en,ja,zh)")
+    parser.add_argument("--font", type=str, default=DEFAULT_FONTS["en"], help="영문 폰트 경로")
+    parser.add_argument("--font-ja", type=str, default=DEFAULT_FONTS["ja"], help="일본어 폰트 경로")
+    parser.add_argument("--font-zh", type=str, default=DEFAULT_FONTS["zh"], help="중국어 폰트 경로")
+    parser.add_argument("--det-side", type=int, default=4000, help="det_limit_side_len")
+    parser.add_argument("--adaptive", action="store_true", help="글자 크기에 맞춰 검출 해상도 자동 선택")
+    parser.add_argument("--ocr-workers", type=int, default=2, help="OCR 워커 프로세스 수")
+    parser.add_argument("--prepare-workers", type=int, default=2, help="디코딩/원문 지우기 스레드 수")
+    parser.add_argument("--render-workers", type=int, default=2, help="렌더링 스레드 수")
+    parser.add_argument("--batch-pages", type=int, default=8, help="번역을 한 번에 모을 최대 이미지 수")
+    parser.add_argument("--queue-size", type=int, default=8, help="단계 사이 큐 크기")
+    parser.add_argument("--cache-dir", type=str, default=str(BASE_DIR / "cache"), help="OCR 캐시/번역 메모리 디렉터리")
+    parser.add_argument("--no-cache", action="store_true", help="OCR 캐시/번역 메모리 사용 안 함")
+    parser.add_argument("--no-glossary", action="store_true", help="음식 용어 사전 없이 전부 번역 모델 사용")
+    parser.add_argument("--fill", type=str, default="white", choices=["white", "border"], help="지운 자리 채우기")
+    args = parser.parse_args()
+
+    inputs = [Path(p).resolve() for p in args.inputs] or [(BASE_DIR / "Upload_Images").resolve()]
+    cache_dir = None if args.no_cache else Path(args.cache_dir).resolve()
+    image_paths = collect_images(inputs)
+
+    cfg = build_config(
+        langs=[x.strip() for x in args.langs.split(",") if x.strip()],
+        font_paths={"en": args.font, "ja": args.font_ja, "zh": args.font_zh},
+        tm_path=cache_dir / "translation_memory.sqlite3" if cache_dir else None,
+        use_glossary=not args.no_glossary,
+        fill=args.fill,
+        det_limit_side_len=args.det_side,
+        adaptive=args.adaptive,
+    )
+
+    t0 = time.perf_counter()
+    ok = failed = 0
+    for page in run_streaming(
+        image_paths,
+        cfg,
+        out_dir=Path(args.out).resolve(),
+        save_json=args.save_json,
+        ocr_workers=args.ocr_workers,
+        prepare_workers=args.prepare_workers,
+        render_workers=args.render_workers,
+        translate_batch_pages=args.batch_pages,
+        queue_size=args.queue_size,
+        ocr_cache_dir=cache_dir,
+    ):
+        if page.error:
+            failed += 1
+            print("[FAIL]", page.image.path, page.error)
+        else:
+            ok += 1
+            print("[OK]", page.image.path, json.dumps(page.timings))
+
+    elapsed = time.perf_counter() - t0
+    print(f"\n=== STREAM DONE === ok={ok} failed={failed} total={elapsed:.1f}s ({len(image_paths) / max(elapsed, 1e-9):.2f} img/s)")
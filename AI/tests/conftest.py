@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# AI 모듈은 AI/ 를 작업 디렉터리로 두고 평면 import(from glossary import ...)하므로 같은 경로를 추가
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,75 @@
+import pytest
+
+from allergen_matcher import AhoCorasick, build_matcher
+
+ROWS = [
+    ("우유", "ALG_MILK"),
+    ("밀/글루텐(밀가루, 보리)", "ALG_CEREALS_GLUTEN"),
+    ("비건", "DIET_VEGAN"),
+]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return build_matcher(ROWS)
+
+
+def codes(matcher, text):
+    return {code for code, _ in matcher.scan(text)}
+
+
+def test_aho_corasick_reports_overlapping_matches():
+    ac = AhoCorasick(["he", "she", "hers"])
+    hits = sorted((start, ac.patterns[pid]) for start, pid in ac.iter_matches("ushers"))
+    assert hits == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+@pytest.mark.parametrize(
+    "dish, code",
+    [
+        ("닭볶음탕", "DIET_VEGETARIAN"),
+        ("닭강정", "DIET_VEGETARIAN"),
+        ("닭꼬치", "DIET_VEGETARIAN"),
+        ("냉면", "ALG_CEREALS_GLUTEN"),
+        ("밀면", "ALG_CEREALS_GLUTEN"),
+        ("쫄면", "ALG_CEREALS_GLUTEN"),
+        ("소면", "ALG_CEREALS_GLUTEN"),
+        ("물냉면", "ALG_CEREALS_GLUTEN"),
+        ("회덮밥", "ALG_FISH"),
+        ("물회", "ALG_FISH"),
+        ("굴밥", "ALG_MOLLUSCS"),
+        ("콩밥", "ALG_SOY"),
+        ("콩자반", "ALG_SOY"),
+        ("깨죽", "ALG_SESAME"),
+        ("술빵", "DIET_HALAL"),
+        ("게맛살", "ALG_CRUSTACEANS"),
+    ],
+)
+def test_one_syllable_terms_inside_compound_dishes(matcher, dish, code):
+    assert code in codes(matcher, dish)
+
+
+def test_spacing_does_not_change_matches(matcher):
+    assert codes(matcher, "닭 볶음탕") == codes(matcher, "닭볶음탕")
+    assert "DIET_HALAL" in codes(matcher, "돼지 고기 볶음")
+
+
+def test_false_positive_words_suppress_only_one_syllable_terms(matcher):
+    # 땅콩 안의 콩은 대두가 아님, 땅콩 자체는 그대로 땅콩 알레르기
+    assert codes(matcher, "땅콩") == {"ALG_PEANUTS"}
+    assert "ALG_CRUSTACEANS" not in codes(matcher, "맵게 해주세요")
+    # 같은 줄의 다른 위치에 있는 한 글자 용어는 그대로 인정
+    assert "ALG_SOY" in codes(matcher, "땅콩 콩밥")
+
+
+def test_catalog_labels_are_split_into_terms(matcher):
+    assert "ALG_CEREALS_GLUTEN" in codes(matcher, "보리밥")
+    # 식이 항목 라벨(비건)은 재료가 아니므로 용어로 쓰지 않음
+    assert codes(matcher, "비건") == set()
+
+
+def test_recipe_ingredients_are_scanned_one_by_one():
+    m = build_matcher(recipe_lookup=lambda name: ("시금치나물", ["시금치", "참기름", "소금"]))
+    flags = m.analyze_line(0, "시금치나물")
+    assert flags.recipe == "시금치나물"
+    assert flags.restrictions == {"ALG_SESAME": ["참기름"]}
@@ -0,0 +1,66 @@
+import itertools
+
+import pytest
+
+import disk_cache
+from disk_cache import LRUDiskCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    # last_access가 같은 시각으로 겹치지 않도록 호출마다 1초씩 증가
+    ticks = itertools.count(1)
+    monkeypatch.setattr(disk_cache.time, "time", lambda: float(next(ticks)))
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    c = LRUDiskCache(tmp_path / "cache.sqlite3", max_bytes=1024, max_entries=3)
+    yield c
+    c.close()
+
+
+def test_get_set_and_hit_counters(cache):
+    assert cache.get("a") is None
+    cache.set("a", b"1")
+    assert cache.get("a") == b"1"
+    cache.set("a", b"22")
+    assert cache.get("a") == b"22"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (2, 1, 1, 2)
+
+
+def test_get_many_skips_missing_keys(cache):
+    cache.set_many({"a": b"1", "b": b"2"})
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"1", "b": b"2"}
+    assert cache.get_many([]) == {}
+
+
+def test_evicts_least_recently_used_entry(cache):
+    cache.set_many({"a": b"1", "b": b"2", "c": b"3"})
+    cache.get("a")  # a를 최근 사용으로 → 가장 오래된 것은 b
+    cache.set("d", b"4")
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "c", "d"]).keys() == {"a", "c", "d"}
+    assert cache.stats()["entries"] == 3
+
+
+def test_evicts_by_total_bytes(cache):
+    cache.set("old", b"x" * 600)
+    cache.set("new", b"y" * 600)
+    assert cache.get("old") is None
+    assert cache.get("new") == b"y" * 600
+    assert cache.stats()["bytes"] == 600
+
+
+def test_totals_survive_reopen(tmp_path, clock):
+    path = tmp_path / "cache.sqlite3"
+    c = LRUDiskCache(path)
+    c.set_many({"a": b"12", "b": b"345"})
+    c.close()
+    c = LRUDiskCache(path)
+    try:
+        assert c.get("b") == b"345"
+        assert (c.stats()["entries"], c.stats()["bytes"]) == (2, 5)
+    finally:
+        c.close()
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+import enrich_ingredients
+from enrich_ingredients import apply_translations, collect_vocabulary, enrich_recipes, load_checkpoint
+from replace_english import TranslationMemory
+
+RECIPES = [
+    {"ko": "김치찌개", "ingredients_ko": ["김치", "두부", "소금!"]},
+    {"ko": "두부조림", "ingredients_ko": ["두부", "간장", "100g"]},
+    {"ko": "물", "ingredients_ko": []},
+]
+
+
+class FakeTranslator:
+    def __init__(self):
+        self.seen = []
+
+    def __call__(self, texts, max_length=128, batch_size=16):
+        self.seen.extend(texts)
+        return [{"translation_text": f"en:{t}"} for t in texts]
+
+
+def test_vocabulary_uses_menu_translation_keys():
+    # keep_korean_only로 정리(한글 없는 재료는 제외), 많이 나오는 재료가 먼저
+    assert collect_vocabulary(RECIPES) == ["두부", "김치", "소금", "간장"]
+
+
+def test_load_checkpoint_truncates_torn_last_line(tmp_path):
+    path = tmp_path / "ckpt.jsonl"
+    good = json.dumps({"ko": "김치", "en": "Kimchi"}, ensure_ascii=False) + "\n"
+    path.write_text(good + '{"ko": "두', encoding="utf-8")
+    assert load_checkpoint(path) == {"김치": "Kimchi"}
+    assert path.read_text(encoding="utf-8") == good
+
+
+def test_apply_translations_fills_only_complete_recipes():
+    recipes = json.loads(json.dumps(RECIPES))
+    mapping = {"김치": "Kimchi", "두부": "Tofu", "간장": "Soy Sauce"}
+    assert apply_translations(recipes, mapping) == 1
+    assert "ingredients_en" not in recipes[0]  # 소금 번역 없음
+    assert recipes[1]["ingredients_en"] == ["Tofu", "Soy Sauce", "100g"]
+
+
+def test_enrich_resumes_and_shares_translation_memory(tmp_path, monkeypatch):
+    src = tmp_path / "recipes.json"
+    src.write_text(json.dumps(RECIPES[1:], ensure_ascii=False), encoding="utf-8")
+    ckpt = tmp_path / "ckpt.jsonl"
+    ckpt.write_text(json.dumps({"ko": "두부", "en": "Tofu"}, ensure_ascii=False) + "\n", encoding="utf-8")
+    memory = TranslationMemory(tmp_path / "tm.sqlite3", model_id="test-model")
+    tr = FakeTranslator()
+    monkeypatch.setattr(enrich_ingredients, "get_translator", lambda lang="en": tr)
+    try:
+        stats = enrich_recipes(src, checkpoint_path=ckpt, use_glossary=False, memory=memory)
+        # 체크포인트에 있던 두부는 다시 번역하지 않음, 모델 번역은 메뉴 번역과 같은 키로 메모리에 저장
+        assert tr.seen == ["간장"]
+        assert stats["translated"] == 1
+        assert memory.lookup(["간장", "두부"]) == {"간장": "en:간장"}
+        out = json.loads(src.read_text(encoding="utf-8"))
+        assert out[0]["ingredients_en"] == ["Tofu", "en:간장", "100g"]
+    finally:
+        memory.store.close()
@@ -0,0 +1,60 @@
+import pytest
+
+from glossary import Glossary, build_glossary, restriction_pairs
+
+CATALOG = [
+    ("우유(우유)", "ALG_MILK"),
+    ("땅콩(땅콩)", "ALG_PEANUTS"),
+    ("밀/글루텐(밀, 보리, 호밀)", "ALG_CEREALS_GLUTEN"),
+    ("비건", "DIET_VEGAN"),
+]
+
+
+@pytest.fixture
+def glossary():
+    g = Glossary()
+    g.update([
+        ("김치", "Kimchi"), ("찌개", "Stew"), ("김치찌개", "Kimchi Stew"), ("감자", "Potato"),
+        ("탕", "Soup"), ("명란", "Pollock Roe"), ("구이", "Grilled"), ("돼지", "Pork"),
+    ])
+    g.add_dishes(["감자탕"])
+    return g
+
+
+def test_exact_match_ignores_spacing(glossary):
+    assert glossary.lookup("김치 찌개") == "Kimchi Stew"
+    assert glossary.lookup("김치찌개!") == "Kimchi Stew"
+
+
+def test_compound_moves_cooking_method_to_front(glossary):
+    assert glossary.lookup("명란구이") == "Grilled Pollock Roe"
+
+
+def test_soup_and_stew_names_are_not_composed(glossary):
+    # 감자탕은 감자(Potato) 요리가 아님 → 조각 조합 대신 번역 모델로
+    assert glossary.lookup("감자탕") is None
+    assert glossary.lookup("돼지탕") is None
+    assert glossary.lookup("돼지찌개") is None
+
+
+def test_unknown_word_falls_back_to_model(glossary):
+    assert glossary.lookup("김치 볶음밥") is None
+    assert glossary.lookup_many(["김치", "볶음밥"]) == {"김치": "Kimchi"}
+
+
+def test_catalog_codes_are_not_turned_into_english():
+    pairs = dict(restriction_pairs(CATALOG))
+    assert pairs["밀"] == "Wheat"
+    assert pairs["땅콩"] == "Peanut"
+    assert "비건" not in pairs
+    assert "Cereals Gluten" not in pairs.values()
+
+
+def test_catalog_keeps_human_written_english_labels():
+    assert restriction_pairs([("메밀", "Buckwheat")]) == [("메밀", "Buckwheat")]
+
+
+def test_built_glossary_composes_catalog_terms():
+    g = build_glossary(CATALOG)
+    assert g.lookup("땅콩버터") == "Peanut Butter"
+    assert g.lookup("밀") == "Wheat"
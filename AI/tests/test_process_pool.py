@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from process_pool import bounded_imap, worker_config
+
+
+def _init(tag):
+    worker_config("test").update(tag=tag)
+
+
+def _tagged(x):
+    return worker_config("test")["tag"], x
+
+
+def test_sequential_runs_initializer_in_process():
+    assert list(bounded_imap(_tagged, [1, 2], workers=1, initializer=_init, initargs=("t",))) == [("t", 1), ("t", 2)]
+
+
+def test_pool_yields_every_result():
+    assert sorted(bounded_imap(abs, [-1, -2, 3, 0, -5], workers=2)) == [0, 1, 2, 3, 5]
+
+
+def test_close_cancels_queued_work():
+    # 0.5초 작업 20개 × 워커 2개: 끝까지 기다리면 5초, 닫으면 실행 중인 것만 끝나고 반환
+    results = bounded_imap(time.sleep, [0.5] * 20, workers=2, max_in_flight=20)
+    next(results)
+    t0 = time.perf_counter()
+    results.close()
+    assert time.perf_counter() - t0 < 3.0
+
+
+def test_task_error_propagates_and_shuts_down():
+    with pytest.raises(TypeError):
+        list(bounded_imap(abs, [1, "x", 3], workers=2))
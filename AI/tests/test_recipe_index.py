@@ -0,0 +1,59 @@
+import json
+
+import numpy as np
+import pytest
+
+from recipe_index import RecipeIndex, syllable_grams
+from recipe_kb import RecipeKB, compile_kb
+
+RECIPES = [
+    {"ko": "김치찌개", "ingredients_ko": ["김치", "돼지고기", "두부"]},
+    {"ko": "된장찌개", "ingredients_ko": ["된장", "두부", "애호박"]},
+    {"ko": "한우 불고기", "ingredients_ko": ["소고기", "간장", "배"]},
+    {"ko": "잡채", "ingredients_ko": ["당면", "시금치"]},
+]
+
+
+@pytest.fixture
+def kb(tmp_path):
+    src = tmp_path / "recipes.json"
+    src.write_text(json.dumps(RECIPES, ensure_ascii=False), encoding="utf-8")
+    return RecipeKB(compile_kb(src, tmp_path / "recipes.rkb"))
+
+
+def test_syllable_grams():
+    assert syllable_grams("잡채!") == ["잡채"]
+    assert syllable_grams("김 치찌개") == ["김치", "김치찌", "찌개", "치찌", "치찌개"]
+    assert syllable_grams("a") == []
+
+
+def test_lookup_tolerates_ocr_typos(kb):
+    index = RecipeIndex.build(kb)
+    assert index.lookup("김치찌게") == ("김치찌개", ["김치", "돼지고기", "두부"])
+    assert index.lookup("불고기") == ("한우 불고기", ["소고기", "간장", "배"])
+    assert index.lookup("파스타") is None
+    assert index.lookup("김") is None
+
+
+def test_query_ranks_closest_title_first(kb):
+    hits = RecipeIndex.build(kb).query("된장찌개", k=2)
+    assert [h.title for h in hits] == ["된장찌개", "김치찌개"]
+    assert hits[0].score > hits[1].score
+
+
+def test_saved_index_loads_memory_mapped(kb, tmp_path):
+    built = RecipeIndex.build(kb)
+    built.save(tmp_path / "index")
+    loaded = RecipeIndex.load(kb, tmp_path / "index")
+    assert isinstance(loaded.postings, np.memmap)
+    assert loaded.vocab == built.vocab
+    assert loaded.lookup("김치찌게") == built.lookup("김치찌게")
+
+
+def test_load_rejects_index_built_for_another_kb(kb, tmp_path):
+    RecipeIndex.build(kb).save(tmp_path / "index")
+    src = tmp_path / "other.json"
+    src.write_text(json.dumps(RECIPES[:2], ensure_ascii=False), encoding="utf-8")
+    other = RecipeKB(compile_kb(src, tmp_path / "other.rkb"))
+    with pytest.raises(ValueError):
+        RecipeIndex.load(other, tmp_path / "index")
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from recipe_kb import RecipeKB, atomic_write, compile_kb
+
+RECIPES = [
+    {"ko": "김치찌개", "ingredients_ko": ["김치", " 두부 ", "김치"], "ingredients_en": ["Kimchi", "Tofu", "Kimchi"]},
+    {"ko": "된장찌개", "ingredients_ko": ["된장", "두부"], "ingredients_en": []},
+    {"ko": "맹물", "ingredients_ko": []},
+]
+
+
+@pytest.fixture
+def kb(tmp_path):
+    src = tmp_path / "recipes.json"
+    src.write_text(json.dumps(RECIPES, ensure_ascii=False), encoding="utf-8")
+    return RecipeKB(compile_kb(src, tmp_path / "recipes.rkb"))
+
+
+def test_round_trip(kb):
+    assert len(kb) == 3
+    assert kb.recipe(0) == {"ko": "김치찌개", "ingredients_ko": ["김치", "두부"], "ingredients_en": ["Kimchi", "Tofu"]}
+    # 번역이 채워지지 않은 재료가 있으면 ingredients_en은 비움
+    assert kb.recipe(1) == {"ko": "된장찌개", "ingredients_ko": ["된장", "두부"], "ingredients_en": []}
+    assert kb.recipe(2) == {"ko": "맹물", "ingredients_ko": [], "ingredients_en": []}
+
+
+def test_ingredient_lookup_and_inverted_index(kb):
+    tofu = kb.ingredient_id("두부")
+    assert tofu is not None and kb.ingredient(tofu) == "두부"
+    assert sorted(kb.recipes_with(tofu).tolist()) == [0, 1]
+    assert kb.ingredient_id("없는재료") is None
+
+
+def test_atomic_write_leaves_no_temp_file_on_failure(tmp_path):
+    target = tmp_path / "out.bin"
+    target.write_bytes(b"old")
+    with pytest.raises(RuntimeError):
+        with atomic_write(target) as f:
+            f.write(b"partial")
+            raise RuntimeError("boom")
+    assert target.read_bytes() == b"old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["out.bin"]
+
+    with atomic_write(target) as f:
+        f.write(b"new")
+    assert target.read_bytes() == b"new"
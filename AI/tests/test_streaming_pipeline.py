@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+pytest.importorskip("paddleocr")
+
+import streaming_pipeline  # noqa: E402
+from image_buffer import DecodedImage  # noqa: E402
+from menu_pipeline import PipelineConfig  # noqa: E402
+
+
+@pytest.fixture
+def fake_stages(monkeypatch):
+    """OCR/모델 없이 단계 연결과 종료 처리만 확인"""
+    closed = threading.Event()
+
+    def fake_batch(paths, **kwargs):
+        try:
+            for p in paths:
+                yield {"input_image": str(p), "result": object(), "elapsed_sec": 0.0}
+        finally:
+            closed.set()
+
+    monkeypatch.setattr(streaming_pipeline, "run_ocr_batch", fake_batch)
+    monkeypatch.setattr(streaming_pipeline, "load_image", lambda p: DecodedImage(path=str(p), data=b""))
+    monkeypatch.setattr(streaming_pipeline, "stage_prepare", lambda page, cfg: None)
+    monkeypatch.setattr(streaming_pipeline, "stage_translate", lambda pages, cfg: None)
+    monkeypatch.setattr(streaming_pipeline, "stage_render", lambda page, cfg: None)
+    return closed
+
+
+def _stage_threads():
+    names = ("ocr-feeder", "prepare-", "translate", "render-")
+    return [t for t in threading.enumerate() if t.name.startswith(names)]
+
+
+def test_all_pages_come_out(fake_stages):
+    pages = list(streaming_pipeline.run_streaming([f"{i}.jpg" for i in range(20)], PipelineConfig(), queue_size=2))
+    assert sorted(p.image.path for p in pages) == sorted(f"{i}.jpg" for i in range(20))
+    assert all(p.error is None for p in pages)
+    assert not _stage_threads()
+
+
+def test_closing_consumer_stops_every_stage(fake_stages):
+    it = streaming_pipeline.run_streaming([f"{i}.jpg" for i in range(200)], PipelineConfig(), queue_size=1)
+    next(it)
+    it.close()
+    assert fake_stages.is_set()
+    assert not _stage_threads()
@@ -0,0 +1,55 @@
+import pytest
+
+from glossary import Glossary
+from replace_english import TranslationMemory, translate_batch
+
+
+class FakeTranslator:
+    """HF pipeline과 같은 호출 형식, 받은 입력을 기록"""
+
+    def __init__(self):
+        self.seen = []
+
+    def __call__(self, texts, max_length=128, batch_size=16):
+        self.seen.extend(texts)
+        return [{"translation_text": f" en:{t} "} for t in texts]
+
+
+@pytest.fixture
+def memory(tmp_path):
+    m = TranslationMemory(tmp_path / "tm.sqlite3", model_id="test-model")
+    yield m
+    m.store.close()
+
+
+@pytest.fixture
+def glossary():
+    g = Glossary()
+    g.add("김치", "Kimchi")
+    return g
+
+
+def test_glossary_then_memory_then_model(memory, glossary):
+    memory.save({"잡채": "Japchae"})
+    tr = FakeTranslator()
+    out = translate_batch(["김치", "잡채", "비빔밥", "비빔밥", ""], translator=tr, memory=memory, glossary=glossary)
+    assert out == {"김치": "Kimchi", "잡채": "Japchae", "비빔밥": "en:비빔밥"}
+    # 사전/메모리로 번역된 줄은 모델에 가지 않고, 중복은 한 번만
+    assert tr.seen == ["비빔밥"]
+
+
+def test_only_model_output_is_saved_to_memory(memory, glossary):
+    translate_batch(["김치", "비빔밥"], translator=FakeTranslator(), memory=memory, glossary=glossary)
+    assert memory.lookup(["김치", "비빔밥"]) == {"비빔밥": "en:비빔밥"}
+
+
+def test_memory_hit_skips_model_on_second_run(memory):
+    translate_batch(["비빔밥"], translator=FakeTranslator(), memory=memory)
+    second = FakeTranslator()
+    assert translate_batch(["비빔밥"], translator=second, memory=memory) == {"비빔밥": "en:비빔밥"}
+    assert second.seen == []
+
+
+def test_memory_keys_are_scoped_by_model(memory):
+    memory.save({"비빔밥": "Bibimbap"})
+    assert memory.with_model("other-model").lookup(["비빔밥"]) == {}
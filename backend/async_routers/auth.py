@@ -0,0 +1,58 @@
+# backend/async_routers/auth.py (routers/auth.py의 비동기 DB 버전)
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db
+from .. import models, schemas
+from ..auth import verify_password, create_access_token, get_current_member_async
+from ..routers.auth import LoginRequest, TokenResponse
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+async def _authenticate_member(db: AsyncSession, email: str, password: str) -> models.Member:
+    member = await db.scalar(select(models.Member).where(models.Member.email == email))
+
+    # 계정 유추 방지: email 없음/비번 틀림을 동일 메시지로 처리
+    # bcrypt 비교는 CPU 작업이라 이벤트 루프 밖에서
+    if not member or not await run_in_threadpool(verify_password, password, member.password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return member
+
+
+@router.post("/login", response_model=TokenResponse, summary="OAuth2 Password login (Swagger Authorize용)")
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)):
+    """
+    Swagger UI의 OAuth2 Password Flow(Authorize 버튼)가 호출하는 엔드포인트.
+    - Content-Type: application/x-www-form-urlencoded
+    - Field: username, password
+
+    여기서는 username 값을 'email'로 사용합니다.
+    """
+    member = await _authenticate_member(db, email=form_data.username, password=form_data.password)
+    token = create_access_token(subject=str(member.member_id))
+    return TokenResponse(access_token=token)
+
+
+@router.post("/login-json", response_model=TokenResponse, summary="JSON login (기존 클라이언트/프론트용)")
+async def login_json(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    기존에 JSON 바디로 로그인하던 클라이언트/프론트 호환용.
+    - Content-Type: application/json
+    - Body: { "email": "...", "password": "..." }
+    """
+    member = await _authenticate_member(db, email=payload.email, password=payload.password)
+    token = create_access_token(subject=str(member.member_id))
+    return TokenResponse(access_token=token)
+
+
+@router.get("/me", response_model=schemas.MemberRead)
+async def me(current=Depends(get_current_member_async)):
+    return current
@@ -0,0 +1,43 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db
+from .. import models, schemas
+
+router = APIRouter(prefix="/communities", tags=["communities"])
+
+@router.post("", response_model=schemas.CommunityRead)
+async def create_community(payload: schemas.CommunityCreate, db: AsyncSession = Depends(get_async_db)):
+    m = await db.get(models.Member, payload.member_id)
+    if not m:
+        raise HTTPException(status_code=400, detail="Invalid member_id")
+
+    c = models.Community(**payload.model_dump())
+    db.add(c)
+    await db.commit()
+    await db.refresh(c)
+    return c
+
+@router.get("", response_model=list[schemas.CommunityRead])
+async def list_communities(member_id: int | None = None, db: AsyncSession = Depends(get_async_db)):
+    q = select(models.Community)
+    if member_id is not None:
+        q = q.where(models.Community.member_id == member_id)
+    return (await db.scalars(q.order_by(models.Community.community_id.desc()))).all()
+
+@router.get("/{community_id}", response_model=schemas.CommunityRead)
+async def get_community(community_id: int, db: AsyncSession = Depends(get_async_db)):
+    c = await db.get(models.Community, community_id)
+    if not c:
+        raise HTTPException(status_code=404, detail="Community not found")
+    return c
+
+@router.delete("/{community_id}")
+async def delete_community(community_id: int, db: AsyncSession = Depends(get_async_db)):
+    c = await db.get(models.Community, community_id)
+    if not c:
+        raise HTTPException(status_code=404, detail="Community not found")
+    await db.delete(c)
+    await db.commit()
+    return {"deleted": True, "community_id": community_id}
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from ..database import get_async_db
+from .. import models, schemas
+from ..restriction_index import get_restriction_index
+
+router = APIRouter(prefix="/member-restrictions", tags=["member-restrictions"])
+
+@router.post("", response_model=schemas.MemberRestrictionRead)
+async def add_member_restriction(payload: schemas.MemberRestrictionCreate, db: AsyncSession = Depends(get_async_db)):
+    m = await db.get(models.Member, payload.member_id)
+    if not m:
+        raise HTTPException(status_code=400, detail="Invalid member_id")
+
+    it = await db.get(models.RestrictionItems, payload.item_id)
+    if not it:
+        raise HTTPException(status_code=400, detail="Invalid item_id")
+
+    mr = models.MemberRestrictions(**payload.model_dump())
+    db.add(mr)
+    try:
+        await db.commit()
+        await db.refresh(mr)
+        # 메뉴 충돌 확인용 회원 비트셋도 바로 반영(전체 다시 읽지 않음)
+        get_restriction_index().add(mr.member_id, mr.item_id)
+        return mr
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Already assigned (member_id, item_id)")
+
+@router.get("", response_model=list[schemas.MemberRestrictionRead])
+async def list_member_restrictions(member_id: int | None = None, db: AsyncSession = Depends(get_async_db)):
+    q = select(models.MemberRestrictions)
+    if member_id is not None:
+        q = q.where(models.MemberRestrictions.member_id == member_id)
+    return (await db.scalars(q.order_by(models.MemberRestrictions.member_restrictions_id.asc()))).all()
+
+@router.delete("/{member_restrictions_id}")
+async def delete_member_restriction(member_restrictions_id: int, db: AsyncSession = Depends(get_async_db)):
+    mr = await db.get(models.MemberRestrictions, member_restrictions_id)
+    if not mr:
+        raise HTTPException(status_code=404, detail="Member restriction not found")
+
+    member_id, item_id = mr.member_id, mr.item_id
+    await db.delete(mr)
+    await db.commit()
+    get_restriction_index().remove(member_id, item_id)
+    return {"deleted": True, "member_restrictions_id": member_restrictions_id}
@@ -0,0 +1,84 @@
+# backend/async_routers/members.py (routers/members.py의 비동기 DB 버전)
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from ..database import get_async_db
+from .. import models, schemas
+from ..auth import hash_password, get_current_member_async
+
+
+router = APIRouter(prefix="/members", tags=["members"])
+
+
+@router.post("", response_model=schemas.MemberRead)
+async def create_member(payload: schemas.MemberCreate, db: AsyncSession = Depends(get_async_db)):
+    data = payload.model_dump()
+
+    # 비밀번호 해시 저장 (bcrypt는 CPU 작업이라 이벤트 루프 밖에서)
+    if "password" in data and data["password"]:
+        data["password"] = await run_in_threadpool(hash_password, data["password"])
+
+    m = models.Member(**data)
+    db.add(m)
+
+    try:
+        await db.commit()
+        await db.refresh(m)
+        return m
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Email already exists")
+
+
+@router.get("/{member_id}", response_model=schemas.MemberRead)
+async def get_member(member_id: int, db: AsyncSession = Depends(get_async_db)):
+    m = await db.get(models.Member, member_id)
+    if not m:
+        raise HTTPException(status_code=404, detail="Member not found")
+    return m
+
+
+@router.get("", response_model=list[schemas.MemberRead])
+async def list_members(db: AsyncSession = Depends(get_async_db)):
+    return (await db.scalars(select(models.Member).order_by(models.Member.member_id.asc()))).all()
+
+
+@router.patch("/{member_id}", response_model=schemas.MemberRead)
+async def update_member(
+    member_id: int,
+    payload: schemas.MemberUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    current: models.Member = Depends(get_current_member_async),  # ✅ 인증(로그인) 필수
+):
+    # ✅ 본인만 수정 가능
+    if current.member_id != member_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only update your own account",
+        )
+
+    m = await db.get(models.Member, member_id)
+    if not m:
+        raise HTTPException(status_code=404, detail="Member not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    if not data:
+        return m
+
+    # 비밀번호 변경이면 해시 저장
+    if "password" in data and data["password"]:
+        data["password"] = await run_in_threadpool(hash_password, data["password"])
+
+    for k, v in data.items():
+        setattr(m, k, v)
+
+    try:
+        await db.commit()
+        await db.refresh(m)
+        return m
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Email already exists")
@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from ..database import get_async_db
+from .. import models, schemas
+
+router = APIRouter(prefix="/restriction-categories", tags=["restriction-categories"])
+
+@router.post("", response_model=schemas.RestrictionCategoryRead)
+async def create_category(payload: schemas.RestrictionCategoryCreate, db: AsyncSession = Depends(get_async_db)):
+    c = models.RestrictionCategory(**payload.model_dump())
+    db.add(c)
+    try:
+        await db.commit()
+        await db.refresh(c)
+        return c
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Category label_en already exists")
+
+@router.get("", response_model=list[schemas.RestrictionCategoryRead])
+async def list_categories(db: AsyncSession = Depends(get_async_db)):
+    q = select(models.RestrictionCategory).order_by(models.RestrictionCategory.category_id.asc())
+    return (await db.scalars(q)).all()
+
+@router.get("/{category_id}", response_model=schemas.RestrictionCategoryRead)
+async def get_category(category_id: int, db: AsyncSession = Depends(get_async_db)):
+    c = await db.get(models.RestrictionCategory, category_id)
+    if not c:
+        raise HTTPException(status_code=404, detail="Category not found")
+    return c
+
+@router.patch("/{category_id}", response_model=schemas.RestrictionCategoryRead)
+async def update_category(
+    category_id: int,
+    payload: schemas.RestrictionCategoryUpdate,
+    db: AsyncSession = Depends(get_async_db),
+):
+    c = await db.get(models.RestrictionCategory, category_id)
+    if not c:
+        raise HTTPException(status_code=404, detail="Category not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    if not data:
+        return c
+
+    for k, v in data.items():
+        setattr(c, k, v)
+
+    try:
+        await db.commit()
+        await db.refresh(c)
+        return c
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Category label_en already exists")
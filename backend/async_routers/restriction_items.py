@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError
+
+from ..database import get_async_db
+from .. import models, schemas
+from ..restriction_index import get_restriction_index
+
+router = APIRouter(prefix="/restriction-items", tags=["restriction-items"])
+
+@router.post("", response_model=schemas.RestrictionItemRead)
+async def create_item(payload: schemas.RestrictionItemCreate, db: AsyncSession = Depends(get_async_db)):
+    cat = await db.get(models.RestrictionCategory, payload.category_id)
+    if not cat:
+        raise HTTPException(status_code=400, detail="Invalid category_id")
+
+    item = models.RestrictionItems(**payload.model_dump())
+    db.add(item)
+    try:
+        await db.commit()
+        await db.refresh(item)
+        get_restriction_index().register_item(item.item_id, item.item_label_en)
+        return item
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Item label_en already exists")
+
+@router.get("", response_model=list[schemas.RestrictionItemRead])
+async def list_items(category_id: int | None = None, db: AsyncSession = Depends(get_async_db)):
+    q = select(models.RestrictionItems)
+    if category_id is not None:
+        q = q.where(models.RestrictionItems.category_id == category_id)
+    return (await db.scalars(q.order_by(models.RestrictionItems.item_id.asc()))).all()
+
+@router.get("/{item_id}", response_model=schemas.RestrictionItemRead)
+async def get_item(item_id: int, db: AsyncSession = Depends(get_async_db)):
+    item = await db.get(models.RestrictionItems, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
+
+@router.patch("/{item_id}", response_model=schemas.RestrictionItemRead)
+async def update_item(item_id: int, payload: schemas.RestrictionItemUpdate, db: AsyncSession = Depends(get_async_db)):
+    item = await db.get(models.RestrictionItems, item_id)
+    if not item:
+        raise HTTPException(status_code=404, detail="Item not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    if not data:
+        return item
+
+    # category_id 변경 시 존재 확인
+    if "category_id" in data and data["category_id"] is not None:
+        cat = await db.get(models.RestrictionCategory, data["category_id"])
+        if not cat:
+            raise HTTPException(status_code=400, detail="Invalid category_id")
+
+    for k, v in data.items():
+        setattr(item, k, v)
+
+    try:
+        await db.commit()
+        await db.refresh(item)
+        get_restriction_index().register_item(item.item_id, item.item_label_en)
+        return item
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Item code already exists")
@@ -0,0 +1,67 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_async_db
+from .. import models, schemas
+
+router = APIRouter(prefix="/reviews", tags=["reviews"])
+
+@router.post("", response_model=schemas.ReviewRead)
+async def create_review(payload: schemas.ReviewCreate, db: AsyncSession = Depends(get_async_db)):
+    m = await db.get(models.Member, payload.member_id)
+    if not m:
+        raise HTTPException(status_code=400, detail="Invalid member_id")
+
+    r = models.Review(**payload.model_dump())
+    db.add(r)
+    await db.commit()
+    await db.refresh(r)
+    return r
+
+@router.get("", response_model=list[schemas.ReviewRead])
+async def list_reviews(member_id: int | None = None, db: AsyncSession = Depends(get_async_db)):
+    q = select(models.Review)
+    if member_id is not None:
+        q = q.where(models.Review.member_id == member_id)
+    return (await db.scalars(q.order_by(models.Review.review_id.desc()))).all()
+
+@router.get("/{review_id}", response_model=schemas.ReviewRead)
+async def get_review(review_id: int, db: AsyncSession = Depends(get_async_db)):
+    r = await db.get(models.Review, review_id)
+    if not r:
+        raise HTTPException(status_code=404, detail="Review not found")
+    return r
+
+@router.delete("/{review_id}")
+async def delete_review(review_id: int, db: AsyncSession = Depends(get_async_db)):
+    r = await db.get(models.Review, review_id)
+    if not r:
+        raise HTTPException(status_code=404, detail="Review not found")
+    await db.delete(r)
+    await db.commit()
+    return {"deleted": True, "review_id": review_id}
+
+
+@router.patch("/{review_id}", response_model=schemas.ReviewRead)
+async def update_review(review_id: int, payload: schemas.ReviewUpdate, db: AsyncSession = Depends(get_async_db)):
+    r = await db.get(models.Review, review_id)
+    if not r:
+        raise HTTPException(status_code=404, detail="Review not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    if not data:
+        return r
+
+    # member_id 변경 시 존재 확인
+    if "member_id" in data and data["member_id"] is not None:
+        m = await db.get(models.Member, data["member_id"])
+        if not m:
+            raise HTTPException(status_code=400, detail="Invalid member_id")
+
+    for k, v in data.items():
+        setattr(r, k, v)
+
+    await db.commit()
+    await db.refresh(r)
+    return r
@@ -7,9 +7,10 @@ from jose import jwt, JWTError
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from .database import get_db
+from .database import get_async_db, get_db
 from . import models
 
 
@@ -63,17 +64,18 @@ def decode_token(token: str) -> dict[str, Any]:
     return jwt.decode(token, JWT_SECRET_KEY, algorithms=[JWT_ALGORITHM])
 
 
-def get_current_member(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db),
-) -> models.Member:
-    """Authorization: Bearer <token> 기반 현재 로그인 사용자 로드"""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid authentication credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _member_id_from_token(token: str) -> int:
+    """토큰 검증 후 sub(member_id) 반환, 실패 시 401 (동기/비동기 get_current_member 공용)"""
+    credentials_exception = _credentials_exception()
+
     try:
         payload = decode_token(token)
         sub = payload.get("sub")
@@ -84,15 +86,34 @@ def get_current_member(
 
     # sub에는 member_id를 문자열로 넣는 것을 권장했으므로 int 변환
     try:
-        member_id = int(sub)
+        return int(sub)
     except ValueError:
         raise credentials_exception
 
+
+def get_current_member(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> models.Member:
+    """Authorization: Bearer <token> 기반 현재 로그인 사용자 로드"""
+    member_id = _member_id_from_token(token)
     member = (
         db.query(models.Member)
         .filter(models.Member.member_id == member_id)
         .first()
     )
     if not member:
-        raise credentials_exception
+        raise _credentials_exception()
+    return member
+
+
+async def get_current_member_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db),
+) -> models.Member:
+    """get_current_member의 비동기 DB 버전 (DB_ASYNC=1 라우터용)"""
+    member_id = _member_id_from_token(token)
+    member = await db.get(models.Member, member_id)
+    if not member:
+        raise _credentials_exception()
     return member
@@ -17,14 +17,23 @@ DATABASE_URL = os.getenv(
     "DATABASE_URL",
     f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4",
 )
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,   # MySQL 연결 끊김 방지에 도움
-    connect_args={
+
+
+def _connect_args(url: str) -> dict:
+    # MySQL 드라이버(pymysql/aiomysql)에만 문자셋 옵션 전달(sqlite 등은 그대로)
+    if not url.startswith("mysql"):
+        return {}
+    return {
         "charset": "utf8mb4",
         "use_unicode": True,
         "init_command": "SET NAMES utf8mb4 COLLATE utf8mb4_0900_ai_ci",
-    },
+    }
+
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,   # MySQL 연결 끊김 방지에 도움
+    connect_args=_connect_args(DATABASE_URL),
 )
 
 SessionLocal = sessionmaker(
@@ -42,3 +51,50 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# -------------------------
+# 비동기 DB 경로 (DB_ASYNC=1)
+# - 라우터가 async def + AsyncSession → DB 응답을 기다리는 동안 스레드풀 슬롯을 잡지 않음
+# - 드라이버: MySQL은 aiomysql, 로컬/테스트는 aiosqlite (DATABASE_URL에서 자동 변환, ASYNC_DATABASE_URL로 직접 지정 가능)
+# -------------------------
+DB_ASYNC = os.getenv("DB_ASYNC", "0").lower() in ("1", "true", "yes")
+
+
+def to_async_url(url: str) -> str:
+    for sync_prefix, async_prefix in (
+        ("mysql+pymysql://", "mysql+aiomysql://"),
+        ("mysql://", "mysql+aiomysql://"),
+        ("sqlite+pysqlite://", "sqlite+aiosqlite://"),
+        ("sqlite://", "sqlite+aiosqlite://"),
+    ):
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", to_async_url(DATABASE_URL))
+
+async_engine = None
+AsyncSessionLocal = None
+if DB_ASYNC:
+    # 드라이버(aiomysql/aiosqlite)는 비동기 경로를 켰을 때만 필요
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        pool_pre_ping=True,
+        connect_args=_connect_args(ASYNC_DATABASE_URL),
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,  # commit 후 속성 접근 시 암묵적 I/O(lazy load) 방지
+    )
+
+
+async def get_async_db():
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Async DB is disabled (set DB_ASYNC=1)")
+    async with AsyncSessionLocal() as db:
+        yield db
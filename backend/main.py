@@ -1,18 +1,32 @@
 from fastapi import FastAPI
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
-from .database import engine
+from .database import DB_ASYNC, engine
 from . import models
-from .routers import auth
+from .routers import menus
 
-from .routers import (
-    members,
-    restriction_categories,
-    restriction_items,
-    member_restrictions,
-    reviews,
-    communities,
-)
+# DB_ASYNC=1이면 CRUD 라우터를 AsyncSession 버전으로 (경로/스키마는 동일)
+if DB_ASYNC:
+    from .async_routers import (
+        auth,
+        members,
+        restriction_categories,
+        restriction_items,
+        member_restrictions,
+        reviews,
+        communities,
+    )
+else:
+    from .routers import (
+        auth,
+        members,
+        restriction_categories,
+        restriction_items,
+        member_restrictions,
+        reviews,
+        communities,
+    )
+from .menu_jobs import get_menu_queue
 
 app = FastAPI(title="Backend API")
 
@@ -41,3 +55,17 @@ app.include_router(member_restrictions.router)
 app.include_router(reviews.router)
 app.include_router(communities.router)
 app.include_router(auth.router)
+app.include_router(menus.router)
+
+
+@app.on_event("shutdown")
+def stop_menu_workers():
+    get_menu_queue().stop()
+
+
+if DB_ASYNC:
+    from .database import async_engine
+
+    @app.on_event("shutdown")
+    async def dispose_async_engine():
+        await async_engine.dispose()
@@ -0,0 +1,310 @@
+import asyncio
+import os
+import queue
+import sys
+import threading
+import time
+import traceback
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .database import ROOT_DIR
+from .restriction_index import get_restriction_index
+
+# AI/ 스크립트(menu_pipeline 등)는 패키지가 아니라서 경로를 추가해 import
+AI_DIR = Path(os.getenv("AI_DIR", str(ROOT_DIR / "AI")))
+MENU_OUTPUT_DIR = Path(os.getenv("MENU_OUTPUT_DIR", str(AI_DIR / "ocr_output" / "menus")))
+MENU_CACHE_DIR = Path(os.getenv("MENU_CACHE_DIR", str(AI_DIR / "cache")))
+MENU_WORKERS = int(os.getenv("MENU_WORKERS", "1"))
+MENU_QUEUE_SIZE = int(os.getenv("MENU_QUEUE_SIZE", "32"))
+MENU_JOBS_KEEP = int(os.getenv("MENU_JOBS_KEEP", "1000"))  # 메모리에 남겨둘 완료 작업 수
+
+SUPPORTED_LANGS = ("en", "ja", "zh")
+
+
+def ensure_ai_path() -> None:
+    if str(AI_DIR) not in sys.path:
+        sys.path.insert(0, str(AI_DIR))
+
+
+@dataclass
+class MenuJob:
+    job_id: str
+    filename: str
+    langs: List[str]
+    status: str = "queued"  # queued → running → done | failed
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    lines: List[Dict[str, Any]] = field(default_factory=list)
+    images: Dict[str, str] = field(default_factory=dict)  # 언어 → 결과 이미지 경로
+    data: Optional[bytes] = None  # 업로드 원본(처리 시작 전까지만 보관)
+    # 진행 이벤트 기록 + 구독자(이벤트 루프, asyncio.Queue) - SSE로 줄 단위 결과 전달
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    _subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = field(default_factory=list)
+    _events_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        """워커 스레드에서 호출: 기록 후 각 구독자의 이벤트 루프에 안전하게 전달"""
+        item = {"event": event, "data": data}
+        with self._events_lock:
+            self.events.append(item)
+            subscribers = list(self._subscribers)
+        for loop, q in subscribers:
+            try:
+                loop.call_soon_threadsafe(q.put_nowait, item)
+            except RuntimeError:  # 구독자 루프가 이미 닫힘
+                pass
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> Tuple[List[Dict[str, Any]], asyncio.Queue]:
+        """지금까지의 이벤트 + 이후 이벤트를 받을 큐 (같은 lock 안에서 잡아 빠지는 이벤트 없음)"""
+        q: asyncio.Queue = asyncio.Queue()
+        with self._events_lock:
+            self._subscribers.append((loop, q))
+            return list(self.events), q
+
+    def unsubscribe(self, q: asyncio.Queue) -> None:
+        with self._events_lock:
+            self._subscribers = [(l, x) for l, x in self._subscribers if x is not q]
+
+
+class MenuJobQueue:
+    """
+    - 외부 브로커 없이 프로세스 안의 큐 + 워커 스레드로 OCR/번역 작업 처리
+    - 요청 핸들러는 작업을 큐에 넣기만 하고 바로 반환(OCR/모델 추론으로 이벤트 루프를 막지 않음)
+    - 모델/엔진은 워커가 첫 작업 때 한 번 로드해서 계속 재사용
+    """
+
+    def __init__(self, workers: int = MENU_WORKERS, max_queued: int = MENU_QUEUE_SIZE):
+        self.workers = max(1, workers)
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_queued)
+        self._jobs: "OrderedDict[str, MenuJob]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._cfg = None
+        self._matcher = None
+        self._cfg_lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            self._stopping.clear()
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f"menu-worker-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def stop(self) -> None:
+        """
+        - 대기 중인 작업은 실패 처리하고 버림(큐가 가득 차 있어도 put으로 막히지 않도록 먼저 비움)
+        - 실행 중인 작업은 끝날 때까지 최대 5초 기다림
+        """
+        self._stopping.set()
+        while True:
+            try:
+                job_id = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            job = self.get(job_id) if job_id else None
+            if job is not None and not job.finished:
+                self._fail(job, "server shutting down")
+        for _ in self._threads:
+            try:
+                self._queue.put_nowait(None)
+            except queue.Full:  # 워커는 _stopping도 확인하므로 깨우지 못해도 다음 get에서 종료
+                break
+        for t in self._threads:
+            t.join(timeout=5)
+        self._threads = []
+
+    def submit(self, data: bytes, filename: str, langs: List[str]) -> MenuJob:
+        """큐가 가득 차거나 종료 중이면 queue.Full (라우터에서 503으로 변환)"""
+        if self._stopping.is_set():
+            raise queue.Full
+        self.start()
+        job = MenuJob(job_id=uuid.uuid4().hex, filename=filename, langs=langs, data=data)
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._trim()
+        try:
+            self._queue.put_nowait(job.job_id)
+        except queue.Full:
+            with self._lock:
+                self._jobs.pop(job.job_id, None)
+            raise
+        return job
+
+    def get(self, job_id: str) -> Optional[MenuJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _trim(self) -> None:
+        # 오래된 완료 작업부터 정리(진행 중인 작업은 유지)
+        finished = [k for k, j in self._jobs.items() if j.finished]
+        for k in finished[: max(0, len(finished) - MENU_JOBS_KEEP)]:
+            del self._jobs[k]
+
+    def _config(self):
+        if self._cfg is None:
+            with self._cfg_lock:
+                if self._cfg is None:
+                    ensure_ai_path()
+                    from allergen_matcher import build_matcher
+                    from glossary import get_glossary
+                    from menu_pipeline import build_config
+                    from recipe_index import get_recipe_index
+
+                    rows = load_restriction_rows()
+                    # 음식 용어 사전에 DB 제한 항목 카탈로그도 포함(build_config가 이 사전을 씀)
+                    get_glossary(rows)
+                    # OCR 오인식에도 레시피를 찾도록 음절 n-gram 인덱스로 조회(AI/cache에 저장해 두고 재사용)
+                    self._matcher = build_matcher(rows, recipe_lookup=get_recipe_index().lookup)
+                    self._cfg = build_config(
+                        langs=list(SUPPORTED_LANGS),
+                        tm_path=MENU_CACHE_DIR / "translation_memory.sqlite3",
+                        ocr_cache_dir=MENU_CACHE_DIR,
+                        adaptive=True,
+                    )
+        return self._cfg
+
+    def _worker(self) -> None:
+        while True:
+            job_id = self._queue.get()
+            if job_id is None:
+                return
+            job = self.get(job_id)
+            if self._stopping.is_set():
+                if job is not None:
+                    self._fail(job, "server shutting down")
+                return
+            if job is None:
+                continue
+            job.status = "running"
+            job.started_at = time.time()
+            job.publish("status", {"status": "running"})
+            try:
+                self._run(job)
+                job.data = None
+                job.finished_at = time.time()
+                job.status = "done"
+                job.publish("done", {"lines": len(job.lines), "images": sorted(job.images)})
+            except Exception as e:
+                traceback.print_exc()
+                self._fail(job, f"{type(e).__name__}: {e}")
+
+    @staticmethod
+    def _fail(job: MenuJob, error: str) -> None:
+        job.data = None
+        job.finished_at = time.time()
+        job.error = error
+        job.status = "failed"
+        job.publish("failed", {"error": job.error})
+
+    def _run(self, job: MenuJob) -> None:
+        """
+        - process_image()와 같은 단계를 직접 호출해 단계 사이에 이벤트 발행
+        - 번역은 위쪽 줄부터 묶음 단위로: 묶음이 끝날 때마다 줄 결과(line)를 바로 전달, 이미지는 마지막
+        """
+        from image_buffer import load_image
+        from menu_pipeline import MenuPage, iter_translate_lines, save_page, stage_ocr, stage_prepare, stage_render
+
+        cfg = replace(self._config(), langs=job.langs)
+        page = MenuPage(image=load_image(job.data, name=job.filename))
+        stage_ocr(page, cfg)
+        stage_prepare(page, cfg)
+        job.publish("ocr", {"lines": len(page.kos)})
+
+        for idx in iter_translate_lines(page, cfg):
+            for i in idx:
+                line = page_line(page, i)
+                line["allergens"] = self._matcher.analyze_line(i, page.kos[i]).restrictions
+                job.lines.append(line)
+                job.publish("line", line)
+
+        stage_render(page, cfg)
+        save_page(page, MENU_OUTPUT_DIR / job.job_id)
+        # 다른 스레드(GET /menus/{id}, SSE)가 읽는 중일 수 있어 제자리 정렬 대신 새 리스트로 교체
+        with job._events_lock:
+            job.lines = sorted(job.lines, key=lambda x: x["index"])
+        for lang, path in page.outputs.items():
+            job.images[lang] = path
+            job.publish("image", {"lang": lang, "url": f"/menus/{job.job_id}/images/{lang}"})
+
+
+def page_line(page, i: int) -> Dict[str, Any]:
+    """MenuPage의 i번째 줄 결과(원문, 원본 좌표 bbox, 언어별 번역)"""
+    ko = page.kos[i]
+    return {
+        "index": i,
+        "text": page.items.texts[i],
+        "score": float(page.items.scores[i]),
+        "bbox": [int(v) for v in page.boxes[i]],
+        "translations": {lang: tr[ko] for lang, tr in page.translations.items() if ko and tr.get(ko)},
+    }
+
+
+def job_conflicts(job: MenuJob, member_ids: List[int], db) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    - 작업의 줄별 제한 코드(line["allergens"]) → 줄마다 item_id 비트셋, 회원 비트셋과 AND 한 번으로 메뉴 전체 × 회원 전체 확인
+    - 반환: 회원 id → 충돌 줄(해당 회원 제한 코드만 남긴 restrictions)
+    """
+    index = get_restriction_index()
+    index.ensure_loaded(db)
+
+    lines = list(job.lines)
+    out: Dict[int, List[Dict[str, Any]]] = {mid: [] for mid in member_ids}
+    if not lines or not member_ids:
+        return out
+    dishes = np.stack([index.mask_for_codes((x.get("allergens") or {}).keys()) for x in lines])
+    hit, overlap = index.conflicts(dishes, member_ids)
+
+    item_to_code = {i: c for c, i in index.code_to_item.items()}
+    for d, m in zip(*np.nonzero(hit)):
+        line = lines[d]
+        codes = {item_to_code[i] for i in index.item_ids(overlap[d, m]) if i in item_to_code}
+        out[member_ids[m]].append({
+            "index": line["index"],
+            "text": line["text"],
+            "restrictions": {c: t for c, t in line["allergens"].items() if c in codes},
+        })
+    return out
+
+
+def load_restriction_rows() -> List[Tuple[str, str]]:
+    """restriction_items 카탈로그 (item_label_ko, item_label_en), DB 연결 실패 시 재료 매핑만 사용"""
+    from . import models
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return [(r.item_label_ko, r.item_label_en) for r in db.query(models.RestrictionItems).all()]
+    except Exception as e:
+        print("[menu_jobs] restriction_items load failed:", e)
+        return []
+    finally:
+        db.close()
+
+
+_menu_queue: Optional[MenuJobQueue] = None
+_menu_queue_lock = threading.Lock()
+
+
+def get_menu_queue() -> MenuJobQueue:
+    global _menu_queue
+    if _menu_queue is None:
+        with _menu_queue_lock:
+            if _menu_queue is None:
+                _menu_queue = MenuJobQueue()
+    return _menu_queue
@@ -0,0 +1,155 @@
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from . import models
+
+_WORD = 64
+
+
+class RestrictionBitsetIndex:
+    """
+    - 회원마다 restriction_items.item_id 비트셋 1개(uint64 배열), 행 = 회원, 열 = 64비트 단위 word
+    - 메뉴 줄(요리)도 같은 비트셋으로 바꾸면 충돌 확인은 AND 한 번, 메뉴 전체 × 일행 전체도 한 번의 배열 연산
+    - 처음 쓸 때 DB에서 한 번 읽고, 이후에는 /member-restrictions POST/DELETE가 add()/remove()로 갱신
+    - 프로세스마다 따로 있는 메모리 인덱스: uvicorn 워커가 여러 개면 쓰기는 그 요청을 처리한 프로세스에만 반영됨
+      (다른 워커는 재시작 전까지 모름) → 충돌 확인을 쓰는 동안은 워커 1개로 실행
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.loaded = False
+        self.n_words = 1
+        self.bits = np.zeros((0, self.n_words), dtype=np.uint64)
+        self.member_row: Dict[int, int] = {}
+        self.code_to_item: Dict[str, int] = {}  # item_label_en(ALG_MILK ...) → item_id
+
+    # ---- 적재 / 증분 갱신 ----
+    def ensure_loaded(self, db: Session) -> None:
+        if self.loaded:
+            return
+        # 읽는 동안 lock 유지: 스냅샷 조회 뒤 commit된 POST/DELETE의 add()/remove()는 적재가 끝날 때까지 기다렸다가 반영
+        # (lock 밖에서 읽으면 그 사이 add()가 loaded=False라 버려져 영구 누락)
+        with self._lock:
+            if self.loaded:
+                return
+            items = db.query(models.RestrictionItems.item_id, models.RestrictionItems.item_label_en).all()
+            rows = db.query(models.MemberRestrictions.member_id, models.MemberRestrictions.item_id).all()
+            self.code_to_item = {code: item_id for item_id, code in items}
+            max_id = max([item_id for item_id, _ in items] + [item_id for _, item_id in rows] + [0])
+            self._resize(max_id)
+            for member_id, item_id in rows:
+                self._set(member_id, item_id, True)
+            self.loaded = True
+
+    def add(self, member_id: int, item_id: int) -> None:
+        with self._lock:
+            if self.loaded:
+                self._resize(item_id)
+                self._set(member_id, item_id, True)
+
+    def remove(self, member_id: int, item_id: int) -> None:
+        with self._lock:
+            if self.loaded and member_id in self.member_row:
+                self._set(member_id, item_id, False)
+
+    def register_item(self, item_id: int, code: str) -> None:
+        """restriction_items 항목 생성/코드 변경 시 코드 매핑/비트 폭 갱신"""
+        with self._lock:
+            if self.loaded:
+                self.code_to_item = {c: i for c, i in self.code_to_item.items() if i != item_id}
+                self.code_to_item[code] = item_id
+                self._resize(item_id)
+
+    def _resize(self, max_item_id: int) -> None:
+        n_words = max_item_id // _WORD + 1
+        if n_words > self.n_words:
+            grown = np.zeros((self.bits.shape[0], n_words), dtype=np.uint64)
+            grown[:, : self.n_words] = self.bits
+            self.bits, self.n_words = grown, n_words
+
+    def _set(self, member_id: int, item_id: int, on: bool) -> None:
+        row = self.member_row.get(member_id)
+        if row is None:
+            if not on:
+                return
+            row = len(self.member_row)
+            self.member_row[member_id] = row
+            if row >= self.bits.shape[0]:
+                # 행은 두 배씩 늘려 회원 추가마다 복사하지 않도록
+                grown = np.zeros((max(8, row * 2), self.n_words), dtype=np.uint64)
+                grown[: self.bits.shape[0]] = self.bits
+                self.bits = grown
+        w, b = divmod(item_id, _WORD)
+        bit = np.uint64(1) << np.uint64(b)
+        if on:
+            self.bits[row, w] |= bit
+        else:
+            self.bits[row, w] &= ~bit
+
+    # ---- 조회 ----
+    def mask_for_items(self, item_ids: Iterable[int]) -> np.ndarray:
+        mask = np.zeros(self.n_words, dtype=np.uint64)
+        for item_id in item_ids:
+            w, b = divmod(item_id, _WORD)
+            if w < self.n_words:
+                mask[w] |= np.uint64(1) << np.uint64(b)
+        return mask
+
+    def mask_for_codes(self, codes: Iterable[str]) -> np.ndarray:
+        return self.mask_for_items(self.code_to_item[c] for c in codes if c in self.code_to_item)
+
+    def member_masks(self, member_ids: List[int]) -> np.ndarray:
+        """(n_members, n_words), 제한 항목이 없는 회원은 0"""
+        with self._lock:
+            out = np.zeros((len(member_ids), self.n_words), dtype=np.uint64)
+            for k, mid in enumerate(member_ids):
+                row = self.member_row.get(mid)
+                if row is not None:
+                    out[k] = self.bits[row]
+        return out
+
+    def conflicts(self, dish_masks: np.ndarray, member_ids: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        - dish_masks: (n_dishes, n_words)
+        - 반환: (충돌 여부 (n_dishes, n_members) bool, 겹친 비트 (n_dishes, n_members, n_words))
+        """
+        members = self.member_masks(member_ids)
+        # 요리 비트셋을 만든 뒤 항목이 추가돼 폭이 달라졌을 수 있음 → 넓은 쪽에 맞춤
+        width = max(dish_masks.shape[1], members.shape[1])
+        dishes, members = _pad(dish_masks, width), _pad(members, width)
+        overlap = dishes[:, None, :] & members[None, :, :]
+        return overlap.any(axis=2), overlap
+
+    def item_ids(self, mask: np.ndarray) -> List[int]:
+        """비트셋 → item_id 목록"""
+        out = []
+        for w, word in enumerate(mask.tolist()):
+            while word:
+                low = word & -word
+                out.append(w * _WORD + low.bit_length() - 1)
+                word ^= low
+        return out
+
+
+def _pad(a: np.ndarray, width: int) -> np.ndarray:
+    if a.shape[1] >= width:
+        return a
+    out = np.zeros((a.shape[0], width), dtype=np.uint64)
+    out[:, : a.shape[1]] = a
+    return out
+
+
+_index: Optional[RestrictionBitsetIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_restriction_index() -> RestrictionBitsetIndex:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = RestrictionBitsetIndex()
+    return _index
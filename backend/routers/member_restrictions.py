@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 
 from ..database import get_db
 from .. import models, schemas
+from ..restriction_index import get_restriction_index
 
 router = APIRouter(prefix="/member-restrictions", tags=["member-restrictions"])
 
@@ -22,6 +23,8 @@ def add_member_restriction(payload: schemas.MemberRestrictionCreate, db: Session
     try:
         db.commit()
         db.refresh(mr)
+        # 메뉴 충돌 확인용 회원 비트셋도 바로 반영(전체 다시 읽지 않음)
+        get_restriction_index().add(mr.member_id, mr.item_id)
         return mr
     except IntegrityError:
         db.rollback()
@@ -42,6 +45,8 @@ def delete_member_restriction(member_restrictions_id: int, db: Session = Depends
     if not mr:
         raise HTTPException(status_code=404, detail="Member restriction not found")
 
+    member_id, item_id = mr.member_id, mr.item_id
     db.delete(mr)
     db.commit()
+    get_restriction_index().remove(member_id, item_id)
     return {"deleted": True, "member_restrictions_id": member_restrictions_id}
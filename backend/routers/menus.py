@@ -0,0 +1,137 @@
+import asyncio
+import json
+import queue
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Request, UploadFile
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from ..database import get_db
+from .. import schemas
+from ..menu_jobs import SUPPORTED_LANGS, MenuJob, MenuJobQueue, get_menu_queue, job_conflicts
+
+router = APIRouter(prefix="/menus", tags=["menus"])
+
+MAX_UPLOAD_BYTES = 20 * 1024 * 1024
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # 경계 문자열/langs 필드 등 파일 외 본문 여유
+SSE_HEARTBEAT_SEC = 15
+
+
+def job_to_read(job: MenuJob) -> schemas.MenuJobRead:
+    # 파일 경로 대신 다운로드 URL로 노출
+    images = {lang: f"/menus/{job.job_id}/images/{lang}" for lang in job.images if lang in SUPPORTED_LANGS}
+    return schemas.MenuJobRead(
+        job_id=job.job_id,
+        status=job.status,
+        filename=job.filename,
+        langs=job.langs,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        error=job.error,
+        lines=job.lines,
+        images=images,
+    )
+
+@router.post("", response_model=schemas.MenuJobRead, status_code=202)
+async def create_menu_job(
+    request: Request,
+    file: UploadFile = File(...),
+    langs: str = Form("en"),
+    jobs: MenuJobQueue = Depends(get_menu_queue),
+):
+    lang_list = [x.strip() for x in langs.split(",") if x.strip()]
+    if not lang_list or any(x not in SUPPORTED_LANGS for x in lang_list):
+        raise HTTPException(status_code=400, detail=f"langs must be a subset of {','.join(SUPPORTED_LANGS)}")
+    if file.content_type and not file.content_type.startswith("image/"):
+        raise HTTPException(status_code=400, detail="Image file required")
+
+    # 본문 전체(multipart)가 한도를 넘으면 파일을 읽지 않고 거절, 헤더가 없거나 틀려도 한도 + 1바이트까지만 읽음
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+    data = await file.read(MAX_UPLOAD_BYTES + 1)
+    if not data:
+        raise HTTPException(status_code=400, detail="Empty file")
+    if len(data) > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="File too large")
+
+    # OCR/번역은 워커 스레드에서: 여기서는 큐에 넣고 바로 반환
+    try:
+        job = jobs.submit(data, file.filename or "menu.jpg", lang_list)
+    except queue.Full:
+        raise HTTPException(status_code=503, detail="Menu job queue is full")
+    return job_to_read(job)
+
+@router.get("/{job_id}", response_model=schemas.MenuJobRead)
+def get_menu_job(job_id: str, jobs: MenuJobQueue = Depends(get_menu_queue)):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Menu job not found")
+    return job_to_read(job)
+
+@router.get("/{job_id}/images/{lang}")
+def get_menu_image(job_id: str, lang: str, jobs: MenuJobQueue = Depends(get_menu_queue)):
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Menu job not found")
+    path = job.images.get(lang)
+    if not path:
+        raise HTTPException(status_code=404, detail="Image not found")
+    return FileResponse(path, media_type="image/jpeg")
+
+@router.get("/{job_id}/conflicts", response_model=list[schemas.MemberMenuConflictsRead])
+def get_menu_conflicts(
+    job_id: str,
+    member_id: list[int] = Query(...),
+    jobs: MenuJobQueue = Depends(get_menu_queue),
+    db: Session = Depends(get_db),
+):
+    """회원별로 자신의 제한 항목(member_restrictions)에 걸리는 메뉴 줄 (진행 중이면 지금까지 나온 줄 기준)"""
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Menu job not found")
+
+    conflicts = job_conflicts(job, member_id, db)
+    return [{"member_id": mid, "conflicts": conflicts[mid]} for mid in member_id]
+
+def sse_format(item: dict) -> str:
+    data = json.dumps(item["data"], ensure_ascii=False)
+    return f"event: {item['event']}\ndata: {data}\n\n"
+
+@router.get("/{job_id}/events")
+async def stream_menu_job(job_id: str, request: Request, jobs: MenuJobQueue = Depends(get_menu_queue)):
+    """
+    - Server-Sent Events: status → ocr(줄 수) → line(줄마다, 번역되는 대로) → image(언어별) → done|failed
+    - 연결 전에 난 이벤트도 처음부터 다시 보내므로 늦게 구독해도 빠지는 결과 없음
+    """
+    job = jobs.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Menu job not found")
+
+    async def event_stream():
+        past, q = job.subscribe(asyncio.get_running_loop())
+        try:
+            for item in past:
+                yield sse_format(item)
+                if item["event"] in ("done", "failed"):
+                    return
+            while True:
+                try:
+                    item = await asyncio.wait_for(q.get(), timeout=SSE_HEARTBEAT_SEC)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keep-alive\n\n"
+                    continue
+                yield sse_format(item)
+                if item["event"] in ("done", "failed"):
+                    return
+        finally:
+            job.unsubscribe(q)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
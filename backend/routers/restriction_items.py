@@ -4,6 +4,7 @@ from sqlalchemy.exc import IntegrityError
 
 from ..database import get_db
 from .. import models, schemas
+from ..restriction_index import get_restriction_index
 
 router = APIRouter(prefix="/restriction-items", tags=["restriction-items"])
 
@@ -20,6 +21,7 @@ def create_item(payload: schemas.RestrictionItemCreate, db: Session = Depends(ge
     try:
         db.commit()
         db.refresh(item)
+        get_restriction_index().register_item(item.item_id, item.item_label_en)
         return item
     except IntegrityError:
         db.rollback()
@@ -63,6 +65,7 @@ def update_item(item_id: int, payload: schemas.RestrictionItemUpdate, db: Sessio
     try:
         db.commit()
         db.refresh(item)
+        get_restriction_index().register_item(item.item_id, item.item_label_en)
         return item
     except IntegrityError:
         db.rollback()
@@ -4,6 +4,7 @@ from .restriction_items import RestrictionItemCreate, RestrictionItemRead, Restr
 from .member_restrictions import MemberRestrictionCreate, MemberRestrictionRead
 from .reviews import ReviewCreate, ReviewRead, ReviewUpdate
 from .communities import CommunityCreate, CommunityRead
+from .menus import MenuJobRead, MenuLineRead, MenuConflictRead, MemberMenuConflictsRead
 
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "MemberRestrictionCreate", "MemberRestrictionRead",
     "ReviewCreate", "ReviewRead", "ReviewUpdate",
     "CommunityCreate", "CommunityRead",
+    "MenuJobRead", "MenuLineRead", "MenuConflictRead", "MemberMenuConflictsRead",
 ]
\ No newline at end of file
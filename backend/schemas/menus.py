@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+
+class MenuLineRead(BaseModel):
+    index: int
+    text: str
+    score: Optional[float] = None
+    bbox: List[int]
+    translations: Dict[str, str] = {}
+    allergens: Dict[str, List[str]] = {}  # 제한 코드(item_label_en) → 근거 재료
+
+class MenuJobRead(BaseModel):
+    job_id: str
+    status: str
+    filename: str
+    langs: List[str]
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    lines: List[MenuLineRead] = []
+    images: Dict[str, str] = {}  # 언어 → 결과 이미지 URL
+
+class MenuConflictRead(BaseModel):
+    index: int
+    text: str
+    restrictions: Dict[str, List[str]]
+
+class MemberMenuConflictsRead(BaseModel):
+    member_id: int
+    conflicts: List[MenuConflictRead] = []
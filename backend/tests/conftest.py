@@ -0,0 +1,7 @@
+import os
+import sys
+from pathlib import Path
+
+# backend 패키지를 저장소 루트 기준으로 import, DB는 테스트마다 메모리 SQLite(기본 MySQL URL로 연결하지 않도록)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend import models
+from backend.database import Base
+from backend.menu_jobs import MenuJob, job_conflicts
+from backend.restriction_index import RestrictionBitsetIndex
+
+CODES = ["ALG_MILK", "ALG_EGGS", "ALG_SOY", "DIET_HALAL"]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    cat = models.RestrictionCategory(category_label_ko="알레르기", category_label_en="ALLERGEN")
+    session.add(cat)
+    session.flush()
+    for code in CODES:
+        session.add(models.RestrictionItems(item_label_ko=code, item_label_en=code, category_id=cat.category_id))
+    for mid in (1, 2, 3):
+        session.add(models.Member(email=f"m{mid}@x", password="x", nickname=f"m{mid}"))
+    session.flush()
+    item = {c: i for i, c in session.query(models.RestrictionItems.item_id, models.RestrictionItems.item_label_en)}
+    session.add_all([
+        models.MemberRestrictions(member_id=1, item_id=item["ALG_MILK"]),
+        models.MemberRestrictions(member_id=2, item_id=item["ALG_SOY"]),
+        models.MemberRestrictions(member_id=2, item_id=item["DIET_HALAL"]),
+    ])
+    session.commit()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def index(db):
+    idx = RestrictionBitsetIndex()
+    idx.ensure_loaded(db)
+    return idx
+
+
+def test_conflicts_match_member_restrictions(index):
+    dishes = np.stack([
+        index.mask_for_codes(["ALG_MILK"]),
+        index.mask_for_codes(["ALG_SOY", "DIET_HALAL"]),
+        index.mask_for_codes([]),
+    ])
+    hit, overlap = index.conflicts(dishes, [1, 2, 3])
+    assert hit.tolist() == [[True, False, False], [False, True, False], [False, False, False]]
+    assert index.item_ids(overlap[1, 1]) == sorted(index.code_to_item[c] for c in ("ALG_SOY", "DIET_HALAL"))
+
+
+def test_add_and_remove_update_bitsets(index):
+    milk = index.code_to_item["ALG_MILK"]
+    index.add(3, milk)
+    index.remove(1, milk)
+    hit, _ = index.conflicts(index.mask_for_codes(["ALG_MILK"])[None, :], [1, 3])
+    assert hit.tolist() == [[False, True]]
+
+
+def test_items_beyond_first_word_widen_masks(index):
+    # 비트셋 폭(64비트 word)을 넘는 새 항목: 기존 요리 비트셋과 폭이 달라도 비교 가능
+    old_dish = index.mask_for_codes(["ALG_MILK"])[None, :]
+    index.register_item(130, "ALG_NEW")
+    index.add(1, 130)
+    assert index.n_words == 3
+    hit, _ = index.conflicts(old_dish, [1])
+    assert hit.tolist() == [[True]]
+    hit, _ = index.conflicts(index.mask_for_codes(["ALG_NEW"])[None, :], [1, 2])
+    assert hit.tolist() == [[True, False]]
+
+
+def test_writes_before_load_are_not_lost(db):
+    idx = RestrictionBitsetIndex()
+    idx.add(3, 1)  # 적재 전 쓰기는 무시되고, 적재 시 DB에서 읽음
+    idx.ensure_loaded(db)
+    assert not idx.member_masks([3]).any()
+
+
+def test_job_conflicts_keeps_only_member_codes(db, monkeypatch, index):
+    monkeypatch.setattr("backend.menu_jobs.get_restriction_index", lambda: index)
+    job = MenuJob(job_id="j", filename="menu.jpg", langs=["en"])
+    job.lines = [
+        {"index": 0, "text": "콩국수", "allergens": {"ALG_SOY": ["콩국수"], "ALG_CEREALS_GLUTEN": ["국수"]}},
+        {"index": 1, "text": "라떼", "allergens": {"ALG_MILK": ["우유"]}},
+    ]
+    out = job_conflicts(job, [1, 2, 3], db)
+    assert out == {
+        1: [{"index": 1, "text": "라떼", "restrictions": {"ALG_MILK": ["우유"]}}],
+        2: [{"index": 0, "text": "콩국수", "restrictions": {"ALG_SOY": ["콩국수"]}}],
+        3: [],
+    }